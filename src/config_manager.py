@@ -1,5 +1,6 @@
 import json
 import os
+import tempfile
 from typing import List
 try:
     from dotenv import load_dotenv
@@ -98,12 +99,34 @@ class ConfigManager:
         return os.path.join(ConfigManager.get_data_dir(), name)
 
     @staticmethod
-    def save_json(path: str, data):
+    def get_playlist_pages_path() -> str:
+        return os.path.join(ConfigManager.get_data_dir(), "playlist_pages.jsonl")
+
+    @staticmethod
+    def get_download_journal_path() -> str:
+        return os.path.join(ConfigManager.get_data_dir(), "downloads.sqlite3")
+
+    @staticmethod
+    def save_json(path: str, data) -> bool:
+        # Write a uniquely named sibling temp file and rename it, so a crash
+        # mid-write never leaves a truncated file and concurrent writers never
+        # share a temp file. Returns False when the write failed.
+        tmp = None
         try:
-            with open(path, "w", encoding="utf-8") as f:
+            directory = os.path.dirname(os.path.abspath(path))
+            fd, tmp = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception:
-            pass
+            os.replace(tmp, path)
+            return True
+        except Exception as e:
+            print(f"[ConfigManager] Failed to save {path}: {e}")
+            if tmp:
+                try:
+                    os.remove(tmp)
+                except Exception:
+                    pass
+            return False
 
     @staticmethod
     def load_json(path: str):
@@ -171,3 +194,110 @@ class ConfigManager:
             return max(1, v)
         except Exception:
             return 10
+
+    @staticmethod
+    def get_ui_virtual_tables() -> bool:
+        try:
+            env_val = os.getenv("VIRTUAL_TABLES")
+            if env_val:
+                return env_val.strip().lower() in ("1", "true", "yes", "on")
+        except Exception:
+            pass
+        try:
+            cfg = ConfigManager.load_config() or {}
+            ui = cfg.get("ui", {}) or {}
+            return bool(ui.get("virtual_tables", True))
+        except Exception:
+            return True
+
+    @staticmethod
+    def get_library_mode() -> bool:
+        try:
+            env_val = os.getenv("LIBRARY_MODE")
+            if env_val:
+                return env_val.strip().lower() in ("1", "true", "yes", "on")
+        except Exception:
+            pass
+        try:
+            cfg = ConfigManager.load_config() or {}
+            ui = cfg.get("ui", {}) or {}
+            return bool(ui.get("library_mode", False))
+        except Exception:
+            return False
+
+    @staticmethod
+    def get_api_cache_max_bytes() -> int:
+        try:
+            env_val = os.getenv("API_CACHE_MAX_MB")
+            if env_val is not None and env_val.strip() != "":
+                return max(0, int(float(env_val) * 1024 * 1024))
+        except Exception:
+            pass
+        try:
+            cfg = ConfigManager.load_config() or {}
+            ui = cfg.get("ui", {}) or {}
+            return max(0, int(float(ui.get("api_cache_max_mb", 64)) * 1024 * 1024))
+        except Exception:
+            return 64 * 1024 * 1024
+
+    @staticmethod
+    def get_playlist_cache_max_bytes() -> int:
+        try:
+            env_val = os.getenv("PLAYLIST_CACHE_MAX_MB")
+            if env_val is not None and env_val.strip() != "":
+                return max(0, int(float(env_val) * 1024 * 1024))
+        except Exception:
+            pass
+        try:
+            cfg = ConfigManager.load_config() or {}
+            ui = cfg.get("ui", {}) or {}
+            return max(0, int(float(ui.get("playlist_cache_max_mb", 32)) * 1024 * 1024))
+        except Exception:
+            return 32 * 1024 * 1024
+
+    @staticmethod
+    def get_download_workers() -> int:
+        try:
+            env_val = os.getenv("DOWNLOAD_WORKERS")
+            if env_val:
+                return max(1, min(16, int(env_val)))
+        except Exception:
+            pass
+        try:
+            cfg = ConfigManager.load_config() or {}
+            ui = cfg.get("ui", {}) or {}
+            return max(1, min(16, int(ui.get("download_workers", 3))))
+        except Exception:
+            return 3
+
+    @staticmethod
+    def get_download_fragments() -> int:
+        try:
+            env_val = os.getenv("DOWNLOAD_FRAGMENTS")
+            if env_val:
+                return max(1, min(32, int(env_val)))
+        except Exception:
+            pass
+        try:
+            cfg = ConfigManager.load_config() or {}
+            ui = cfg.get("ui", {}) or {}
+            return max(1, min(32, int(ui.get("download_fragments", 4))))
+        except Exception:
+            return 4
+
+    @staticmethod
+    def get_daily_quota_limit() -> int:
+        try:
+            env_val = os.getenv("YOUTUBE_DAILY_QUOTA")
+            if env_val:
+                v = int(env_val)
+                if v > 0:
+                    return v
+        except Exception:
+            pass
+        try:
+            cfg = ConfigManager.load_config() or {}
+            ui = cfg.get("ui", {}) or {}
+            return max(1, int(ui.get("daily_quota", 10000)))
+        except Exception:
+            return 10000
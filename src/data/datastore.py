@@ -22,5 +22,8 @@ class DataStore:
     def link_video_to_playlist(self, playlist_id: str, video_id: str, position: Optional[int] = None) -> None:
         raise NotImplementedError
 
-    def get_playlist_videos(self, playlist_id: str, limit: int, offset: int) -> List[Dict]:
+    def get_playlist_videos(self, playlist_id: str, limit: int, offset: int = 0, after_position: Optional[int] = None) -> List[Dict]:
+        raise NotImplementedError
+
+    def get_playlist_videos_page(self, playlist_id: str, limit: int = 50, page_token: Optional[str] = None) -> Dict:
         raise NotImplementedError
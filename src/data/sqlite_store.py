@@ -1,63 +1,247 @@
+import base64
+import json
 import os
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from typing import List, Dict, Optional
 
 DB_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'app.sqlite3')
 
+# Each thread gets its own connection (WAL, synchronous=NORMAL, busy
+# timeout), released when the thread ends, so worker threads can read while
+# another thread writes. Writes
+# go through _transaction(): one BEGIN IMMEDIATE ... COMMIT per call, with
+# bulk rows sent through executemany, serialized per database file.
+BUSY_TIMEOUT_MS = 5000
+
+_write_locks: Dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def _write_lock_for(path: str) -> threading.Lock:
+    with _write_locks_guard:
+        return _write_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
 class SqliteStore:
-    def __init__(self):
-        os.makedirs(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data'), exist_ok=True)
-        self.conn = sqlite3.connect(DB_FILE, check_same_thread=False)
-        self.conn.execute('PRAGMA foreign_keys=ON')
+    def __init__(self, db_file: Optional[str] = None):
+        self.db_file = db_file or DB_FILE
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_file)), exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = _write_lock_for(self.db_file)
         self._init_schema()
         try:
             self._maybe_import_json_last_results()
         except Exception:
             pass
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=BUSY_TIMEOUT_MS / 1000.0, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+            conn.execute('PRAGMA foreign_keys=ON')
+            # INSERT OR REPLACE must fire the delete triggers that keep the
+            # search index in step with the tables.
+            conn.execute('PRAGMA recursive_triggers=ON')
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self.conn
+        with self._write_lock:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn.cursor()
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+    def close(self) -> None:
+        """Close the calling thread's connection; other threads' close with them."""
+        conn = getattr(self._local, 'conn', None)
+        self._local.conn = None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
     def _init_schema(self):
-        cur = self.conn.cursor()
+        with self._transaction() as cur:
+            self._create_tables(cur)
+        try:
+            with self._transaction() as cur:
+                self._create_search_index(cur)
+            self.has_search_index = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5; search_local falls back to LIKE.
+            self.has_search_index = False
+
+    # Full-text index over titles and channel names. Each table has an
+    # external-content FTS5 table kept current by triggers, so rows are
+    # indexed by the same upserts that store them.
+    _SEARCH_TABLES = (
+        ('videos_fts', 'videos'),
+        ('playlists_fts', 'playlists'),
+    )
+
+    def _create_search_index(self, cur):
+        for fts, table in self._SEARCH_TABLES:
+            exists = cur.execute("SELECT 1 FROM sqlite_master WHERE name=?", (fts,)).fetchone()
+            cur.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(title, channel_title, content='{table}', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2', prefix='2 3')")
+            cur.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {table} BEGIN "
+                        f"INSERT INTO {fts}(rowid, title, channel_title) VALUES (new.rowid, new.title, new.channel_title); END")
+            cur.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {table} BEGIN "
+                        f"INSERT INTO {fts}({fts}, rowid, title, channel_title) VALUES ('delete', old.rowid, old.title, old.channel_title); END")
+            cur.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE OF title, channel_title ON {table} BEGIN "
+                        f"INSERT INTO {fts}({fts}, rowid, title, channel_title) VALUES ('delete', old.rowid, old.title, old.channel_title); "
+                        f"INSERT INTO {fts}(rowid, title, channel_title) VALUES (new.rowid, new.title, new.channel_title); END")
+            if not exists:
+                # Index rows stored before the index existed.
+                cur.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+    def _create_tables(self, cur):
         cur.execute('CREATE TABLE IF NOT EXISTS playlists (playlist_id TEXT PRIMARY KEY, title TEXT, channel_title TEXT, video_count INTEGER, created_at DATETIME DEFAULT CURRENT_TIMESTAMP)')
         cur.execute('CREATE TABLE IF NOT EXISTS videos (video_id TEXT PRIMARY KEY, title TEXT, channel_title TEXT, duration TEXT, published TEXT, views INTEGER)')
-        cur.execute('CREATE TABLE IF NOT EXISTS playlist_videos (playlist_id TEXT, video_id TEXT, position INTEGER, PRIMARY KEY (playlist_id, video_id))')
+        cur.execute('CREATE TABLE IF NOT EXISTS playlist_videos (playlist_id TEXT, video_id TEXT, position INTEGER, fetched_at REAL, PRIMARY KEY (playlist_id, video_id))')
+        # fetched_at (epoch seconds) lets cached memberships expire; rows
+        # written before it existed keep NULL and count as expired.
+        if 'fetched_at' not in [r[1] for r in cur.execute('PRAGMA table_info(playlist_videos)').fetchall()]:
+            cur.execute('ALTER TABLE playlist_videos ADD COLUMN fetched_at REAL')
         cur.execute('CREATE TABLE IF NOT EXISTS last_results (id INTEGER PRIMARY KEY AUTOINCREMENT, mode TEXT, query TEXT, saved_at DATETIME DEFAULT CURRENT_TIMESTAMP, next_page_token TEXT, prev_page_token TEXT)')
         cur.execute('CREATE TABLE IF NOT EXISTS last_result_videos (last_id INTEGER, video_id TEXT)')
         cur.execute('CREATE TABLE IF NOT EXISTS last_result_playlists (last_id INTEGER, playlist_id TEXT)')
         cur.execute('CREATE INDEX IF NOT EXISTS idx_last_videos_last_id ON last_result_videos(last_id)')
         cur.execute('CREATE INDEX IF NOT EXISTS idx_last_playlists_last_id ON last_result_playlists(last_id)')
-        cur.execute('CREATE INDEX IF NOT EXISTS idx_playlist_videos_playlist ON playlist_videos(playlist_id)')
         cur.execute('CREATE INDEX IF NOT EXISTS idx_playlist_videos_video ON playlist_videos(video_id)')
-        self.conn.commit()
+        # Covers playlist paging: rows come out in (position, video_id) order
+        # without touching the table or sorting. It also serves lookups by
+        # playlist_id alone, so the older single-column index is dropped.
+        cur.execute('CREATE INDEX IF NOT EXISTS idx_playlist_videos_order ON playlist_videos(playlist_id, position, video_id)')
+        cur.execute('DROP INDEX IF EXISTS idx_playlist_videos_playlist')
+
+    _UPSERT_PLAYLIST = 'INSERT OR REPLACE INTO playlists (playlist_id, title, channel_title, video_count) VALUES (?,?,?,?)'
+    _UPSERT_VIDEO = 'INSERT OR REPLACE INTO videos (video_id, title, channel_title, duration, published, views) VALUES (?,?,?,?,?,?)'
+
+    def _playlist_row(self, pl: Dict):
+        return (pl.get('playlistId'), pl.get('title'), pl.get('channelTitle'), self._to_int(pl.get('video_count')))
+
+    def _video_row(self, v: Dict):
+        return (v.get('videoId'), v.get('title'), v.get('channelTitle'), v.get('duration'), v.get('published'), self._to_int(v.get('views')))
 
     def upsert_playlist(self, pl: Dict):
-        self.conn.execute('INSERT OR REPLACE INTO playlists (playlist_id, title, channel_title, video_count) VALUES (?,?,?,?)', (
-            pl.get('playlistId'), pl.get('title'), pl.get('channelTitle'), self._to_int(pl.get('video_count'))
-        ))
+        self.upsert_playlists([pl])
+
+    def upsert_playlists(self, playlists: List[Dict]) -> None:
+        with self._transaction() as cur:
+            cur.executemany(self._UPSERT_PLAYLIST, [self._playlist_row(p) for p in playlists or []])
 
     def upsert_video(self, v: Dict):
-        views = self._to_int(v.get('views'))
-        self.conn.execute('INSERT OR REPLACE INTO videos (video_id, title, channel_title, duration, published, views) VALUES (?,?,?,?,?,?)', (
-            v.get('videoId'), v.get('title'), v.get('channelTitle'), v.get('duration'), v.get('published'), views
-        ))
+        self.upsert_videos([v])
+
+    def upsert_videos(self, videos: List[Dict]) -> None:
+        with self._transaction() as cur:
+            cur.executemany(self._UPSERT_VIDEO, [self._video_row(v) for v in videos or []])
 
     def link_video_to_playlist(self, playlist_id: str, video_id: str, position: Optional[int] = None):
-        self.conn.execute('INSERT OR REPLACE INTO playlist_videos (playlist_id, video_id, position) VALUES (?,?,?)', (
-            playlist_id, video_id, position
-        ))
+        with self._transaction() as cur:
+            cur.execute('INSERT OR REPLACE INTO playlist_videos (playlist_id, video_id, position, fetched_at) VALUES (?,?,?,?)', (
+                playlist_id, video_id, position, time.time()
+            ))
 
-    def save_last_videos_result(self, query: str, videos: List[Dict], playlists: List[Dict], next_token: Optional[str], prev_token: Optional[str], video_ids: List[str]) -> None:
+    # Library upserts merge into existing rows: a field missing from one API
+    # shape (search results carry no counts or durations) keeps its stored
+    # value instead of being nulled.
+    def merge_videos(self, videos: List[Dict]) -> None:
+        rows = [self._video_row(v) for v in videos or [] if v.get('videoId')]
+        with self._transaction() as cur:
+            cur.executemany(
+                'INSERT INTO videos (video_id, title, channel_title, duration, published, views) VALUES (?,?,?,?,?,?) '
+                'ON CONFLICT(video_id) DO UPDATE SET title=COALESCE(excluded.title, title), channel_title=COALESCE(excluded.channel_title, channel_title), '
+                "duration=CASE WHEN excluded.duration IS NULL OR excluded.duration='N/A' THEN duration ELSE excluded.duration END, "
+                "published=COALESCE(NULLIF(excluded.published, ''), published), views=COALESCE(excluded.views, views)",
+                rows)
+
+    def merge_playlists(self, playlists: List[Dict]) -> None:
+        rows = [self._playlist_row(p) for p in playlists or [] if p.get('playlistId')]
+        with self._transaction() as cur:
+            cur.executemany(
+                'INSERT INTO playlists (playlist_id, title, channel_title, video_count) VALUES (?,?,?,?) '
+                'ON CONFLICT(playlist_id) DO UPDATE SET title=COALESCE(excluded.title, title), channel_title=COALESCE(excluded.channel_title, channel_title), '
+                'video_count=COALESCE(excluded.video_count, video_count)',
+                rows)
+
+    def set_playlist_video_counts(self, counts: Dict[str, int]) -> None:
+        rows = [(self._to_int(c), pid) for pid, c in (counts or {}).items() if self._to_int(c) is not None]
+        with self._transaction() as cur:
+            cur.executemany('INSERT OR IGNORE INTO playlists (video_count, playlist_id) VALUES (?,?)', rows)
+            cur.executemany('UPDATE playlists SET video_count=? WHERE playlist_id=?', rows)
+
+    def link_videos_to_playlist(self, playlist_id: str, links: List) -> None:
+        """Record (video_id, position) links of one playlist in one transaction."""
+        with self._transaction() as cur:
+            now = time.time()
+            cur.executemany('INSERT OR REPLACE INTO playlist_videos (playlist_id, video_id, position, fetched_at) VALUES (?,?,?,?)',
+                            [(playlist_id, vid, pos, now) for vid, pos in links if vid])
+
+    def clear_playlist_videos(self, playlist_id: str) -> None:
+        with self._transaction() as cur:
+            cur.execute('DELETE FROM playlist_videos WHERE playlist_id=?', (playlist_id,))
+
+    def get_playlist(self, playlist_id: str) -> Optional[Dict]:
+        row = self.conn.execute('SELECT playlist_id, title, channel_title, video_count FROM playlists WHERE playlist_id=?', (playlist_id,)).fetchone()
+        if not row:
+            return None
+        return {'playlistId': row[0], 'title': row[1], 'channelTitle': row[2], 'video_count': row[3]}
+
+    def count_playlist_videos(self, playlist_id: str) -> int:
+        """Positioned members of a playlist whose video rows are stored."""
+        row = self.conn.execute('SELECT COUNT(*) FROM playlist_videos pv JOIN videos v ON v.video_id=pv.video_id WHERE pv.playlist_id=? AND pv.position IS NOT NULL', (playlist_id,)).fetchone()
+        return int(row[0] or 0)
+
+    def get_video_playlist_ids(self, video_id: str) -> List[str]:
+        return [r[0] for r in self.conn.execute('SELECT playlist_id FROM playlist_videos WHERE video_id=?', (video_id,)).fetchall()]
+
+    def has_playlist_video(self, playlist_id: str, video_id: str) -> bool:
         cur = self.conn.cursor()
-        cur.execute('INSERT INTO last_results (mode, query, next_page_token, prev_page_token) VALUES (?,?,?,?)', (
-            'videos', query, next_token, prev_token
-        ))
-        last_id = cur.lastrowid
-        for v in videos:
-            self.upsert_video(v)
-            cur.execute('INSERT INTO last_result_videos (last_id, video_id) VALUES (?,?)', (last_id, v.get('videoId')))
-        for p in playlists:
-            self.upsert_playlist(p)
-            cur.execute('INSERT INTO last_result_playlists (last_id, playlist_id) VALUES (?,?)', (last_id, p.get('playlistId')))
-        self.conn.commit()
+        cur.execute('SELECT 1 FROM playlist_videos WHERE playlist_id=? AND video_id=? LIMIT 1', (playlist_id, video_id))
+        return cur.fetchone() is not None
+
+    def playlist_video_fetched_at(self, playlist_id: str, video_id: str) -> Optional[float]:
+        """When the link was last seen (0.0 if unknown), or None without a link."""
+        row = self.conn.execute('SELECT fetched_at FROM playlist_videos WHERE playlist_id=? AND video_id=?', (playlist_id, video_id)).fetchone()
+        if row is None:
+            return None
+        return float(row[0] or 0.0)
+
+    def add_playlist_memberships(self, pairs: List) -> None:
+        """Record (playlist_id, video_id) links without touching known positions."""
+        now = time.time()
+        with self._transaction() as cur:
+            cur.executemany('INSERT INTO playlist_videos (playlist_id, video_id, fetched_at) VALUES (?,?,?) '
+                            'ON CONFLICT(playlist_id, video_id) DO UPDATE SET fetched_at=excluded.fetched_at',
+                            [(pid, vid, now) for pid, vid in pairs])
+
+    def save_last_videos_result(self, query: str, videos: List[Dict], playlists: List[Dict], next_token: Optional[str], prev_token: Optional[str], video_ids: List[str]) -> None:
+        videos = list(videos or [])
+        playlists = list(playlists or [])
+        with self._transaction() as cur:
+            cur.execute('INSERT INTO last_results (mode, query, next_page_token, prev_page_token) VALUES (?,?,?,?)', (
+                'videos', query, next_token, prev_token
+            ))
+            last_id = cur.lastrowid
+            cur.executemany(self._UPSERT_VIDEO, [self._video_row(v) for v in videos])
+            cur.executemany('INSERT INTO last_result_videos (last_id, video_id) VALUES (?,?)', [(last_id, v.get('videoId')) for v in videos])
+            cur.executemany(self._UPSERT_PLAYLIST, [self._playlist_row(p) for p in playlists])
+            cur.executemany('INSERT INTO last_result_playlists (last_id, playlist_id) VALUES (?,?)', [(last_id, p.get('playlistId')) for p in playlists])
 
     def load_last_videos_result(self) -> Dict:
         cur = self.conn.cursor()
@@ -79,13 +263,12 @@ class SqliteStore:
         return {'videos': videos, 'playlists': playlists, 'nextPageToken': row[2], 'prevPageToken': row[3], 'query': row[1], 'videoIds': video_ids}
 
     def save_last_playlists_result(self, query: str, playlists: List[Dict]) -> None:
-        cur = self.conn.cursor()
-        cur.execute('INSERT INTO last_results (mode, query) VALUES (?,?)', ('playlists', query))
-        last_id = cur.lastrowid
-        for p in playlists:
-            self.upsert_playlist(p)
-            cur.execute('INSERT INTO last_result_playlists (last_id, playlist_id) VALUES (?,?)', (last_id, p.get('playlistId')))
-        self.conn.commit()
+        playlists = list(playlists or [])
+        with self._transaction() as cur:
+            cur.execute('INSERT INTO last_results (mode, query) VALUES (?,?)', ('playlists', query))
+            last_id = cur.lastrowid
+            cur.executemany(self._UPSERT_PLAYLIST, [self._playlist_row(p) for p in playlists])
+            cur.executemany('INSERT INTO last_result_playlists (last_id, playlist_id) VALUES (?,?)', [(last_id, p.get('playlistId')) for p in playlists])
 
     def load_last_playlists_result(self) -> Dict:
         cur = self.conn.cursor()
@@ -103,14 +286,152 @@ class SqliteStore:
             playlists.append({'playlistId': pr[0], 'title': pr[1], 'channelTitle': pr[2], 'video_count': pr[3]})
         return {'playlists': playlists, 'query': query}
 
-    def get_playlist_videos(self, playlist_id: str, limit: int, offset: int) -> List[Dict]:
+    _PLAYLIST_VIDEOS_SELECT = 'SELECT v.video_id, v.title, v.channel_title, v.duration, v.published, v.views, pv.position FROM playlist_videos pv JOIN videos v ON v.video_id=pv.video_id WHERE pv.playlist_id=?'
+    _ORDER_ASC = ' ORDER BY pv.position, pv.video_id'
+    _ORDER_DESC = ' ORDER BY pv.position DESC, pv.video_id DESC'
+
+    def get_playlist_videos(self, playlist_id: str, limit: int, offset: int = 0, after_position: Optional[int] = None) -> List[Dict]:
+        """Videos of a cached playlist in position order.
+
+        With after_position the page starts right after that position
+        (keyset), which costs the same on every page; offset is kept for
+        callers that still count rows.
+        """
+        limit = int(limit or 10)
+        if after_position is not None:
+            rows = self._playlist_video_rows(playlist_id, limit, [('pv.position > ?', (int(after_position),))], self._ORDER_ASC)
+        else:
+            cur = self.conn.cursor()
+            cur.execute(self._PLAYLIST_VIDEOS_SELECT + self._ORDER_ASC + ' LIMIT ? OFFSET ?', (playlist_id, limit, int(offset or 0)))
+            rows = cur.fetchall()
+        return [self._playlist_video(r) for r in rows]
+
+    def get_playlist_videos_page(self, playlist_id: str, limit: int = 50, page_token: Optional[str] = None) -> Dict:
+        """One page of a cached playlist, shaped like Playlist.get_videos.
+
+        nextPageToken/prevPageToken are opaque cursors over (position,
+        videoId); pass either back as page_token to move one page.
+        """
+        limit = max(1, int(limit or 50))
+        forward, key = self._decode_cursor(page_token)
+        order = self._ORDER_ASC if forward else self._ORDER_DESC
+        rows = self._playlist_video_rows(playlist_id, limit + 1, self._keyset_segments(key, forward), order)
+        more = len(rows) > limit
+        rows = rows[:limit]
+        if not forward:
+            rows.reverse()
+        first = (rows[0][6], rows[0][0]) if rows else None
+        last = (rows[-1][6], rows[-1][0]) if rows else None
+        if forward:
+            next_token = self._encode_cursor(True, last) if more else None
+            prev_token = self._encode_cursor(False, first) if key is not None and rows else None
+        else:
+            prev_token = self._encode_cursor(False, first) if more else None
+            next_token = self._encode_cursor(True, last) if rows else None
+        return {'videos': [self._playlist_video(r) for r in rows], 'nextPageToken': next_token, 'prevPageToken': prev_token}
+
+    def _playlist_video_rows(self, playlist_id, limit, segments, order):
+        # SQLite sorts NULL positions first; rows after/before a cursor can
+        # span the NULL and non-NULL ranges, so each range is its own
+        # index-ordered query and they are read in turn.
+        cur = self.conn.cursor()
+        rows = []
+        for where, params in segments:
+            if len(rows) >= limit:
+                break
+            cur.execute(self._PLAYLIST_VIDEOS_SELECT + ' AND ' + where + order + ' LIMIT ?', (playlist_id,) + tuple(params) + (limit - len(rows),))
+            rows.extend(cur.fetchall())
+        return rows
+
+    @staticmethod
+    def _keyset_segments(key, forward):
+        if key is None:
+            return [('1', ())]
+        position, video_id = key
+        if forward:
+            if position is None:
+                return [('pv.position IS NULL AND pv.video_id > ?', (video_id,)), ('pv.position IS NOT NULL', ())]
+            return [('(pv.position, pv.video_id) > (?, ?)', (position, video_id))]
+        if position is None:
+            return [('pv.position IS NULL AND pv.video_id < ?', (video_id,))]
+        return [('pv.position IS NOT NULL AND (pv.position, pv.video_id) < (?, ?)', (position, video_id)), ('pv.position IS NULL', ())]
+
+    @staticmethod
+    def _encode_cursor(forward: bool, key) -> str:
+        raw = json.dumps(['n' if forward else 'p', key[0], key[1]], separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def _decode_cursor(token: Optional[str]):
+        """(forward, (position, video_id)); unknown tokens start from the top."""
+        if not token:
+            return True, None
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode('utf-8')
+            direction, position, video_id = json.loads(raw)
+            if direction not in ('n', 'p') or not isinstance(video_id, str):
+                raise ValueError(token)
+            if position is not None:
+                position = int(position)
+            return direction == 'n', (position, video_id)
+        except Exception:
+            return True, None
+
+    @staticmethod
+    def _playlist_video(r) -> Dict:
+        return {'videoId': r[0], 'title': r[1], 'channelTitle': r[2], 'duration': r[3], 'published': r[4], 'views': r[5]}
+
+    @staticmethod
+    def build_search_query(text: str) -> str:
+        """FTS5 query for user text: "quoted phrases" stay phrases, other
+        words match as prefixes, and every term must match."""
+        terms = []
+        parts = (text or '').split('"')
+        for i, part in enumerate(parts):
+            if i % 2:
+                words = part.split()
+                if words:
+                    terms.append('"' + ' '.join(w.replace('"', '') for w in words) + '"')
+            else:
+                for word in part.split():
+                    word = word.replace('"', '')
+                    if word:
+                        terms.append('"' + word + '"*')
+        return ' '.join(terms)
+
+    def search_local(self, text: str, limit: int = 50, kinds=('video', 'playlist')) -> List[Dict]:
+        """Rank stored videos and playlists against text; no API calls.
+
+        Results carry 'kind' ('video' or 'playlist') plus the fields the
+        tables render, best matches first (bm25, titles weighted over
+        channel names).
+        """
+        limit = max(1, int(limit or 50))
+        query = self.build_search_query(text)
+        if not query:
+            return []
+        results = []
+        if 'video' in kinds:
+            for r in self._search_rows('videos_fts', 'videos', 'video_id, title, channel_title, duration, published, views', query, limit, text):
+                video = self._playlist_video(r[1:])
+                video['kind'] = 'video'
+                results.append((r[0], video))
+        if 'playlist' in kinds:
+            for r in self._search_rows('playlists_fts', 'playlists', 'playlist_id, title, channel_title, video_count', query, limit, text):
+                results.append((r[0], {'kind': 'playlist', 'playlistId': r[1], 'title': r[2], 'channelTitle': r[3], 'video_count': r[4]}))
+        results.sort(key=lambda pair: pair[0])
+        return [item for _, item in results[:limit]]
+
+    def _search_rows(self, fts, table, columns, query, limit, text):
         cur = self.conn.cursor()
-        cur.execute('SELECT v.video_id, v.title, v.channel_title, v.duration, v.published, v.views, pv.position FROM playlist_videos pv JOIN videos v ON v.video_id=pv.video_id WHERE pv.playlist_id=? ORDER BY COALESCE(pv.position, 0) LIMIT ? OFFSET ?', (playlist_id, int(limit or 10), int(offset or 0)))
-        rows = cur.fetchall()
-        result = []
-        for r in rows:
-            result.append({'videoId': r[0], 'title': r[1], 'channelTitle': r[2], 'duration': r[3], 'published': r[4], 'views': r[5]})
-        return result
+        if self.has_search_index:
+            cols = ', '.join(f't.{c.strip()}' for c in columns.split(','))
+            cur.execute(f'SELECT bm25({fts}, 10.0, 1.0) AS rank, {cols} FROM {fts} JOIN {table} t ON t.rowid={fts}.rowid '
+                        f'WHERE {fts} MATCH ? ORDER BY rank LIMIT ?', (query, limit))
+        else:
+            like = '%' + (text or '').strip().replace('"', '') + '%'
+            cur.execute(f'SELECT 0, {columns} FROM {table} WHERE title LIKE ? OR channel_title LIKE ? LIMIT ?', (like, like, limit))
+        return cur.fetchall()
 
     def _maybe_import_json_last_results(self):
         cur = self.conn.cursor()
@@ -6,31 +6,84 @@ import os
 import sys
 import subprocess
 import shutil
+try:
+    from src.services.download_scheduler import DownloadScheduler, DONE, FAILED, RUNNING, CANCELLED, QUEUED
+    from src.services.download_journal import get_default_download_journal, archive_path
+except ModuleNotFoundError:
+    from services.download_scheduler import DownloadScheduler, DONE, FAILED, RUNNING, CANCELLED, QUEUED
+    from services.download_journal import get_default_download_journal, archive_path
+
+STATUS_TEXT = {QUEUED: 'Queued', RUNNING: 'Downloading', DONE: 'Done', FAILED: 'Failed', CANCELLED: 'Cancelled'}
+
+
+def _fmt_rate(bps):
+    for unit in ('B/s', 'KB/s', 'MB/s'):
+        if bps < 1024:
+            return f"{bps:.0f} {unit}" if unit == 'B/s' else f"{bps:.1f} {unit}"
+        bps /= 1024.0
+    return f"{bps:.1f} GB/s"
+
+
+def _fmt_eta(seconds):
+    if seconds is None:
+        return '--:--'
+    seconds = int(seconds)
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
+
 
 class DownloadManager:
+    # Videos are downloaded by a DownloadScheduler on options['workers']
+    # threads, each reusing one YoutubeDL built from the shared options. The
+    # progress hook runs on the worker threads for every received chunk and
+    # only queues the byte count in the scheduler, whose meter thread folds
+    # those events and computes rolling speed and ETA every REFRESH_MS. The Tk
+    # loop reads the published snapshot at the same fixed rate, so no widget
+    # is touched off the Tk thread and chunk rate never drives redraws.
+    #
+    # Jobs are resumable: each video's state is kept in the download journal
+    # and the folder's yt-dlp download archive, so reopening the same folder
+    # skips finished videos and continues partial ones.
+    REFRESH_MS = 250
+
     def __init__(self, parent, videos, download_folder, options):
         self.parent = parent
         self.videos = videos
         self.download_folder = download_folder
         self.options = options
+        self.scheduler = None
+        self.journal = None
+        self.job_id = None
         self.setup_progress_window()
 
     def setup_progress_window(self):
         self.window = tk.Toplevel(self.parent)
         self.window.title("Download Progress")
-        self.window.geometry("400x300")
+        self.window.geometry("560x420")
         
         # Overall progress
         ttk.Label(self.window, text="Overall Progress:").pack(pady=5)
-        self.total_progress = ttk.Progressbar(self.window, length=300, mode='determinate')
+        self.total_progress = ttk.Progressbar(self.window, length=400, mode='determinate')
         self.total_progress.pack(pady=5)
+        self.rate_label = ttk.Label(self.window, text="")
+        self.rate_label.pack()
         
-        # Current video progress
-        ttk.Label(self.window, text="Current Video:").pack(pady=5)
-        self.current_label = ttk.Label(self.window, text="")
-        self.current_label.pack()
-        self.video_progress = ttk.Progressbar(self.window, length=300, mode='determinate')
-        self.video_progress.pack(pady=5)
+        # One row per video
+        list_frame = ttk.Frame(self.window)
+        list_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        self.items_tree = ttk.Treeview(list_frame, columns=("Title", "Status", "Progress"), show="headings", height=10)
+        self.items_tree.heading("Title", text="Title")
+        self.items_tree.heading("Status", text="Status")
+        self.items_tree.heading("Progress", text="Progress")
+        self.items_tree.column("Title", width=320)
+        self.items_tree.column("Status", width=100, anchor="center")
+        self.items_tree.column("Progress", width=80, anchor="center")
+        scroll = ttk.Scrollbar(list_frame, orient="vertical", command=self.items_tree.yview)
+        self.items_tree.configure(yscrollcommand=scroll.set)
+        self.items_tree.pack(side="left", fill="both", expand=True)
+        scroll.pack(side="right", fill="y")
+        self._shown = {}
         
         # Status
         self.status_label = ttk.Label(self.window, text="Preparing...")
@@ -54,66 +107,146 @@ class DownloadManager:
             os.makedirs(self.download_folder, exist_ok=True)
         except Exception:
             pass
-        self.download_thread = threading.Thread(target=self.download_videos)
+        states = self._open_job()
+        self.scheduler = DownloadScheduler(self._make_worker, workers=self.options.get('workers', 1),
+                                           on_change=self._record_state, refresh=self.REFRESH_MS / 1000.0)
+        skipped = 0
+        for video in self.videos:
+            vid = video.get('videoId')
+            if vid:
+                done = states.get(vid) == DONE
+                skipped += 1 if done else 0
+                self.scheduler.add(vid, video.get('title', ''), done=done)
+                try:
+                    self.items_tree.insert('', 'end', iid=vid, values=(video.get('title', ''), STATUS_TEXT[DONE if done else QUEUED], '100%' if done else ''))
+                except Exception:
+                    pass
+        if skipped:
+            self.status_label["text"] = f"Resuming: {skipped} already downloaded"
+        self.total_progress["maximum"] = max(1, len(self.videos))
+        self.download_thread = threading.Thread(target=self.download_videos, daemon=True)
         self.download_thread.start()
+        self.window.after(self.REFRESH_MS, self._refresh)
 
-    def download_videos(self):
-        total_videos = len(self.videos)
-        self.total_progress["maximum"] = total_videos
-        
+    def _open_job(self):
+        self.journal = get_default_download_journal()
+        if self.journal is None:
+            return {}
+        try:
+            self.job_id = self.journal.job_id_for(self.download_folder)
+            return self.journal.open_job(self.download_folder, self.videos)
+        except Exception:
+            self.journal = None
+            return {}
+
+    def _record_state(self, video_id, state, error):
+        if self.journal is None:
+            return
+        # A cancelled video is picked up again by the next run.
+        if state == CANCELLED:
+            state = QUEUED
+        try:
+            self.journal.mark(self.job_id, video_id, state, error)
+        except Exception:
+            pass
+
+    def _ydl_opts(self):
         fmt = self.options['quality']
         ffmpeg_ok = bool(shutil.which('ffmpeg'))
         if not ffmpeg_ok:
             fmt = 'b[ext=mp4]/b'
         ydl_opts = {
             'format': fmt,
-            'outtmpl': os.path.join(self.download_folder, '%(title)s.%(ext)s'),
+            # The id keeps same-titled videos on parallel workers apart.
+            'outtmpl': os.path.join(self.download_folder, '%(title)s [%(id)s].%(ext)s'),
             'progress_hooks': [self.progress_hook],
-            'concurrent_fragment_downloads': 8,
+            'concurrent_fragment_downloads': max(1, int(self.options.get('fragments', 4))),
             'http_chunk_size': 1048576,
-            'ignoreerrors': True,
+            'noplaylist': True,
+            'download_archive': archive_path(self.download_folder),
+            'continuedl': True,
+            'quiet': True,
+            'no_warnings': True,
         }
         if ffmpeg_ok:
             ydl_opts['merge_output_format'] = 'mp4'
+        return ydl_opts
 
-        downloaded_count = 0
-        last_error = ''
-        for i, video in enumerate(self.videos, 1):
-            if self.cancelled:
-                break
-                
-            self.current_label["text"] = f"Downloading: {video['title']}"
-            self.status_label["text"] = f"Video {i} of {total_videos}"
-            
+    def _make_worker(self):
+        # One YoutubeDL per worker thread; instances are not shared between
+        # threads but are reused for every video that thread downloads.
+        ydl = yt_dlp.YoutubeDL(self._ydl_opts())
+
+        def download(video_id):
+            ydl.download([f"https://www.youtube.com/watch?v={video_id}"])
+        download.close = lambda: ydl.__exit__(None, None, None)
+        return download
+
+    def download_videos(self):
+        """Run the queue on the worker threads; blocks until it drains."""
+        self.scheduler.run()
+
+    def _refresh(self):
+        snap = self.scheduler.latest
+        if snap is None:
+            # The download thread has not started the scheduler yet.
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([f"https://www.youtube.com/watch?v={video['videoId']}"])
-                self.total_progress["value"] = i
-                downloaded_count += 1
+                self.window.after(self.REFRESH_MS, self._refresh)
+            except Exception:
+                pass
+            return
+        for item in snap['items']:
+            key = item['key']
+            pct = f"{int(item['fraction'] * 100)}%" if item['fraction'] or item['state'] == RUNNING else ''
+            status = STATUS_TEXT.get(item['state'], item['state'])
+            if item['state'] == RUNNING:
+                status = f"{_fmt_rate(item['speed'])} {_fmt_eta(item['eta'])}"
+            row = (status, pct)
+            if self._shown.get(key) != row:
+                self._shown[key] = row
                 try:
-                    self.open_btn["state"] = "normal"
+                    self.items_tree.set(key, "Status", status)
+                    self.items_tree.set(key, "Progress", pct)
                 except Exception:
                     pass
-            except Exception as e:
-                last_error = str(e)
-                self.status_label["text"] = f"Error: {last_error}"
-                continue
-        
-        if not self.cancelled:
+        counts = snap['counts']
+        finished = counts[DONE] + counts[FAILED] + counts[CANCELLED]
+        try:
+            self.total_progress["value"] = finished
+            if counts[RUNNING]:
+                self.rate_label["text"] = f"{counts[RUNNING]} downloading - {_fmt_rate(snap['speed'])} - ETA {_fmt_eta(snap['eta'])}"
+            else:
+                self.rate_label["text"] = ""
+            if counts[DONE]:
+                self.open_btn["state"] = "normal"
+        except Exception:
+            pass
+        if not snap['finished']:
             try:
-                files = [f for f in os.listdir(self.download_folder) if os.path.isfile(os.path.join(self.download_folder, f))]
+                if not self.cancelled and counts[RUNNING]:
+                    self.status_label["text"] = f"{counts[DONE]} of {snap['total']} done, {counts[FAILED]} failed"
+                self.window.after(self.REFRESH_MS, self._refresh)
             except Exception:
-                files = []
-            if downloaded_count > 0 or files:
-                self.status_label["text"] = f"Download complete ({downloaded_count} files)!"
-                try:
-                    self.open_btn["state"] = "normal"
-                except Exception:
-                    pass
+                pass
+            return
+        self._finish(snap)
+
+    def _finish(self, snap):
+        counts = snap['counts']
+        errors = [i['error'] for i in snap['items'] if i['state'] == FAILED and i['error']]
+        try:
+            if self.cancelled:
+                self.status_label["text"] = f"Cancelled ({counts[DONE]} files downloaded)"
+            elif counts[DONE] and not counts[FAILED]:
+                self.status_label["text"] = f"Download complete ({counts[DONE]} files)!"
+            elif counts[DONE]:
+                self.status_label["text"] = f"Downloaded {counts[DONE]} files, {counts[FAILED]} failed: {errors[-1] if errors else ''}"
             else:
-                msg = last_error or "No files downloaded"
+                msg = errors[-1] if errors else "No files downloaded"
                 self.status_label["text"] = f"Completed with issues: {msg}"
-        self.cancel_btn["text"] = "Close"
+            self.cancel_btn["text"] = "Close"
+        except Exception:
+            pass
 
     def open_folder(self):
         p = self.download_folder
@@ -130,41 +263,24 @@ class DownloadManager:
             pass
 
     def progress_hook(self, d):
-        if d['status'] == 'downloading':
-            # Update video progress
-            total = d.get('total_bytes') or d.get('total_bytes_estimate')
-            downloaded = d.get('downloaded_bytes') or 0
-            if total and total > 0:
-                try:
-                    self.video_progress.configure(mode='determinate')
-                except Exception:
-                    pass
-                percentage = (downloaded / total) * 100
-                self.video_progress["value"] = percentage
-            else:
-                try:
-                    self.video_progress.configure(mode='indeterminate')
-                    self.video_progress.start(50)
-                except Exception:
-                    pass
-            try:
-                sp = d.get('speed')
-                eta = d.get('eta')
-                if sp:
-                    self.status_label["text"] = f"Speed: {int(sp)} B/s  ETA: {eta or ''}"
-            except Exception:
-                pass
-        elif d['status'] == 'finished':
-            try:
-                self.video_progress.stop()
-                self.video_progress.configure(mode='determinate')
-                self.video_progress["value"] = 100
-            except Exception:
-                pass
+        # Called on the worker threads; only the scheduler is touched here.
+        if d.get('status') != 'downloading' or self.scheduler is None:
+            return
+        vid = (d.get('info_dict') or {}).get('id')
+        if not vid:
+            return
+        self.scheduler.progress(
+            vid,
+            d.get('downloaded_bytes') or 0,
+            d.get('total_bytes') or d.get('total_bytes_estimate'),
+            d.get('filename'),
+        )
 
     def cancel_download(self):
         if self.cancel_btn["text"] == "Close":
             self.window.destroy()
         else:
             self.cancelled = True
-            self.status_label["text"] = "Cancelling..." 
+            if self.scheduler is not None:
+                self.scheduler.cancel()
+            self.status_label["text"] = "Cancelling..."
@@ -6,7 +6,7 @@ class DownloadOptionsDialog:
         print("Initializing DownloadOptionsDialog")  # Debug print
         self.window = tk.Toplevel(parent)
         self.window.title("Download Options")
-        self.window.geometry("300x200")
+        self.window.geometry("300x240")
         self.result = None
         
         print("Setting up dialog components")  # Debug print
@@ -27,6 +27,14 @@ class DownloadOptionsDialog:
             ttk.Radiobutton(quality_frame, text=text, value=value, 
                           variable=self.quality_var).pack(side=tk.LEFT, padx=5)
         
+        # Videos downloaded at the same time
+        workers_frame = ttk.Frame(self.window)
+        workers_frame.pack(pady=5)
+        ttk.Label(workers_frame, text="Parallel downloads:").pack(side=tk.LEFT, padx=5)
+        self.workers_var = tk.IntVar(value=getattr(parent, 'download_workers', 3))
+        ttk.Spinbox(workers_frame, from_=1, to=16, width=4,
+                    textvariable=self.workers_var).pack(side=tk.LEFT)
+        
         # Buttons
         button_frame = ttk.Frame(self.window)
         button_frame.pack(side=tk.BOTTOM, pady=10)
@@ -45,8 +53,13 @@ class DownloadOptionsDialog:
 
     def start_download(self):
         print("Start download clicked")  # Debug print
+        try:
+            workers = max(1, int(self.workers_var.get()))
+        except Exception:
+            workers = 1
         self.result = {
-            'quality': self.quality_var.get()
+            'quality': self.quality_var.get(),
+            'workers': workers
         }
         print(f"Selected quality: {self.result}")  # Debug print
         self.window.destroy()
@@ -21,13 +21,35 @@ from .download_options_dialog import DownloadOptionsDialog
 from .download_manager import DownloadManager
 try:
     from src.services.video_playlist_scanner import VideoPlaylistScanner
+    from src.services.quota import get_default_meter
+    from src.services.playlist_page_cache import PlaylistPageCache
+    from src.services.session_store import get_default_session_writer, read_journal
+    from src.services.library import get_default_library
+    from src.ui.ui_dispatcher import UiDispatcher
+    from src.ui.video_view import VideoView
+    from src.ui.highlight_engine import HighlightEngine, PlaylistMembershipMap, HIT, PLAIN
+    from src.ui.live_filter import LiveFilter
 except ModuleNotFoundError:
     from services.video_playlist_scanner import VideoPlaylistScanner
+    from services.quota import get_default_meter
+    from services.playlist_page_cache import PlaylistPageCache
+    from services.session_store import get_default_session_writer, read_journal
+    from services.library import get_default_library
+    from ui.ui_dispatcher import UiDispatcher
+    from ui.video_view import VideoView
+    from ui.highlight_engine import HighlightEngine, PlaylistMembershipMap, HIT, PLAIN
+    from ui.live_filter import LiveFilter
 
 class MainPage(tk.Frame):
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
+        self.video_view = VideoView()
+        # Filter-as-you-type over title and channel; rows are formatted once
+        # per filter session and reused while the query changes.
+        self.live_filter = LiveFilter(lambda v: f"{v.get('title', '')}\n{v.get('channelTitle', '')}")
+        self._live_rows = {}
+        self._filter_box_stale = False
         self.current_videos = []
         self.current_playlist_info = {}
         self.current_page_token = None
@@ -35,6 +57,9 @@ class MainPage(tk.Frame):
 
     def _initialize_components(self):
         """Initialize and pack GUI components."""
+        # Worker threads hand UI work to the dispatcher; the Tk loop drains it.
+        self.ui = UiDispatcher(self)
+        self.ui.start()
         self._create_sections()
         self._pack_sections()
         try:
@@ -79,21 +104,31 @@ class MainPage(tk.Frame):
         self.current_playlist_info = None
         self.prev_page_token = None
         self.current_page_token = None
-        self.video_playlist_cache = {}
+        self.video_playlist_cache = PlaylistMembershipMap()
         self.collected_playlists = []
         self.video_search_query = ''
         self.video_next_page_token = None
         self.video_prev_page_token = None
         self.video_sort_state = {}
         self.playlist_sort_state = {}
-        self.download_concurrent_fragments = 4
+        # Videos downloaded at once, and fragments fetched at once per video.
+        self.download_workers = ConfigManager.get_download_workers()
+        self.download_concurrent_fragments = ConfigManager.get_download_fragments()
         self.post_processing_enabled = True
         self.pinned_playlist_id = None
         self._highlighting_video_id = None
         self.playlist_index_map = {}
         self._last_selected_video_idx = None
-        self.playlist_videos_cache = {}
-        self.playlist_video_ids = {}
+        self.playlist_cache = PlaylistPageCache(max_bytes=ConfigManager.get_playlist_cache_max_bytes())
+        # Session files are written by a debounced background writer; cached
+        # playlist pages go to an append-only journal instead of the snapshot.
+        self.session = get_default_session_writer()
+        self._journal_lock = threading.Lock()
+        self._journal_lines = 0
+        threading.Thread(target=self._load_playlist_pages, daemon=True).start()
+        # Library mode: playlists complete in the local store open offline.
+        self.library = get_default_library()
+        self.highlights = HighlightEngine(self.video_playlist_cache, self.playlist_cache.video_ids)
         self._preview_only_hits = False
         self._last_open_playlist_id = None
         def _fmt_date(s):
@@ -139,37 +174,132 @@ class MainPage(tk.Frame):
             self._create_mid_controls()
         except Exception:
             pass
+        self._safe_ui = self.ui.post
+
+    @property
+    def current_videos(self):
+        return self.video_view.source
+
+    @current_videos.setter
+    def current_videos(self, videos):
+        # Every assignment re-indexes videoId -> video for O(1) row lookups.
+        # Workers assign this too, so it must not touch Tk; the filter box is
+        # cleared when the new rows are rendered.
+        self.video_view.set_source(videos)
+        self.live_filter.set_source(self.video_view.source)
+        self._live_rows = {}
+        self._filter_box_stale = True
+
+    def _clear_filter_box(self):
+        if not self._filter_box_stale:
+            return
+        self._filter_box_stale = False
         try:
-            import tkinter as _tk
-            def _safe_ui(fn):
-                try:
-                    if not self.winfo_exists():
-                        return
-                    fn()
-                except Exception:
-                    pass
-            self._safe_ui = _safe_ui
+            self.video.reset_filter()
         except Exception:
-            self._safe_ui = lambda fn: None
+            pass
 
     def _update_video_row_by_vid(self, vid, playlist_id):
+        self._apply_video_playlists([(vid, playlist_id)])
+
+    def _apply_video_playlists(self, pairs):
+        """Record (videoId, playlistId) matches and refresh their rows at once."""
         try:
-            idx = None
-            for i, v in enumerate(self.current_videos):
-                if v.get('videoId') == vid:
-                    idx = i
-                    break
-            if idx is None:
-                return
-            self.video_playlist_cache[vid] = playlist_id
-            pi = self.assign_playlist_index(playlist_id)
-            self.current_videos[idx]['playlistIndex'] = pi
-            items = self.video.video_tree.get_children()
-            if idx < len(items):
-                self.video.video_tree.item(items[idx], values=self._video_row(self.current_videos[idx]))
+            updates = []
+            for vid, playlist_id in pairs:
+                v = self.video_view.video(vid)
+                if v is None:
+                    continue
+                self.video_playlist_cache[vid] = playlist_id
+                v['playlistIndex'] = self.assign_playlist_index(playlist_id)
+                self._live_rows.pop(id(v), None)
+                row = self._display_row(v)
+                for r in self.video_view.rows_of(vid):
+                    updates.append((r, row, None))
+            if updates:
+                self.video._panel.update_rows(updates)
+        except Exception:
+            pass
+
+    def _show_scan_progress(self, done, total):
+        try:
+            self.status_bar.configure(text=f"Collecting playlists from videos... {done}/{total}")
+        except Exception:
+            pass
+        try:
+            self.video.update_scan_progress(done, total)
+        except Exception:
+            pass
+        try:
+            self.update_mid_scan_progress(done, total)
         except Exception:
             pass
 
+    def _search_hit_tags(self, v):
+        return ('search_hit',) if v.get('videoId') in getattr(self, 'video_search_ids', set()) else ()
+
+    def _set_video_rows(self, videos, tags_for=None):
+        """Replace the Videos table with one row per video."""
+        videos = list(videos or [])
+        rows = []
+        for v in videos:
+            try:
+                tags = tags_for(v) if tags_for else ()
+            except Exception:
+                tags = ()
+            rows.append((self._video_row(v), tags))
+        self._clear_filter_box()
+        self.video_view.show(videos)
+        self.video._panel.set_rows(rows)
+        self._reset_highlights(tagged=[v.get('videoId') for v, (_, tags) in zip(videos, rows) if tags])
+
+    def prepare_live_filter(self):
+        """Index the current videos for the live filter off the Tk thread."""
+        threading.Thread(target=self.live_filter.prepare, daemon=True).start()
+
+    def apply_live_filter(self, text):
+        """Show the videos whose title or channel contains text."""
+        source = self.current_videos
+        if not (text or '').strip():
+            self._live_rows = {}
+        try:
+            shown = [source[r] for r in self.live_filter.apply(text)]
+        except Exception:
+            return
+        # Stars and tags come from the highlight state, which filtering leaves
+        # alone, so the pinned playlist's hits survive typing and clearing.
+        rows = []
+        cache = self._live_rows
+        for v in shown:
+            row = cache.get(id(v))
+            if row is None:
+                row = cache[id(v)] = self._video_row(v)
+            tags = ('search_hit',) if self.highlights.state(v.get('videoId')) != PLAIN else ()
+            rows.append((self._display_row(v, row), tags))
+        self.video_view.show(shown)
+        self.video._panel.set_rows(rows)
+
+    def _reset_highlights(self, hits=(), tagged=()):
+        search_ids = getattr(self, 'video_search_ids', set()) or set()
+        visible = [v.get('videoId') for v in self.video_view.rows if v.get('videoId') in search_ids]
+        self.highlights.reset(visible, hits=hits, tagged=tagged)
+
+    def _display_row(self, v, row=None):
+        """Table values for a video, starred while it is a highlight hit."""
+        if row is None:
+            row = self._video_row(v)
+        if self.highlights.is_hit(v.get('videoId')):
+            try:
+                row = (f"★ {row[0]}",) + tuple(row[1:])
+            except Exception:
+                pass
+        return row
+
+    def _refresh_video_row(self, row, tags=None):
+        v = self.video_view.video_at(row)
+        if v is not None:
+            self.video._panel.update_row(row, values=self._display_row(v), tags=tags)
+
     def _bring_playlist_to_top(self, playlist_id):
         try:
             self.playlist.playlist_tree.move(playlist_id, '', 0)
@@ -196,36 +326,88 @@ class MainPage(tk.Frame):
 
     def _cache_playlist_videos(self, playlist_id, page_token, response):
         try:
-            cache = self.playlist_videos_cache.setdefault(playlist_id, {'pages': {}, 'tokens': {}})
-            key = page_token or '__first__'
-            cache['pages'][key] = list(response.get('videos', []))
-            cache['tokens'][key] = (response.get('prevPageToken'), response.get('nextPageToken'))
+            self.playlist_cache.put_page(playlist_id, page_token, response)
+            self._journal_playlist_page(playlist_id, page_token, response)
+        except Exception:
+            pass
+
+    def _journal_playlist_page(self, playlist_id, page_token, response):
+        path = ConfigManager.get_playlist_pages_path()
+        with self._journal_lock:
+            self._journal_lines += 1
+            # Compact once the journal holds twice what the cache keeps.
+            if self._journal_lines > 2 * max(self.playlist_cache.stats()['pages'], 50):
+                records = self.playlist_cache.records()
+                self.session.rewrite(path, records)
+                self._journal_lines = len(records)
+                return
+            self.session.append(path, {
+                'playlistId': playlist_id,
+                'pageToken': page_token or None,
+                'videos': list(response.get('videos') or []),
+                'prevPageToken': response.get('prevPageToken'),
+                'nextPageToken': response.get('nextPageToken'),
+            })
+
+    def _load_playlist_pages(self):
+        try:
+            records = read_journal(ConfigManager.get_playlist_pages_path())
+            # Runs in the background at startup: pages fetched live meanwhile
+            # are newer than the journal and must not be overwritten.
+            self.playlist_cache.load_records(records, replace=False)
+            with self._journal_lock:
+                self._journal_lines += len(records)
+        except Exception:
+            pass
+
+    def _save_last_search(self, kind, data):
+        try:
+            self.session.save(ConfigManager.get_last_search_path(kind), data)
+        except Exception:
+            pass
+
+    def _get_cached_playlist_page(self, playlist_id, page_token, max_results=None):
+        try:
+            page = self.playlist_cache.get_page(playlist_id, page_token)
+        except Exception:
+            page = None
+        if page is None and self.library is not None:
             try:
-                ids = {v.get('videoId') for v in response.get('videos', []) if v.get('videoId')}
+                page = self.library.playlist_page(playlist_id, page_token, max_results)
             except Exception:
-                ids = set()
+                page = None
+            if page is not None:
+                try:
+                    self.playlist_cache.put_page(playlist_id, page_token, page)
+                except Exception:
+                    pass
+                self._check_library_freshness(playlist_id)
+        return page
+
+    def _check_library_freshness(self, playlist_id):
+        if self.library is None or not self.library.needs_check(playlist_id):
+            return
+        def _worker():
             try:
-                cur = self.playlist_video_ids.setdefault(playlist_id, set())
-                for i in ids:
-                    cur.add(i)
+                stale = self.library.check_freshness(playlist_id, lambda: self.controller.playlist_handler.get_details(playlist_id))
+            except Exception:
+                stale = False
+            if not stale:
+                return
+            try:
+                self.playlist_cache.invalidate(playlist_id)
             except Exception:
                 pass
-        except Exception:
-            pass
+            self.ui.post(lambda: self.status_bar.configure(text="Playlist changed online; reopen it to refresh"))
+        threading.Thread(target=_worker, daemon=True).start()
 
-    def _get_cached_playlist_page(self, playlist_id, page_token):
+    def _library_playlists(self, video_id):
+        if self.library is None:
+            return set()
         try:
-            cache = self.playlist_videos_cache.get(playlist_id)
-            if not cache:
-                return None
-            key = page_token or '__first__'
-            vids = cache.get('pages', {}).get(key)
-            toks = cache.get('tokens', {}).get(key, (None, None))
-            if vids is None:
-                return None
-            return {'videos': vids, 'prevPageToken': toks[0], 'nextPageToken': toks[1]}
+            return self.library.playlists_for_video(video_id)
         except Exception:
-            return None
+            return set()
 
     def assign_playlist_index(self, playlist_id):
         if playlist_id in self.playlist_index_map:
@@ -314,7 +496,7 @@ class MainPage(tk.Frame):
         except Exception:
             pass
         try:
-            self.video.video_tree.delete(*self.video.video_tree.get_children())
+            self._set_video_rows([])
         except Exception:
             pass
         self.current_videos = []
@@ -347,6 +529,7 @@ class MainPage(tk.Frame):
         if mode not in ('playlists', 'videos'):
             mode = 'playlists'
         try:
+            self.session.flush()
             if mode == 'playlists':
                 path = ConfigManager.get_last_search_path('playlists')
                 raw = ConfigManager.load_json(path)
@@ -395,8 +578,7 @@ class MainPage(tk.Frame):
                     self.video_search_query = q or self.video_search_query
                 except Exception:
                     pass
-                for v in videos:
-                    self.video.video_tree.insert('', 'end', values=self._video_row(v))
+                self._set_video_rows(videos)
                 for pl in playlists:
                     self.playlist.update_playlist(pl)
                 self.current_videos = videos
@@ -431,24 +613,11 @@ class MainPage(tk.Frame):
         except Exception:
             pass
         if mode == 'playlists':
+            self._run_playlist_search(query, save_last=True)
             try:
-                playlists = self.controller.playlist_handler.search_playlists(query)
-                enriched = []
-                for playlist in playlists:
-                    try:
-                        video_count = self.controller.playlist_handler.get_details(playlist["playlistId"])
-                        playlist["video_count"] = video_count
-                    except Exception:
-                        playlist["video_count"] = "N/A"
-                    self.playlist.update_playlist(playlist)
-                    enriched.append(playlist)
-                ConfigManager.save_json(ConfigManager.get_last_search_path('playlists'), {
-                    'query': query,
-                    'playlists': enriched
-                })
                 self.video.update_back_button_state(False)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to fetch playlists: {e}")
+            except Exception:
+                pass
         else:
             self.video_search_query = query
             try:
@@ -468,21 +637,14 @@ class MainPage(tk.Frame):
                 self.video_search_ids = set([v.get('videoId') for v in videos if v.get('videoId')])
             except Exception:
                 self.video_search_ids = set()
-            self.video.video_tree.delete(*self.video.video_tree.get_children())
-            for v in videos:
-                try:
-                    vid = v.get('videoId')
-                    tags = ('search_hit',) if vid in getattr(self, 'video_search_ids', set()) else ()
-                    self.video.video_tree.insert('', 'end', values=self._video_row(v), tags=tags)
-                except Exception:
-                    self.video.video_tree.insert('', 'end', values=self._video_row(v))
+            self._set_video_rows(videos, self._search_hit_tags)
 
             def _fetch_playlists():
                     self._safe_ui(lambda: self.set_mid_job_title('Mapping playlists'))
                     self._safe_ui(lambda t=len(videos): self.video.show_scan(t))
                     self._safe_ui(lambda t=len(videos): self.show_mid_scan(t))
                     collected_local = []
-                    scanner = VideoPlaylistScanner(self.controller.api_key)
+                    scanner = VideoPlaylistScanner(self.controller.api_key, key_pool=getattr(self.controller, 'key_pool', None))
                     def _on_pl(pl):
                         plid = pl.get('playlistId')
                         try:
@@ -494,42 +656,36 @@ class MainPage(tk.Frame):
                         return pi
                     def _prefetch(pid):
                         try:
-                            from src.playlist import Playlist as _Pl
-                        except ModuleNotFoundError:
-                            from playlist import Playlist as _Pl
-                        try:
-                            ph2 = _Pl(self.controller.api_key)
-                            resp_pf = ph2.get_videos(pid, None, max_results=10)
+                            resp_pf = self.controller.playlist_handler.get_videos(pid, None, max_results=10)
                             self._cache_playlist_videos(pid, None, resp_pf)
                         except Exception:
                             pass
                     def _progress(done, total):
-                        self._safe_ui(lambda x=done, t=total: self.status_bar.configure(text=f"Collecting playlists from videos... {x}/{t}"))
-                        self._safe_ui(lambda x=done, t=total: self.video.update_scan_progress(x, t))
-                        self._safe_ui(lambda x=done, t=total: self.update_mid_scan_progress(x, t))
+                        self.ui.post_latest('scan_progress', lambda x=done, t=total: self._show_scan_progress(x, t))
                     def _index(vid, pid, idx):
-                        self._safe_ui(lambda v_id=vid, p_id=pid: self._update_video_row_by_vid(v_id, p_id))
+                        self.ui.post_batch('video_playlists', (vid, pid), self._apply_video_playlists)
+                    def _budget_exhausted():
+                        self._safe_ui(lambda: self._log("Daily API quota budget exhausted: playlist matches are incomplete"))
                     try:
-                        scanner.scan(videos, _on_pl, _prefetch, _progress, _index)
+                        scanner.scan(videos, _on_pl, _prefetch, _progress, _index, _budget_exhausted)
                     except Exception:
                         pass
                     try:
-                        ConfigManager.save_json(ConfigManager.get_last_search_path('videos'), {
+                        self._save_last_search('videos', {
                             'query': query,
-                            'videos': videos,
-                            'playlists': collected_local,
+                            'videos': list(videos),
+                            'playlists': list(collected_local),
                             'nextPageToken': self.video_next_page_token,
                             'prevPageToken': self.video_prev_page_token,
-                            'videoIds': list(self.video_search_ids),
-                            'playlistPages': {pid: {'pages': cache.get('pages', {}), 'tokens': cache.get('tokens', {})} for pid, cache in (self.playlist_videos_cache or {}).items()},
-                            'playlistIds': {pid: list(self.playlist_video_ids.get(pid, set())) for pid in (self.playlist_video_ids or {}).keys()}
+                            'videoIds': list(self.video_search_ids)
                         })
                         self.collected_playlists = collected_local
                         try:
                             vids_cnt = len(videos or [])
                         except Exception:
                             vids_cnt = 0
-                        self._safe_ui(lambda n=len(collected_local), v=vids_cnt: self.status_bar.configure(text=f"Collected {n} playlists for {v} videos"))
+                        note = " (quota budget exhausted, results incomplete)" if scanner.budget_exhausted else ""
+                        self._safe_ui(lambda n=len(collected_local), v=vids_cnt, note=note: self.status_bar.configure(text=f"Collected {n} playlists for {v} videos{note}"))
                         self._safe_ui(lambda: self.video.finish_scan())
                         self._safe_ui(lambda: self.finish_mid_scan())
                     except Exception:
@@ -538,15 +694,13 @@ class MainPage(tk.Frame):
                 threading.Thread(target=_fetch_playlists, daemon=True).start()
             except Exception:
                 pass
-            ConfigManager.save_json(ConfigManager.get_last_search_path('videos'), {
+            self._save_last_search('videos', {
                 'query': query,
-                'videos': videos,
+                'videos': list(videos),
                 'playlists': [],
                 'nextPageToken': self.video_next_page_token,
                 'prevPageToken': self.video_prev_page_token,
-                'videoIds': list(self.video_search_ids),
-                'playlistPages': {pid: {'pages': cache.get('pages', {}), 'tokens': cache.get('tokens', {})} for pid, cache in (self.playlist_videos_cache or {}).items()},
-                'playlistIds': {pid: list(self.playlist_video_ids.get(pid, set())) for pid in (self.playlist_video_ids or {}).keys()}
+                'videoIds': list(self.video_search_ids)
             })
             self.video.update_back_button_state(False)
             try:
@@ -561,7 +715,7 @@ class MainPage(tk.Frame):
                 except Exception:
                     idx = 1
                 try:
-                    count_items = len(self.video.video_tree.get_children())
+                    count_items = self.video._panel.row_count()
                 except Exception:
                     count_items = len(videos)
                 try:
@@ -574,6 +728,7 @@ class MainPage(tk.Frame):
     def back_to_video_results(self):
         if self.search_mode != 'videos':
             return
+        self.session.flush()
         data = {}
         try:
             ds = getattr(self.controller, 'datastore', None)
@@ -597,15 +752,9 @@ class MainPage(tk.Frame):
         videos = data.get('videos', [])
         playlists = data.get('playlists', [])
         try:
-            ppages = data.get('playlistPages') or {}
-            if isinstance(ppages, dict):
-                self.playlist_videos_cache = ppages
-        except Exception:
-            pass
-        try:
-            pids = data.get('playlistIds') or {}
-            if isinstance(pids, dict):
-                self.playlist_video_ids = {pid: set(v or []) for pid, v in pids.items()}
+            # Files written before the page journal still embed the cache.
+            if data.get('playlistPages'):
+                self.playlist_cache.restore(data.get('playlistPages'), data.get('playlistIds'))
         except Exception:
             pass
         try:
@@ -621,13 +770,7 @@ class MainPage(tk.Frame):
             self.video_search_ids = set([i for i in ids if i])
         except Exception:
             self.video_search_ids = set()
-        for v in videos:
-            try:
-                vid = v.get('videoId')
-                tags = ('search_hit',) if vid in getattr(self, 'video_search_ids', set()) else ()
-                self.video.video_tree.insert('', 'end', values=self._video_row(v), tags=tags)
-            except Exception:
-                self.video.video_tree.insert('', 'end', values=self._video_row(v))
+        self._set_video_rows(videos, self._search_hit_tags)
         for pl in playlists:
             self.playlist.update_playlist(pl)
         self.current_videos = videos
@@ -668,7 +811,7 @@ class MainPage(tk.Frame):
             except Exception:
                 idx = 1
             try:
-                count_items = len(self.video.video_tree.get_children())
+                count_items = self.video._panel.row_count()
             except Exception:
                 count_items = len(videos)
             try:
@@ -703,21 +846,15 @@ class MainPage(tk.Frame):
                     collected = []
                     processed = 0
                     total = len(self.current_videos or [])
-                    try:
-                        self.after(0, lambda: self.set_mid_job_title('Mapping playlists'))
-                        self.after(0, lambda t=total: self.video.show_scan(t))
-                        self.after(0, lambda t=total: self.show_mid_scan(t))
-                    except Exception:
-                        pass
+                    self.ui.post(lambda: self.set_mid_job_title('Mapping playlists'))
+                    self.ui.post(lambda t=total: self.video.show_scan(t))
+                    self.ui.post(lambda t=total: self.show_mid_scan(t))
                     for v in list(self.current_videos or []):
                         vid = v.get('videoId')
                         cid = v.get('channelId')
                         if not vid or not cid:
                             processed += 1
-                            try:
-                                self.after(0, lambda x=processed, t=total: self.video.update_scan_progress(x, t))
-                            except Exception:
-                                pass
+                            self.ui.post_latest('scan_progress', lambda x=processed, t=total: self._show_scan_progress(x, t))
                             continue
                         try:
                             chpls = self.controller.playlist_handler.get_channel_playlists(cid, max_results=20)
@@ -729,7 +866,7 @@ class MainPage(tk.Frame):
                             plid = pl.get('playlistId')
                             has = False
                             try:
-                                ids_set = self.playlist_video_ids.get(plid)
+                                ids_set = self.playlist_cache.video_ids(plid)
                                 if ids_set is None:
                                     cached_page = self._get_cached_playlist_page(plid, None)
                                     if cached_page:
@@ -738,7 +875,7 @@ class MainPage(tk.Frame):
                                         except Exception:
                                             ids_set = set()
                                         try:
-                                            self.playlist_video_ids[plid] = ids_set
+                                            self.playlist_cache.set_video_ids(plid, ids_set)
                                         except Exception:
                                             pass
                                 if ids_set is None:
@@ -747,7 +884,7 @@ class MainPage(tk.Frame):
                                         self._cache_playlist_videos(plid, None, resp_pf_local)
                                         try:
                                             ids_set = {x.get('videoId') for x in resp_pf_local.get('videos', []) if x.get('videoId')}
-                                            self.playlist_video_ids[plid] = ids_set
+                                            self.playlist_cache.set_video_ids(plid, ids_set)
                                         except Exception:
                                             ids_set = set()
                                     except Exception:
@@ -766,28 +903,17 @@ class MainPage(tk.Frame):
                                 if first_index is None:
                                     first_index = pi
                                     first_plid = plid
-                                try:
-                                    self.after(0, lambda d=pl: self.playlist.update_playlist(d))
-                                except Exception:
-                                    pass
+                                self.ui.post(lambda d=pl: self.playlist.update_playlist(d))
                         if first_index and first_plid:
-                            try:
-                                v['playlistIndex'] = first_index
-                                self.after(0, lambda v_id=vid, p_id=first_plid: self._update_video_row_by_vid(v_id, p_id))
-                            except Exception:
-                                pass
+                            v['playlistIndex'] = first_index
+                            self.ui.post_batch('video_playlists', (vid, first_plid), self._apply_video_playlists)
                         processed += 1
-                        try:
-                            self.after(0, lambda x=processed, t=total: self.status_bar.configure(text=f"Collecting playlists from videos... {x}/{t}"))
-                            self.after(0, lambda x=processed, t=total: self.video.update_scan_progress(x, t))
-                            self.after(0, lambda x=processed, t=total: self.update_mid_scan_progress(x, t))
-                        except Exception:
-                            pass
+                        self.ui.post_latest('scan_progress', lambda x=processed, t=total: self._show_scan_progress(x, t))
                     try:
-                        ConfigManager.save_json(ConfigManager.get_last_search_path('videos'), {
+                        self._save_last_search('videos', {
                             'query': self.video_search_query,
-                            'videos': self.current_videos,
-                            'playlists': collected,
+                            'videos': list(self.current_videos or []),
+                            'playlists': list(collected),
                             'nextPageToken': self.video_next_page_token,
                             'prevPageToken': self.video_prev_page_token,
                             'videoIds': list(getattr(self, 'video_search_ids', set()))
@@ -798,14 +924,11 @@ class MainPage(tk.Frame):
                                 vc = len(self.current_videos or [])
                             except Exception:
                                 vc = 0
-                            self.after(0, lambda n=len(collected), v=vc: self.status_bar.configure(text=f"Collected {n} playlists for {v} videos"))
-                        except Exception:
-                            pass
-                        try:
-                            self.after(0, lambda: self.video.finish_scan())
-                            self.after(0, lambda: self.finish_mid_scan())
+                            self.ui.post(lambda n=len(collected), v=vc: self.status_bar.configure(text=f"Collected {n} playlists for {v} videos"))
                         except Exception:
                             pass
+                        self.ui.post(lambda: self.video.finish_scan())
+                        self.ui.post(lambda: self.finish_mid_scan())
                     except Exception:
                         pass
                 try:
@@ -818,14 +941,15 @@ class MainPage(tk.Frame):
     def on_video_select(self, event=None):
         if self.search_mode != 'videos':
             return
-        sel = self.video.video_tree.selection()
-        if not sel:
+        if not self.video.video_tree.selection():
+            return
+        idx = self.video._panel.selected_index()
+        if idx is None:
             return
-        idx = self.video.video_tree.index(sel[0])
         self._last_selected_video_idx = idx
-        if idx < 0 or idx >= len(self.current_videos):
+        video = self.video_view.video_at(idx)
+        if video is None:
             return
-        video = self.current_videos[idx]
         vid = video.get('videoId')
         if not vid:
             return
@@ -836,9 +960,9 @@ class MainPage(tk.Frame):
                 self.playlist.playlist_tree.selection_set(plid)
                 self.playlist.playlist_tree.see(plid)
                 pi = self.assign_playlist_index(plid)
-                self.current_videos[idx]['playlistIndex'] = pi
+                video['playlistIndex'] = pi
                 try:
-                    self.video.video_tree.item(sel[0], values=self._video_row(self.current_videos[idx]))
+                    self._refresh_video_row(idx)
                 except Exception:
                     pass
             except Exception:
@@ -853,13 +977,18 @@ class MainPage(tk.Frame):
             pass
         def _worker(video_id, selected_index):
             found = None
+            known = self._library_playlists(video_id)
             try:
-                for pl in list(self.collected_playlists or []):
+                for pl in sorted(list(self.collected_playlists or []), key=lambda p: p.get('playlistId') not in known):
                     plid = pl.get('playlistId')
                     if not plid:
                         continue
+                    if plid in known:
+                        found = plid
+                        self.video_playlist_cache[video_id] = found
+                        break
                     try:
-                        ids_set = self.playlist_video_ids.get(plid)
+                        ids_set = self.playlist_cache.video_ids(plid)
                         if ids_set is None:
                             cached_page = self._get_cached_playlist_page(plid, None)
                             if cached_page:
@@ -868,7 +997,7 @@ class MainPage(tk.Frame):
                                 except Exception:
                                     ids_set = set()
                                 try:
-                                    self.playlist_video_ids[plid] = ids_set
+                                    self.playlist_cache.set_video_ids(plid, ids_set)
                                 except Exception:
                                     pass
                         has = bool(video_id) and (video_id in (ids_set or set()))
@@ -894,16 +1023,8 @@ class MainPage(tk.Frame):
                         self._set_pinned_playlist(found)
                         self.playlist.playlist_tree.selection_set(found)
                         self.playlist.playlist_tree.see(found)
-                        pi = self.assign_playlist_index(found)
-                        try:
-                            if selected_index is not None and 0 <= selected_index < len(self.current_videos):
-                                self.current_videos[selected_index]['playlistIndex'] = pi
-                                # Update the currently selected video row
-                                items = self.video.video_tree.get_children()
-                                if selected_index < len(items):
-                                    self.video.video_tree.item(items[selected_index], values=self._video_row(self.current_videos[selected_index]))
-                        except Exception:
-                            pass
+                        # Looked up by videoId: the row may have moved since the click.
+                        self._apply_video_playlists([(video_id, found)])
                         self.status_bar.configure(text="Playlist highlighted")
                     else:
                         self.status_bar.configure(text="Playlist not found (checked first page only)")
@@ -911,7 +1032,7 @@ class MainPage(tk.Frame):
                     pass
                 self._highlighting_video_id = None
             try:
-                self.after(0, _update)
+                self.ui.post(_update)
             except Exception:
                 self._highlighting_video_id = None
         import threading as _t
@@ -930,14 +1051,7 @@ class MainPage(tk.Frame):
             self.current_videos = videos
             self.video_next_page_token = resp.get('nextPageToken')
             self.video_prev_page_token = resp.get('prevPageToken')
-            self.video.video_tree.delete(*self.video.video_tree.get_children())
-            for v in videos:
-                try:
-                    vid = v.get('videoId')
-                    tags = ('search_hit',) if vid in getattr(self, 'video_search_ids', set()) else ()
-                    self.video.video_tree.insert('', 'end', values=self._video_row(v), tags=tags)
-                except Exception:
-                    self.video.video_tree.insert('', 'end', values=self._video_row(v))
+            self._set_video_rows(videos, self._search_hit_tags)
             try:
                 has_prev = bool(self.video_prev_page_token)
                 has_next = bool(self.video_next_page_token)
@@ -948,7 +1062,7 @@ class MainPage(tk.Frame):
                 except Exception:
                     idx = 1
                 try:
-                    count_items = len(self.video.video_tree.get_children())
+                    count_items = self.video._panel.row_count()
                 except Exception:
                     count_items = len(videos)
                 try:
@@ -977,6 +1091,14 @@ class MainPage(tk.Frame):
         except Exception:
             pass
 
+    def _quota_is_low(self):
+        try:
+            pool = getattr(self.controller, 'key_pool', None)
+            keys = pool.keys if pool is not None else (getattr(self.controller, 'api_key', '') or '')
+            return get_default_meter().is_low(keys)
+        except Exception:
+            return False
+
     def map_videos_to_playlists(self, videos):
         collected = []
         try:
@@ -984,12 +1106,23 @@ class MainPage(tk.Frame):
         except Exception:
             existing = []
         index_map = dict(self.playlist_index_map or {})
+        # Low quota: answer membership from cached id sets and table rows only.
+        low_budget = self._quota_is_low()
         for v in list(videos or []):
             vid = v.get('videoId')
             target = None
+            known = self._library_playlists(vid)
             for pid in existing:
+                if pid in known:
+                    target = pid
+                    break
+            for pid in existing if target is None else ():
                 try:
-                    if self.controller.playlist_handler.playlist_contains_video(pid, vid):
+                    if low_budget:
+                        hit = vid in (self.playlist_cache.video_ids(pid) or set())
+                    else:
+                        hit = self.controller.playlist_handler.playlist_contains_video(pid, vid)
+                    if hit:
                         target = pid
                         break
                 except Exception:
@@ -998,7 +1131,11 @@ class MainPage(tk.Frame):
                 continue
             if not any(p.get('playlistId') == target for p in collected):
                 try:
-                    info = self.controller.playlist_handler.get_playlist_info(target)
+                    if low_budget:
+                        vals = self.playlist.playlist_tree.item(target).get('values', [])
+                        info = {'playlistId': target, 'title': vals[1] if len(vals) > 1 else '', 'channelTitle': vals[2] if len(vals) > 2 else '', 'video_count': vals[3] if len(vals) > 3 else 'N/A'}
+                    else:
+                        info = self.controller.playlist_handler.get_playlist_info(target)
                 except Exception:
                     info = {'playlistId': target, 'title': '', 'channelTitle': '', 'video_count': 'N/A'}
                 collected.append(info)
@@ -1012,10 +1149,7 @@ class MainPage(tk.Frame):
         except Exception:
             pass
         try:
-            items = self.video.video_tree.get_children()
-            for i, item in enumerate(items):
-                if i < len(videos):
-                    self.video.video_tree.item(item, values=self._video_row(videos[i]))
+            self.video._panel.update_rows([(r, self._display_row(v), None) for r, v in enumerate(self.video_view.rows)])
         except Exception:
             pass
         return collected
@@ -1037,51 +1171,32 @@ class MainPage(tk.Frame):
         except Exception:
             pass
         try:
-            items = self.video.video_tree.get_children()
-            for i, item in enumerate(items):
-                if i < len(self.current_videos):
-                    self.video.video_tree.item(item, values=self._video_row(self.current_videos[i]))
+            self.video._panel.update_rows([(r, self._display_row(v), None) for r, v in enumerate(self.video_view.rows)])
         except Exception:
             pass
 
     def highlight_videos_for_playlist(self, playlist_id):
         # Marks only intersection: videos in selected playlist AND present in current search results
-        # Updates row values without changing mode; safe against UI restart
+        # Only rows whose highlight state changes are rewritten
         try:
             if not playlist_id:
                 return
-            items = self.video.video_tree.get_children()
             try:
                 pi = self.assign_playlist_index(playlist_id)
             except Exception:
                 pi = None
-            for i, item in enumerate(items):
+            changes = self.highlights.pin(playlist_id)
+            for vid, state in changes.items():
+                if state != HIT:
+                    continue
                 try:
-                    v = self.current_videos[i] if i < len(self.current_videos) else None
-                    if not v:
-                        continue
-                    vid = v.get('videoId')
-                    cached_hit = bool(vid) and (self.video_playlist_cache.get(vid) == playlist_id)
-                    ids_hit = bool(vid) and (vid in self.playlist_video_ids.get(playlist_id, set()))
-                    in_results = bool(vid) and (vid in getattr(self, 'video_search_ids', set()))
-                    is_hit = (cached_hit or ids_hit) and in_results
-                    if is_hit:
-                        try:
-                            if in_results:
-                                self.video_playlist_cache[vid] = playlist_id
-                            if pi is not None:
-                                v['playlistIndex'] = pi
-                        except Exception:
-                            pass
-                    row = self._video_row(v)
-                    if is_hit:
-                        try:
-                            row = (f"★ {row[0]}",) + row[1:]
-                        except Exception:
-                            pass
-                    self.video.video_tree.item(item, values=row, tags=('search_hit',) if is_hit else ())
+                    self.video_playlist_cache[vid] = playlist_id
+                    v = self.video_view.video(vid)
+                    if v is not None and pi is not None:
+                        v['playlistIndex'] = pi
                 except Exception:
                     pass
+            self._apply_highlight_changes(changes)
             try:
                 self._set_pinned_playlist(playlist_id)
             except Exception:
@@ -1096,16 +1211,7 @@ class MainPage(tk.Frame):
     def clear_video_playlist_highlights(self):
         # Removes all transient highlight/star tags from Videos table
         try:
-            items = self.video.video_tree.get_children()
-            for i, item in enumerate(items):
-                try:
-                    v = self.current_videos[i] if i < len(self.current_videos) else None
-                    if not v:
-                        continue
-                    row = self._video_row(v)
-                    self.video.video_tree.item(item, values=row, tags=())
-                except Exception:
-                    pass
+            self._apply_highlight_changes(self.highlights.clear())
             try:
                 self.status_bar.configure(text="Cleared video highlights")
             except Exception:
@@ -1113,7 +1219,65 @@ class MainPage(tk.Frame):
         except Exception:
             pass
 
+    def _apply_highlight_changes(self, changes):
+        updates = []
+        for vid, state in changes.items():
+            v = self.video_view.video(vid)
+            if v is None:
+                continue
+            row = self._display_row(v)
+            tags = ('search_hit',) if state == HIT else ()
+            for r in self.video_view.rows_of(vid):
+                updates.append((r, row, tags))
+        if updates:
+            self.video._panel.update_rows(updates)
+
     # Core functionality methods
+    def _local_store(self):
+        if self.library is not None:
+            return self.library.store
+        ds = getattr(self.controller, 'datastore', None)
+        if hasattr(ds, 'search_local'):
+            return ds
+        try:
+            from src.data.sqlite_store import SqliteStore
+        except ModuleNotFoundError:
+            from data.sqlite_store import SqliteStore
+        return SqliteStore()
+
+    def search_local(self, query):
+        """Full-text search over stored videos and playlists; uses no quota."""
+        query = (query or '').strip()
+        if not query:
+            messagebox.showerror("Error", "Please enter a keyword.")
+            return
+        try:
+            self.status_bar.configure(text="Searching library...")
+        except Exception:
+            pass
+        def _worker():
+            try:
+                results = self._local_store().search_local(query, limit=500)
+            except Exception as e:
+                self.ui.post(lambda err=e: self.status_bar.configure(text=f"Library search failed: {err}"))
+                return
+            videos = [r for r in results if r.get('kind') == 'video']
+            playlists = [r for r in results if r.get('kind') == 'playlist']
+            def _show():
+                self.clear_panels()
+                for pl in playlists:
+                    if pl.get('video_count') is None:
+                        pl['video_count'] = ''
+                    self.playlist.update_playlist(pl)
+                self.current_videos = videos
+                self._set_video_rows(videos)
+                try:
+                    self.status_bar.configure(text=f"Library: {len(videos)} videos, {len(playlists)} playlists for '{query}'")
+                except Exception:
+                    pass
+            self.ui.post(_show)
+        threading.Thread(target=_worker, daemon=True).start()
+
     def search_playlists(self):
         """Search for playlists based on the keyword."""
         query = self.search.search_entry.get()
@@ -1126,26 +1290,52 @@ class MainPage(tk.Frame):
             self.playlist.playlist_tree.delete(
                 *self.playlist.playlist_tree.get_children()
             )
+        except Exception:
+            pass
+        self._run_playlist_search(query)
 
-            # Search for playlists
-            playlists = self.controller.playlist_handler.search_playlists(query)
-            
-            # Update each playlist with video count and status
+    def _run_playlist_search(self, query, save_last=False):
+        """Search playlists off the Tk thread and fill rows as results arrive.
+
+        Rows are inserted as soon as the search returns; video counts for all
+        results then come from one batched playlists().list call.
+        """
+        def _worker():
+            try:
+                playlists = self.controller.playlist_handler.search_playlists(query)
+            except Exception as e:
+                self.ui.post(lambda err=e: messagebox.showerror("Error", f"Failed to fetch playlists: {err}"))
+                return
+            def _insert():
+                for playlist in playlists:
+                    try:
+                        self.playlist.update_playlist(dict(playlist, video_count="…"))
+                    except Exception:
+                        pass
+            self.ui.post(_insert)
+            ids = [p.get("playlistId") for p in playlists]
+            try:
+                counts = self.controller.playlist_handler.get_details_batch(ids)
+            except Exception:
+                counts = {}
             for playlist in playlists:
+                playlist["video_count"] = counts.get(playlist.get("playlistId"), "N/A")
+            def _apply():
                 try:
-                    video_count = self.controller.playlist_handler.get_details(
-                        playlist["playlistId"]
-                    )
-                    playlist["video_count"] = video_count
-                except Exception as e:
-                    # If we can't get details, just use the playlist without video count
-                    print(f"Note: Could not get details for playlist {playlist['title']}")
-                    playlist["video_count"] = "N/A"
-                
-                self.playlist.update_playlist(playlist)
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to fetch playlists: {e}")
+                    self.playlist.apply_video_counts(ids, counts)
+                except Exception:
+                    pass
+                if save_last:
+                    try:
+                        self._save_last_search('playlists', {
+                            'query': query,
+                            'playlists': playlists
+                        })
+                    except Exception:
+                        pass
+            self.ui.post(_apply)
+        import threading as _t
+        _t.Thread(target=_worker, daemon=True).start()
 
     def show_playlist_videos(self, event=None, page_token=None):
         # Opens playlist videos in Playlists mode; guarded against wrong column map and missing row
@@ -1204,9 +1394,12 @@ class MainPage(tk.Frame):
         try:
             max_results = int(self.video.page_size_var.get())
             try:
-                cached = self._get_cached_playlist_page(playlist_id, page_token)
+                cached = self._get_cached_playlist_page(playlist_id, page_token, max_results)
             except Exception:
                 cached = None
+            if cached is None and self.library is not None and self.library.is_library_token(page_token):
+                # Local pages were dropped as stale; start over from the API.
+                page_token = None
             if cached is not None:
                 try:
                     print(f"[Cache] Using cached page for playlist {playlist_id}")
@@ -1242,22 +1435,6 @@ class MainPage(tk.Frame):
                 except Exception:
                     pass
                 return
-            try:
-                import threading as _t_wd, time as _t
-                def _watchdog(pid):
-                    try:
-                        _t.sleep(12)
-                        if self._last_open_playlist_id == pid and not self.current_videos:
-                            print(f"[Watchdog] No videos loaded for {pid} within timeout")
-                            try:
-                                self.after(0, lambda p=pid: self.highlight_videos_for_playlist(p))
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-                _t_wd.Thread(target=_watchdog, args=(playlist_id,), daemon=True).start()
-            except Exception:
-                pass
             def _worker_open(mr):
                 try:
                     import time as _t0
@@ -1265,26 +1442,20 @@ class MainPage(tk.Frame):
                     print(f"[WorkerOpen] start pid={playlist_id} token={page_token} mr={mr}")
                 except Exception:
                     pass
+                # Transient failures are retried with backoff inside the API layer.
                 try:
                     resp = self.controller.playlist_handler.get_videos(playlist_id, page_token, max_results=mr)
-                except Exception as e1:
+                except Exception as e:
                     try:
-                        print(f"[WorkerOpen] first attempt failed: {e1}")
+                        self.ui.post(lambda err=e: self._log(f"Failed to load playlist {playlist_id}: {err}"))
                     except Exception:
                         pass
                     try:
-                        resp = self.controller.playlist_handler.get_videos(playlist_id, page_token, max_results=max(5, int(mr/2)))
-                    except Exception as e2:
-                        try:
-                            self._log(f"Failed to load playlist {playlist_id}: {e2}")
-                        except Exception:
-                            pass
-                        try:
-                            print(f"[WorkerOpen] fallback to highlight for pid={playlist_id}")
-                            self.after(0, lambda pid=playlist_id: self.highlight_videos_for_playlist(pid))
-                        except Exception:
-                            pass
-                        return
+                        print(f"[WorkerOpen] fallback to highlight for pid={playlist_id}")
+                        self.ui.post(lambda pid=playlist_id: self.highlight_videos_for_playlist(pid))
+                    except Exception:
+                        pass
+                    return
                 try:
                     self.current_videos = resp.get("videos", [])
                     self.current_page_token = resp.get("nextPageToken")
@@ -1325,9 +1496,9 @@ class MainPage(tk.Frame):
                         self._preview_only_hits = False
                     except Exception:
                         pass
-                    self.after(0, lambda: self._render_playlist_videos(total_videos))
+                    self.ui.post(lambda: self._render_playlist_videos(total_videos))
                     try:
-                        self.after(0, lambda: self._show_playlist_listing_popup(playlist_id, self.current_videos))
+                        self.ui.post(lambda: self._show_playlist_listing_popup(playlist_id, self.current_videos))
                     except Exception:
                         pass
                 except Exception:
@@ -1398,17 +1569,15 @@ class MainPage(tk.Frame):
             messagebox.showerror("Error", f"Failed to fetch videos: {e}")
 
     def _render_playlist_videos(self, total_videos):
-        try:
-            self.video.video_tree.delete(*self.video.video_tree.get_children())
-        except Exception:
-            pass
+        rows = []
         hit_count = 0
+        shown = list(self.current_videos or [])
         ql = (self.video_search_query or '').strip().lower()
         try:
             print(f"[Playlist] {self.current_playlist_info.get('title','')} ({self.current_playlist_info.get('id','')})")
         except Exception:
             pass
-        for video in list(self.current_videos or []):
+        for video in shown:
             try:
                 vid = video.get('videoId')
                 ttl = str(video.get('title', '')).lower()
@@ -1425,7 +1594,7 @@ class MainPage(tk.Frame):
                         row = (f"★ {row[0]}",) + row[1:]
                     except Exception:
                         pass
-                self.video.video_tree.insert("", "end", values=row, tags=tags)
+                rows.append((row, tags))
                 try:
                     pub = self._fmt_date(video.get('published',''))
                     vs = video.get('views','')
@@ -1435,9 +1604,16 @@ class MainPage(tk.Frame):
                     pass
             except Exception:
                 try:
-                    self.video.video_tree.insert("", "end", values=self._video_row(video))
+                    rows.append((self._video_row(video), ()))
                 except Exception:
                     pass
+        try:
+            self._clear_filter_box()
+            self.video_view.show(shown)
+            self.video._panel.set_rows(rows)
+            self._reset_highlights(hits=[v.get('videoId') for v, (_, tags) in zip(shown, rows) if tags])
+        except Exception:
+            pass
         try:
             self.status_bar.configure(text=f"Highlighted {hit_count} matched videos in playlist")
         except Exception:
@@ -1488,9 +1664,7 @@ class MainPage(tk.Frame):
             val = str(v.get(key, ""))
             if ql in val.lower():
                 items.append(v)
-        self.video.video_tree.delete(*self.video.video_tree.get_children())
-        for v in items:
-            self.video.video_tree.insert('', 'end', values=self._video_row(v))
+        self._set_video_rows(items)
 
     def on_playlist_header_double_click(self, column_name, q=None):
         try:
@@ -1545,9 +1719,18 @@ class MainPage(tk.Frame):
             except Exception:
                 return
         self.video_sort_state[column_name] = not asc
-        self.video.video_tree.delete(*self.video.video_tree.get_children())
-        for v in self.current_videos:
-            self.video.video_tree.insert('', 'end', values=self._video_row(v))
+        if self.live_filter.active:
+            # Row positions changed; re-index and re-run the typed filter.
+            query = self.live_filter.query
+            self.live_filter.set_source(self.current_videos)
+            self.apply_live_filter(query)
+            self.prepare_live_filter()
+        elif self.video_view.is_filtered():
+            # Keep an active header filter: show the sorted subset only.
+            shown = {id(v) for v in self.video_view.rows}
+            self._set_video_rows([v for v in self.current_videos if id(v) in shown])
+        else:
+            self._set_video_rows(self.current_videos)
 
     def sort_playlists_by(self, column_name):
         idx_map = {"No": 0, "Title": 1, "Channel": 2, "Videos": 3, "Status": 4, "Actions": 5}
@@ -1592,10 +1775,23 @@ class MainPage(tk.Frame):
         except Exception:
             pass
 
+    def set_download_concurrency(self, workers=None, fragments=None):
+        """Set parallel videos and per-video fragments for the next download."""
+        try:
+            if workers is not None:
+                self.download_workers = max(1, int(workers))
+            if fragments is not None:
+                self.download_concurrent_fragments = max(1, int(fragments))
+        except Exception:
+            return
+        try:
+            self.status_bar.configure(text=f"Downloads: {self.download_workers} at once, {self.download_concurrent_fragments} fragments each")
+        except Exception:
+            pass
+
     def set_concurrent_fragments(self, n):
         try:
-            self.download_concurrent_fragments = int(n)
-            self.status_bar.configure(text=f"Concurrent fragments: {n}")
+            self.set_download_concurrency(fragments=int(n))
         except Exception:
             self.download_concurrent_fragments = 1
 
@@ -1619,12 +1815,11 @@ class MainPage(tk.Frame):
 
     def open_video(self, event):
         """Open the selected video in YouTube."""
-        selected_item = self.video.video_tree.selection()
-        if not selected_item:
+        selected_index = self.video._panel.selected_index()
+        video = self.video_view.video_at(selected_index)
+        if video is None:
             return
 
-        selected_index = self.video.video_tree.index(selected_item[0])
-        video = self.current_videos[selected_index]
         video_url = f"https://www.youtube.com/watch?v={video['videoId']}"
         webbrowser.open(video_url)
 
@@ -1638,12 +1833,46 @@ class MainPage(tk.Frame):
         except Exception:
             pass
 
+    def _with_full_playlist(self, on_done):
+        """Stream every video of the current playlist off the Tk thread.
+
+        Pages are prefetched in the background by Playlist.iter_playlist_pages;
+        on_done(videos) runs on the Tk thread once the walk finishes, or with
+        the currently loaded page if the walk fails.
+        """
+        pid = (self.current_playlist_info or {}).get('id')
+        if not pid:
+            on_done(list(self.current_videos or []))
+            return
+        fallback = list(self.current_videos or [])
+        def _worker():
+            videos = []
+            try:
+                for page in self.controller.playlist_handler.iter_playlist_pages(pid):
+                    videos.extend(page)
+                    self.ui.post_latest('full_playlist_progress', lambda n=len(videos): self.status_bar.configure(text=f"Loading playlist... {n} videos"))
+            except Exception as e:
+                try:
+                    self.ui.post(lambda err=e: self._log(f"Full playlist load failed for {pid}: {err}"))
+                except Exception:
+                    pass
+                videos = fallback
+            try:
+                self.ui.post(lambda: on_done(videos or fallback))
+            except Exception:
+                pass
+        import threading as _t
+        _t.Thread(target=_worker, daemon=True).start()
+
     def save_playlist(self):
         """Save the selected playlist details to a file."""
         if not self.current_playlist_info or not self.current_videos:
             messagebox.showerror("Error", "No playlist selected or no videos found.")
             return
 
+        self._with_full_playlist(self._write_saved_playlist)
+
+    def _write_saved_playlist(self, videos):
         playlist_title = self.current_playlist_info["title"]
         channel_title = self.current_playlist_info["channel"]
 
@@ -1657,7 +1886,7 @@ class MainPage(tk.Frame):
                 txtfile.write(f"Playlist: {playlist_title}\n")
                 txtfile.write(f"Channel: {channel_title}\n")
                 txtfile.write("\nVideos:\n")
-                for i, video in enumerate(self.current_videos, 1):
+                for i, video in enumerate(videos, 1):
                     txtfile.write(f"\n{i}. {video['title']}\n")
                     txtfile.write(f"   URL: https://www.youtube.com/watch?v={video['videoId']}\n")
 
@@ -1670,7 +1899,9 @@ class MainPage(tk.Frame):
         if not self.current_playlist_info or not self.current_videos:
             messagebox.showerror("Error", "No playlist selected or no videos found.")
             return
+        self._with_full_playlist(self._write_playlist_csv)
 
+    def _write_playlist_csv(self, videos):
         try:
             file_path = os.path.join(
                 self.controller.default_folder,
@@ -1680,7 +1911,7 @@ class MainPage(tk.Frame):
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(['Title', 'Video ID', 'URL', 'Duration'])
-                for video in self.current_videos:
+                for video in videos:
                     writer.writerow([
                         video['title'],
                         video['videoId'],
@@ -1697,7 +1928,9 @@ class MainPage(tk.Frame):
         if not self.current_playlist_info or not self.current_videos:
             messagebox.showerror("Error", "No playlist selected or no videos found.")
             return
+        self._with_full_playlist(self._write_playlist_txt)
 
+    def _write_playlist_txt(self, videos):
         try:
             file_path = os.path.join(
                 self.controller.default_folder,
@@ -1707,9 +1940,9 @@ class MainPage(tk.Frame):
             with open(file_path, 'w', encoding='utf-8') as txtfile:
                 txtfile.write(f"Playlist: {self.current_playlist_info['title']}\n")
                 txtfile.write(f"Channel: {self.current_playlist_info['channel']}\n")
-                txtfile.write(f"Total Videos: {len(self.current_videos)}\n\n")
+                txtfile.write(f"Total Videos: {len(videos)}\n\n")
                 
-                for i, video in enumerate(self.current_videos, 1):
+                for i, video in enumerate(videos, 1):
                     txtfile.write(f"{i}. {video['title']} ({video['duration']})\n")
                     txtfile.write(f"   https://www.youtube.com/watch?v={video['videoId']}\n\n")
 
@@ -1827,16 +2060,23 @@ class MainPage(tk.Frame):
                 print("Download cancelled by user")  # Debug print
                 return
 
-            # Start download with progress tracking
-            print("Creating download manager...")  # Debug print
-            download_manager = DownloadManager(
-                self, 
-                self.current_videos,
-                playlist_folder,
-                download_options.result
-            )
-            print("Starting download manager...")  # Debug print
-            download_manager.start()
+            options = dict(download_options.result)
+            self.set_download_concurrency(workers=options.get('workers'))
+            options['workers'] = self.download_workers
+            options['fragments'] = self.download_concurrent_fragments
+
+            # Start download with progress tracking once every video is listed
+            def _start(videos):
+                print("Creating download manager...")  # Debug print
+                download_manager = DownloadManager(
+                    self, 
+                    videos,
+                    playlist_folder,
+                    options
+                )
+                print("Starting download manager...")  # Debug print
+                download_manager.start()
+            self._with_full_playlist(_start)
             
         except Exception as e:
             print(f"Error in download process: {str(e)}")  # Debug print
@@ -1876,60 +2116,22 @@ class MainPage(tk.Frame):
                 mr = int(self.video.page_size_var.get())
             except Exception:
                 mr = 10
-            def _fetch(mr2):
-                return self.controller.playlist_handler.get_videos(playlist_id, None, max_results=mr2)
             try:
-                resp = _fetch(mr)
+                resp = self.controller.playlist_handler.get_videos(playlist_id, None, max_results=mr)
                 try:
                     self._cache_playlist_videos(playlist_id, None, resp)
                 except Exception:
                     pass
                 _printer(resp)
-            except Exception as e:
+            except Exception:
                 try:
-                    import ssl
-                    is_ssl = isinstance(e, ssl.SSLError) or ('SSL' in str(e))
+                    self.ui.post(lambda: self.status_bar.configure(text="Network issue; highlighted matches instead"))
                 except Exception:
-                    is_ssl = 'SSL' in str(e)
+                    pass
                 try:
-                    import socket
-                    is_timeout = isinstance(e, socket.timeout) or ('timed out' in str(e).lower())
+                    self.ui.post(lambda: self.highlight_videos_for_playlist(playlist_id))
                 except Exception:
-                    is_timeout = 'timed out' in str(e).lower()
-                if is_ssl or is_timeout:
-                    try:
-                        import time; time.sleep(0.3)
-                    except Exception:
-                        pass
-                    try:
-                        mr2 = max(5, int(mr // 2) or 10)
-                    except Exception:
-                        mr2 = 10
-                    try:
-                        resp = _fetch(mr2)
-                        try:
-                            self._cache_playlist_videos(playlist_id, None, resp)
-                        except Exception:
-                            pass
-                        _printer(resp)
-                    except Exception:
-                        try:
-                            self.after(0, lambda: self.status_bar.configure(text="Network issue; highlighted matches instead"))
-                        except Exception:
-                            pass
-                        try:
-                            self.after(0, lambda: self.highlight_videos_for_playlist(playlist_id))
-                        except Exception:
-                            pass
-                else:
-                    try:
-                        self.after(0, lambda: self.status_bar.configure(text="Network issue; highlighted matches instead"))
-                    except Exception:
-                        pass
-                    try:
-                        self.after(0, lambda: self.highlight_videos_for_playlist(playlist_id))
-                    except Exception:
-                        pass
+                    pass
         try:
             import threading as _t
             _t.Thread(target=_worker, daemon=True).start()
@@ -1974,10 +2176,7 @@ class MainPage(tk.Frame):
                 try:
                     resp = self.controller.playlist_handler.get_videos(playlist_id, None, max_results=mr)
                 except Exception:
-                    try:
-                        resp = self.controller.playlist_handler.get_videos(playlist_id, None, max_results=max(5, int(mr//2)))
-                    except Exception:
-                        resp = {'videos': [], 'nextPageToken': None, 'prevPageToken': None}
+                    resp = {'videos': [], 'nextPageToken': None, 'prevPageToken': None}
                 try:
                     self._cache_playlist_videos(playlist_id, None, resp)
                 except Exception:
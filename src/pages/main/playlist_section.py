@@ -14,6 +14,9 @@ class PlaylistSection(BaseSection):
 
     def setup_gui(self):
         """Initialize playlist section GUI components."""
+        # Playlists whose video counts are fetched in the next batch.
+        self._pending_counts = set()
+        self._count_flush_scheduled = False
         panel = TablePanel(self, columns=("No", "Title", "Channel", "Videos", "Status", "Actions"), show_page_size=False, size_label="Rows per page:")
         self._panel = panel
         self.playlist_tree = panel.tree
@@ -252,15 +255,11 @@ class PlaylistSection(BaseSection):
         playlist_id = playlist_data["playlistId"]
         
         # Use a default status of "Unknown" if we can't get details
+        vc = playlist_data.get("video_count")
+        if vc in (None, "N/A"):
+            # Counts are filled in later by one batched request for all rows.
+            self._queue_count_fetch(playlist_id)
         try:
-            # Ensure video_count is enriched when missing
-            vc = playlist_data.get("video_count")
-            if vc in (None, "N/A"):
-                try:
-                    vc = int(self.controller.playlist_handler.get_details(playlist_id))
-                    playlist_data["video_count"] = vc
-                except Exception:
-                    vc = "N/A"
             status = self.check_download_status(playlist_id, int(vc) if isinstance(vc, int) else 0)
         except Exception:
             status = "Unknown"
@@ -293,6 +292,54 @@ class PlaylistSection(BaseSection):
         except Exception:
             pass
 
+    def _queue_count_fetch(self, playlist_id):
+        self._pending_counts.add(playlist_id)
+        if self._count_flush_scheduled:
+            return
+        self._count_flush_scheduled = True
+        try:
+            self.after(50, self._flush_count_fetch)
+        except Exception:
+            self._count_flush_scheduled = False
+
+    def _flush_count_fetch(self):
+        self._count_flush_scheduled = False
+        ids = list(self._pending_counts)
+        self._pending_counts = set()
+        if not ids:
+            return
+        def _worker():
+            try:
+                counts = self.controller.playlist_handler.get_details_batch(ids)
+            except Exception:
+                counts = {}
+            try:
+                self.main_page.ui.post(lambda: self.apply_video_counts(ids, counts))
+            except Exception:
+                pass
+        import threading as _t
+        _t.Thread(target=_worker, daemon=True).start()
+
+    def apply_video_counts(self, playlist_ids, counts):
+        """Fill the Videos and Status columns for rows whose count arrived."""
+        for playlist_id in playlist_ids:
+            try:
+                if not self.playlist_tree.exists(playlist_id):
+                    continue
+                vals = list(self.playlist_tree.item(playlist_id).get('values', []))
+                vc = counts.get(playlist_id, "N/A")
+                try:
+                    status = self.check_download_status(playlist_id, int(vc) if isinstance(vc, int) else 0)
+                except Exception:
+                    status = "Unknown"
+                while len(vals) < 6:
+                    vals.append("")
+                vals[3] = vc
+                vals[4] = status
+                self.playlist_tree.item(playlist_id, values=tuple(vals))
+            except Exception:
+                pass
+
     def normalize_numbers(self):
         try:
             for iid in self.playlist_tree.get_children():
@@ -16,3 +16,4 @@ class SearchSection(BaseSection):
         self.search_entry = tk.Entry(row, width=40)
         self.search_entry.pack(side="left")
         ttk.Button(row, text="Search", command=lambda: self.main_page.execute_search_stable(self.search_entry.get(), self.mode_var.get())).pack(side="left", padx=(12, 0))
+        ttk.Button(row, text="Search Library", command=lambda: self.main_page.search_local(self.search_entry.get())).pack(side="left", padx=(6, 0))
@@ -1,5 +1,9 @@
 from tkinter import Label
 import tkinter as tk
+try:
+    from src.services.quota import get_default_meter
+except ModuleNotFoundError:
+    from services.quota import get_default_meter
 
 class StatusBar(Label):
     def __init__(self, main_page):
@@ -11,6 +15,32 @@ class StatusBar(Label):
 
     def setup_gui(self):
         self.configure(text="Ready", bd=1, relief=tk.SUNKEN, anchor=tk.W)
+        # Placed (not packed) so it never resizes the status text label.
+        self.quota_label = Label(self, text="", anchor=tk.E)
+        self.quota_label.place(relx=1.0, rely=0.5, anchor=tk.E)
+        self._quota_text = None
+        self.after(1000, self._refresh_quota)
+
+    def _refresh_quota(self):
+        try:
+            if not self.winfo_exists():
+                return
+            pool = getattr(self.controller, 'key_pool', None)
+            keys = pool.keys if pool is not None else (getattr(self.controller, 'api_key', '') or '')
+            meter = get_default_meter()
+            used = meter.used(keys)
+            text = f"Quota: {used:,}/{meter.limit(keys):,}"
+            if pool is not None and len(pool) > 1:
+                text += f" ({len(pool.available_keys())}/{len(pool)} keys)"
+            if text != self._quota_text:
+                self._quota_text = text
+                self.quota_label.configure(text=text, fg="#b00000" if meter.is_low(keys) else "black")
+        except Exception:
+            pass
+        try:
+            self.after(1000, self._refresh_quota)
+        except Exception:
+            pass
 
     def set_progress_ratio(self, done: int, total: int):
         return
@@ -3,8 +3,10 @@ from tkinter import ttk
 from .base_section import BaseSection
 try:
     from src.ui.table_panel import TablePanel
+    from src.config_manager import ConfigManager
 except ModuleNotFoundError:
     from ui.table_panel import TablePanel
+    from config_manager import ConfigManager
 
 class VideoSection(BaseSection):
     def setup_gui(self):
@@ -13,9 +15,10 @@ class VideoSection(BaseSection):
         self._title_playlist = "Videos in Playlist"
         self.configure(text=self._title_videos)
         self.pack(fill="both", expand=True, padx=10, pady=10)
+        self._create_filter_bar()
         
         cols = ("Title", "Playlist", "Channel", "Duration", "Published", "Views")
-        self._panel = TablePanel(self, columns=cols, show_page_size=True, size_label="Videos per page:")
+        self._panel = TablePanel(self, columns=cols, show_page_size=True, size_label="Videos per page:", virtual=ConfigManager.get_ui_virtual_tables())
         self.video_tree = self._panel.tree
         self._create_video_tree_styles()
         self._pagination = self._panel.pagination
@@ -28,6 +31,41 @@ class VideoSection(BaseSection):
         # Create action buttons
         self._create_action_buttons()
 
+    def _create_filter_bar(self):
+        bar = ttk.Frame(self)
+        bar.pack(fill="x", padx=5, pady=(0, 5))
+        ttk.Label(bar, text="Filter:").pack(side="left")
+        self.filter_var = tk.StringVar()
+        self._filter_silent = False
+        self.filter_entry = ttk.Entry(bar, textvariable=self.filter_var)
+        self.filter_entry.pack(side="left", fill="x", expand=True, padx=5)
+        self.filter_entry.bind("<FocusIn>", lambda e: self.main_page.prepare_live_filter())
+        self.filter_entry.bind("<Escape>", lambda e: self.filter_var.set(""))
+        self.filter_var.trace_add("write", self._on_filter_changed)
+
+    def _on_filter_changed(self, *args):
+        if self._filter_silent:
+            return
+        try:
+            self.main_page.apply_live_filter(self.filter_var.get())
+        except Exception:
+            pass
+
+    def reset_filter(self):
+        """Clear the filter box without re-filtering (the data was replaced)."""
+        self._filter_silent = True
+        try:
+            self.filter_var.set("")
+        finally:
+            self._filter_silent = False
+
+    def focus_filter(self):
+        try:
+            self.filter_entry.focus_set()
+            self.filter_entry.select_range(0, "end")
+        except Exception:
+            pass
+
     def _create_video_tree_styles(self):
         self.video_tree.column("Playlist", width=80, anchor="center")
         self.video_tree.column("Duration", width=100, anchor="center")
@@ -41,7 +79,7 @@ class VideoSection(BaseSection):
             self.video_tree.tag_configure('search_hit', background='#fff6bf')
         except Exception:
             pass
-        self.video_tree.bind('<<TreeviewSelect>>', self.main_page.on_video_select)
+        self._panel.bind_select(self.main_page.on_video_select)
         self.video_tree.bind("<Button-1>", self._on_video_click)
         self.video_tree.bind("<Double-1>", self._on_video_double)
         self._tooltip = None
@@ -137,7 +175,10 @@ class VideoSection(BaseSection):
             col = self.video_tree.identify_column(event.x)
             name_map = {"#1":"Title","#2":"Playlist","#3":"Channel","#4":"Duration","#5":"Published","#6":"Views"}
             name = name_map.get(str(col))
-            if name:
+            if name in ("Title", "Channel"):
+                # Title and channel are covered by the live filter box.
+                self.focus_filter()
+            elif name:
                 try:
                     import tkinter.simpledialog as simpledialog
                     q = simpledialog.askstring("Filter", f"Filter {name} contains:")
@@ -181,8 +222,8 @@ class VideoSection(BaseSection):
             if not iid:
                 self._hide_tooltip()
                 return
-            idx = self.video_tree.index(iid)
-            v = self.main_page.current_videos[idx] if idx < len(self.main_page.current_videos) else {}
+            idx = self._panel.row_index(iid)
+            v = self.main_page.video_view.video_at(idx) or {}
             vid = v.get('videoId')
             pid = v.get('playlistId') or self.main_page.video_playlist_cache.get(vid)
             title = ''
@@ -70,7 +70,7 @@ class SetupPage(tk.Frame):
             
         try:
             try:
-                Playlist(api_key).search_playlists("test", 1)
+                Playlist(api_key, use_cache=False).search_playlists("test", 1)
             except HttpError as err:
                 try:
                     data = json.loads(err.content.decode())
@@ -97,7 +97,7 @@ class SetupPage(tk.Frame):
             messagebox.showerror("Error", "Please enter a YouTube API key.")
             return
         try:
-            Playlist(api_key).search_playlists("test", 1)
+            Playlist(api_key, use_cache=False).search_playlists("test", 1)
             messagebox.showinfo("Success", "API key is valid.")
         except HttpError as err:
             try:
@@ -1,22 +1,127 @@
 import requests
-from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from datetime import timedelta
 import isodate
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+try:
+    from src.services.api_cache import get_default_cache
+    from src.services.youtube_service import get_service, get_http
+    from src.services.quota import get_default_meter
+    from src.services.key_pool import ApiKeyPool, is_quota_exceeded
+    from src.services.resilience import get_default_executor
+    from src.services.membership_cache import get_default_membership_cache
+    from src.services.library import get_default_library
+except ModuleNotFoundError:
+    from services.api_cache import get_default_cache
+    from services.youtube_service import get_service, get_http
+    from services.quota import get_default_meter
+    from services.key_pool import ApiKeyPool, is_quota_exceeded
+    from services.resilience import get_default_executor
+    from services.membership_cache import get_default_membership_cache
+    from services.library import get_default_library
+
+VIDEOS_LIST_MAX_IDS = 50
+VIDEO_DETAILS_FIELDS = "etag,items(id,contentDetails/duration,snippet/publishedAt,statistics/viewCount)"
+PLAYLIST_ITEMS_MAX_RESULTS = 50
+PLAYLISTS_LIST_MAX_IDS = 50
+PLAYLIST_DETAILS_FIELDS = "etag,items(id,contentDetails/itemCount)"
+PLAYLIST_STREAM_FIELDS = "etag,nextPageToken,items(snippet/title,snippet/channelTitle,snippet/position,contentDetails/videoId)"
+PLAYLIST_IDS_FIELDS = "etag,nextPageToken,items/contentDetails/videoId"
+_STREAM_DONE = object()
 
 class Playlist:
-    def __init__(self, api_key):
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
-        self._contains_cache = {}
+    def __init__(self, api_key, use_cache=True, key_pool=None):
+        self.keys = key_pool if key_pool is not None else ApiKeyPool([api_key])
+        self.api_key = api_key or self.keys.primary()
+        self.youtube = get_service(self.api_key)
+        self.membership = get_default_membership_cache()
+        self.library = get_default_library()
+        self._cache = get_default_cache() if use_cache else None
+        self.quota = get_default_meter()
+
+    def _list(self, resource, **params):
+        """Execute <resource>().list(**params), served from the response cache when fresh.
+
+        Stale entries are revalidated with If-None-Match; a 304 reply reuses the
+        cached body without re-downloading it.
+        """
+        endpoint = f"{resource}.list"
+        cache = self._cache
+        if cache is None:
+            return self._execute(endpoint, resource, params)
+        key = cache.make_key(endpoint, params)
+        try:
+            entry = cache.get(key)
+        except Exception:
+            entry = None
+        if entry is not None and entry.fresh:
+            return entry.body
+        etag = entry.etag if entry is not None else None
+        try:
+            response = self._execute(endpoint, resource, params, etag)
+        except HttpError as err:
+            if entry is not None and getattr(err.resp, 'status', None) == 304:
+                try:
+                    cache.touch(key)
+                except Exception:
+                    pass
+                return entry.body
+            raise
+        try:
+            cache.put(key, endpoint, response, response.get('etag'))
+        except Exception:
+            pass
+        return response
+
+    def _execute(self, endpoint, resource, params, etag=None):
+        """Send a request through the shared retry/circuit-breaker executor."""
+        return get_default_executor().call(self._send, endpoint, resource, params, etag)
+
+    def _send(self, endpoint, resource, params, etag=None):
+        """Send a request with the next pooled key over the calling thread's transport.
+
+        A key answering 403 quotaExceeded is cooled down until the quota reset
+        and the request is retried on the next available key.
+        """
+        attempts = max(1, len(self.keys))
+        for attempt in range(attempts):
+            api_key = self.keys.acquire()
+            request = getattr(get_service(api_key), resource)().list(**params)
+            if etag:
+                request.headers['If-None-Match'] = etag
+            try:
+                self.quota.record(api_key, endpoint)
+            except Exception:
+                pass
+            try:
+                return request.execute(http=get_http())
+            except HttpError as err:
+                if not is_quota_exceeded(err):
+                    raise
+                self.keys.mark_exhausted(api_key)
+                if attempt + 1 >= attempts:
+                    raise
+
+    def _remember(self, method, *args):
+        """Merge fetched data into the local library when library mode is on."""
+        if self.library is None:
+            return
+        try:
+            getattr(self.library, method)(*args)
+        except Exception:
+            pass
 
     def search_playlists(self, query, max_results=10):
         """Search for playlists matching the query."""
-        request = self.youtube.search().list(
+        response = self._list(
+            'search',
             part="snippet",
             maxResults=max_results,
             q=query,
             type="playlist"
         )
-        response = request.execute()
 
         playlists = []
         for item in response['items']:
@@ -27,23 +132,37 @@ class Playlist:
                 'thumbnail': item['snippet']['thumbnails']['default']['url']
             }
             playlists.append(playlist)
+        self._remember('record_playlists', playlists)
         return playlists
 
     def get_details(self, playlist_id):
         """Get the number of videos in a playlist."""
-        request = self.youtube.playlists().list(
-            part="contentDetails",
-            id=playlist_id
-        )
-        response = request.execute()
-        return response['items'][0]['contentDetails']['itemCount']
+        return self.get_details_batch([playlist_id])[playlist_id]
+
+    def get_details_batch(self, playlist_ids):
+        """Map playlist id -> video count with one playlists().list per 50 ids."""
+        ids = [i for i in dict.fromkeys(playlist_ids or []) if i]
+        counts = {}
+        for start in range(0, len(ids), PLAYLISTS_LIST_MAX_IDS):
+            chunk = ids[start:start + PLAYLISTS_LIST_MAX_IDS]
+            response = self._list(
+                'playlists',
+                part="contentDetails",
+                id=','.join(chunk),
+                maxResults=len(chunk),
+                fields=PLAYLIST_DETAILS_FIELDS
+            )
+            for item in response.get('items', []):
+                counts[item['id']] = item.get('contentDetails', {}).get('itemCount', 0)
+        self._remember('record_counts', counts)
+        return counts
 
     def get_playlist_info(self, playlist_id):
-        request = self.youtube.playlists().list(
+        response = self._list(
+            'playlists',
             part="snippet,contentDetails",
             id=playlist_id
         )
-        response = request.execute()
         items = response.get('items', [])
         if not items:
             return {'playlistId': playlist_id, 'title': '', 'channelTitle': '', 'video_count': 'N/A'}
@@ -55,19 +174,20 @@ class Playlist:
             count = int(count)
         except Exception:
             pass
-        return {'playlistId': playlist_id, 'title': title, 'channelTitle': channel, 'video_count': count}
+        info = {'playlistId': playlist_id, 'title': title, 'channelTitle': channel, 'video_count': count}
+        self._remember('record_playlists', [info])
+        return info
 
     def search_videos(self, query, max_results=10, page_token=None):
-        request = self.youtube.search().list(
+        response = self._list(
+            'search',
             part="snippet",
             maxResults=max_results,
             q=query,
             type="video",
             pageToken=page_token
         )
-        response = request.execute()
         video_ids = [item['id']['videoId'] for item in response.get('items', [])]
-        durations = self._get_video_durations(video_ids)
         details = self._get_video_details(video_ids)
         videos = []
         for item in response.get('items', []):
@@ -78,10 +198,11 @@ class Playlist:
                 'title': item['snippet']['title'],
                 'channelTitle': item['snippet'].get('channelTitle',''),
                 'channelId': item['snippet'].get('channelId',''),
-                'duration': durations.get(vid, 'N/A'),
+                'duration': d.get('duration', 'N/A'),
                 'published': d.get('published', ''),
                 'views': d.get('views', '0')
             })
+        self._remember('record_videos', videos)
         return {
             'videos': videos,
             'nextPageToken': response.get('nextPageToken'),
@@ -90,125 +211,208 @@ class Playlist:
 
     def get_videos(self, playlist_id, page_token=None, max_results=10):
         """Get videos from a playlist with pagination."""
-        request = self.youtube.playlistItems().list(
+        response = self._list(
+            'playlistItems',
             part="snippet,contentDetails",
             playlistId=playlist_id,
             maxResults=max_results,
             pageToken=page_token
         )
-        response = request.execute()
 
         video_ids = [item['contentDetails']['videoId'] for item in response['items']]
-        durations = self._get_video_durations(video_ids)
         details = self._get_video_details(video_ids)
+        videos = self._build_videos(response['items'], details)
+        self._remember('record_page', playlist_id, videos, self._positions(response['items']))
 
+        return {
+            'videos': videos,
+            'nextPageToken': response.get('nextPageToken'),
+            'prevPageToken': response.get('prevPageToken')
+        }
+
+    @staticmethod
+    def _positions(items):
+        return [item.get('snippet', {}).get('position') for item in items]
+
+    def _build_videos(self, items, details):
         videos = []
-        for item in response['items']:
+        for item in items:
             video_id = item['contentDetails']['videoId']
             d = details.get(video_id, {})
             video = {
                 'videoId': video_id,
                 'title': item['snippet']['title'],
                 'channelTitle': item['snippet'].get('channelTitle', ''),
-                'duration': durations.get(video_id, 'N/A'),
+                'duration': d.get('duration', 'N/A'),
                 'published': d.get('published', ''),
                 'views': d.get('views', '0')
             }
             videos.append(video)
+        return videos
 
-        return {
-            'videos': videos,
-            'nextPageToken': response.get('nextPageToken'),
-            'prevPageToken': response.get('prevPageToken')
-        }
+    def iter_playlist_pages(self, playlist_id, prefetch=2):
+        """Stream every page of a playlist as lists of video dicts.
 
-    def _get_video_durations(self, video_ids):
-        """Get durations for a list of videos."""
-        if not video_ids:
-            return {}
+        A background thread walks nextPageToken and keeps up to `prefetch`
+        pages queued ahead of the consumer; each page's details are fetched
+        on a small pool as soon as the page arrives, so enrichment of
+        several pages overlaps. Closing the generator stops the producer.
+        """
+        prefetch = max(1, int(prefetch or 1))
+        pages = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        enrich = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix='enrich')
 
-        request = self.youtube.videos().list(
-            part="contentDetails",
-            id=','.join(video_ids)
-        )
-        response = request.execute()
+        def _put(entry):
+            while not stop.is_set():
+                try:
+                    pages.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
 
-        durations = {}
-        for item in response['items']:
-            duration = isodate.parse_duration(item['contentDetails']['duration'])
-            formatted = str(timedelta(seconds=int(duration.total_seconds())))
-            if formatted.startswith('0:'):  # Remove leading 0 hour
-                formatted = formatted[2:]
-            durations[item['id']] = formatted
+        def _producer():
+            token = None
+            try:
+                while not stop.is_set():
+                    response = self._list(
+                        'playlistItems',
+                        part="snippet,contentDetails",
+                        playlistId=playlist_id,
+                        maxResults=PLAYLIST_ITEMS_MAX_RESULTS,
+                        pageToken=token,
+                        fields=PLAYLIST_STREAM_FIELDS
+                    )
+                    items = [i for i in response.get('items', []) if i.get('contentDetails', {}).get('videoId')]
+                    ids = [i['contentDetails']['videoId'] for i in items]
+                    if not _put((items, enrich.submit(self._get_video_details, ids))):
+                        return
+                    token = response.get('nextPageToken')
+                    if not token:
+                        break
+            except Exception as e:
+                _put(e)
+            _put(_STREAM_DONE)
+
+        threading.Thread(target=_producer, daemon=True).start()
+        try:
+            while True:
+                entry = pages.get()
+                if entry is _STREAM_DONE:
+                    return
+                if isinstance(entry, Exception):
+                    raise entry
+                items, future = entry
+                try:
+                    details = future.result()
+                except Exception:
+                    details = {}
+                videos = self._build_videos(items, details)
+                self._remember('record_page', playlist_id, videos, self._positions(items))
+                yield videos
+        finally:
+            stop.set()
+            enrich.shutdown(wait=False)
 
-        return durations 
+    def iter_playlist_videos(self, playlist_id, prefetch=2):
+        """Yield every video of a playlist, prefetching pages in the background."""
+        for page in self.iter_playlist_pages(playlist_id, prefetch=prefetch):
+            yield from page
 
     def _get_video_details(self, video_ids):
-        if not video_ids:
-            return {}
-        request = self.youtube.videos().list(
-            part="contentDetails,snippet,statistics",
-            id=','.join(video_ids)
-        )
-        response = request.execute()
+        """Fetch duration, publish date and views for videos in one enrichment pass.
+
+        videos().list accepts at most 50 ids per call, so ids are requested in
+        chunks and only the fields rendered by the tables are returned.
+        """
+        ids = [i for i in dict.fromkeys(video_ids or []) if i]
         result = {}
-        for item in response.get('items', []):
-            try:
-                dur = isodate.parse_duration(item['contentDetails']['duration'])
-                duration = str(timedelta(seconds=int(dur.total_seconds())))
-                if duration.startswith('0:'):
-                    duration = duration[2:]
-            except Exception:
-                duration = 'N/A'
-            published = item.get('snippet', {}).get('publishedAt', '')
-            views = item.get('statistics', {}).get('viewCount', '0')
-            result[item['id']] = {
-                'duration': duration,
-                'published': published,
-                'views': views
-            }
+        for start in range(0, len(ids), VIDEOS_LIST_MAX_IDS):
+            chunk = ids[start:start + VIDEOS_LIST_MAX_IDS]
+            response = self._list(
+                'videos',
+                part="contentDetails,snippet,statistics",
+                id=','.join(chunk),
+                fields=VIDEO_DETAILS_FIELDS
+            )
+            for item in response.get('items', []):
+                published = item.get('snippet', {}).get('publishedAt', '')
+                views = item.get('statistics', {}).get('viewCount', '0')
+                result[item['id']] = {
+                    'duration': self._format_duration(item.get('contentDetails', {}).get('duration')),
+                    'published': published,
+                    'views': views
+                }
         return result
 
+    @staticmethod
+    def _format_duration(value):
+        try:
+            dur = isodate.parse_duration(value)
+            duration = str(timedelta(seconds=int(dur.total_seconds())))
+            if duration.startswith('0:'):  # Remove leading 0 hour
+                duration = duration[2:]
+            return duration
+        except Exception:
+            return 'N/A'
+
     def get_channel_playlists(self, channel_id, max_results=10):
-        request = self.youtube.playlists().list(
+        response = self._list(
+            'playlists',
             part="snippet,contentDetails",
             channelId=channel_id,
             maxResults=max_results
         )
-        response = request.execute()
         playlists = []
         for item in response.get('items', []):
             playlists.append({
                 'playlistId': item['id'],
                 'title': item['snippet']['title'],
                 'channelTitle': item['snippet']['channelTitle'],
+                'video_count': item.get('contentDetails', {}).get('itemCount', 'N/A'),
             })
+        self._remember('record_playlists', playlists)
         return playlists
 
-    def playlist_contains_video(self, playlist_id, video_id):
-        if not playlist_id or not video_id:
-            return False
-        key = (playlist_id, video_id)
+    def get_playlist_video_ids_page(self, playlist_id, page_token=None):
+        """Fetch one page (up to 50) of video ids; returns (ids, nextPageToken)."""
+        response = self._list(
+            'playlistItems',
+            part="contentDetails",
+            playlistId=playlist_id,
+            maxResults=50,
+            pageToken=page_token,
+            fields=PLAYLIST_IDS_FIELDS
+        )
+        ids = []
+        for item in response.get('items', []):
+            vid = item.get('contentDetails', {}).get('videoId')
+            if vid:
+                ids.append(vid)
         try:
-            cached = self._contains_cache.get(key)
-            if cached is not None:
-                return cached
+            self.membership.put_members(playlist_id, ids)
         except Exception:
             pass
+        return ids, response.get('nextPageToken')
+
+    def playlist_contains_video(self, playlist_id, video_id):
+        if not playlist_id or not video_id:
+            return False
+        cached = self.membership.get(playlist_id, video_id)
+        if cached is not None:
+            return cached
         try:
-            resp = self.youtube.playlistItems().list(
+            resp = self._list(
+                'playlistItems',
                 part="id",
                 playlistId=playlist_id,
                 videoId=video_id,
                 maxResults=1
-            ).execute()
+            )
             has = len(resp.get('items', [])) > 0
         except Exception:
-            has = False
-        try:
-            if len(self._contains_cache) > 4000:
-                self._contains_cache.clear()
-            self._contains_cache[key] = has
-        except Exception:
-            pass
+            # Errors are not answers; leave the pair uncached.
+            return False
+        self.membership.put(playlist_id, video_id, has)
         return has
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+try:
+    from src.config_manager import ConfigManager
+except ModuleNotFoundError:
+    from config_manager import ConfigManager
+
+# ApiResponseCache keeps YouTube Data API responses on disk so that a query
+# re-opened in a later session is served locally. Entries are keyed by
+# endpoint plus normalized request params, expire per endpoint TTL and keep
+# the response ETag so stale entries can be revalidated with If-None-Match.
+# Total size is bounded; least recently used entries are evicted first.
+
+DEFAULT_TTLS = {
+    'search.list': 6 * 3600,
+    'playlists.list': 3600,
+    'playlistItems.list': 1800,
+    'videos.list': 6 * 3600,
+}
+DEFAULT_TTL = 1800
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Params that do not change the response body and must not split the cache.
+_IGNORED_PARAMS = ('key', 'developerKey')
+
+
+class CacheEntry:
+    __slots__ = ('body', 'etag', 'fresh')
+
+    def __init__(self, body: Dict[str, Any], etag: Optional[str], fresh: bool):
+        self.body = body
+        self.etag = etag
+        self.fresh = fresh
+
+
+class ApiResponseCache:
+    def __init__(self, path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES, ttls: Optional[Dict[str, int]] = None):
+        self.path = path or os.path.join(ConfigManager.get_data_dir(), 'api_cache.sqlite3')
+        self.max_bytes = max(int(max_bytes or 0), 0)
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('CREATE TABLE IF NOT EXISTS responses (cache_key TEXT PRIMARY KEY, endpoint TEXT, etag TEXT, body TEXT, size INTEGER, fetched_at REAL, last_access REAL)')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)')
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any]) -> str:
+        norm = {}
+        for k, v in (params or {}).items():
+            if v is None or k in _IGNORED_PARAMS:
+                continue
+            norm[k] = v if isinstance(v, (int, float, bool)) else str(v)
+        raw = json.dumps([endpoint, norm], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def ttl_for(self, endpoint: str) -> int:
+        return int(self.ttls.get(endpoint, DEFAULT_TTL))
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self.conn.execute('SELECT endpoint, etag, body, fetched_at FROM responses WHERE cache_key=?', (key,)).fetchone()
+            if not row:
+                return None
+            now = time.time()
+            self.conn.execute('UPDATE responses SET last_access=? WHERE cache_key=?', (now, key))
+            self.conn.commit()
+        try:
+            body = json.loads(row[2])
+        except Exception:
+            return None
+        fresh = (now - float(row[3] or 0)) < self.ttl_for(row[0])
+        return CacheEntry(body, row[1], fresh)
+
+    def put(self, key: str, endpoint: str, body: Dict[str, Any], etag: Optional[str] = None) -> None:
+        if not self.max_bytes:
+            return
+        data = json.dumps(body, ensure_ascii=False)
+        size = len(data.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self.conn.execute('INSERT OR REPLACE INTO responses (cache_key, endpoint, etag, body, size, fetched_at, last_access) VALUES (?,?,?,?,?,?,?)', (
+                key, endpoint, etag, data, size, now, now
+            ))
+            self._evict_locked()
+            self.conn.commit()
+
+    def touch(self, key: str) -> None:
+        """Mark an entry fresh again after a 304 Not Modified revalidation."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute('UPDATE responses SET fetched_at=?, last_access=? WHERE cache_key=?', (now, now, key))
+            self.conn.commit()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self.conn.execute('DELETE FROM responses WHERE cache_key=?', (key,))
+            self.conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.conn.execute('DELETE FROM responses')
+            self.conn.commit()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return int(self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0])
+
+    def _evict_locked(self):
+        total = int(self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        cur = self.conn.execute('SELECT cache_key, size FROM responses ORDER BY last_access ASC')
+        victims = []
+        for key, size in cur.fetchall():
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= int(size or 0)
+        self.conn.executemany('DELETE FROM responses WHERE cache_key=?', victims)
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[ApiResponseCache]:
+    """Process-wide cache shared by every Playlist instance; None when disabled."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            max_bytes = ConfigManager.get_api_cache_max_bytes()
+            if max_bytes <= 0:
+                return None
+            try:
+                _default_cache = ApiResponseCache(max_bytes=max_bytes)
+            except Exception:
+                return None
+        return _default_cache
@@ -0,0 +1,135 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+try:
+    from src.config_manager import ConfigManager
+    from src.services.quota import get_default_meter
+except ModuleNotFoundError:
+    from config_manager import ConfigManager
+    from services.quota import get_default_meter
+
+# AsyncApiEngine runs blocking YouTube API calls from asyncio code so a scan
+# can keep many requests in flight. Every call passes a single concurrency
+# semaphore and a process-wide RateLimiter (requests/sec plus quota
+# units/day) before it is dispatched to the engine's I/O thread pool.
+# The quota bucket is sized from QuotaMeter for the keys in use (daily limit
+# per key, minus what was already spent today) via sync_quota().
+
+
+class QuotaBudgetExceeded(Exception):
+    """Raised when a call would wait longer than allowed for daily quota."""
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = max(float(rate), 1e-9)
+        self.capacity = max(float(capacity), 1.0)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._stamp = clock()
+        self._lock = threading.Lock()
+
+    def _refill_locked(self):
+        now = self._clock()
+        elapsed = max(0.0, now - self._stamp)
+        self._stamp = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens, returning how long the caller must wait before using them."""
+        with self._lock:
+            self._refill_locked()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def peek_wait(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            self._refill_locked()
+            missing = tokens - self._tokens
+            return max(0.0, missing / self.rate)
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill_locked()
+            return self._tokens
+
+    def reset(self, rate: float, capacity: float, tokens: float) -> None:
+        with self._lock:
+            self.rate = max(float(rate), 1e-9)
+            self.capacity = max(float(capacity), 1.0)
+            self._tokens = max(0.0, min(float(tokens), self.capacity))
+            self._stamp = self._clock()
+
+
+class RateLimiter:
+    def __init__(self, requests_per_second: float = 50.0, daily_quota_units: int = 10000, max_quota_wait: float = 5.0):
+        self.requests = TokenBucket(requests_per_second, max(1.0, requests_per_second))
+        self.quota = TokenBucket(daily_quota_units / 86400.0, daily_quota_units)
+        self.max_quota_wait = max_quota_wait
+
+    def set_quota(self, daily_units: int, remaining_units: int) -> None:
+        """Resize the quota bucket to daily_units holding remaining_units."""
+        daily_units = max(1, int(daily_units))
+        self.quota.reset(daily_units / 86400.0, daily_units, remaining_units)
+
+    def reserve(self, cost: int = 1) -> float:
+        if self.quota.peek_wait(cost) > self.max_quota_wait:
+            raise QuotaBudgetExceeded(f"Daily quota budget exhausted (need {cost} units)")
+        return max(self.quota.reserve(cost), self.requests.reserve(1))
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(daily_quota_units=ConfigManager.get_daily_quota_limit())
+        return _shared_limiter
+
+
+def sync_quota(limiter: RateLimiter, api_keys: List[str], meter=None) -> int:
+    """Size limiter's quota from today's recorded usage of api_keys; returns the units left."""
+    meter = meter or get_default_meter()
+    keys = list(api_keys or [])
+    remaining = meter.remaining(keys) if keys else 0
+    limiter.set_quota(meter.limit(keys), remaining)
+    return remaining
+
+
+class AsyncApiEngine:
+    def __init__(self, max_in_flight: int = 64, limiter: Optional[RateLimiter] = None):
+        self.max_in_flight = max(1, int(max_in_flight or 1))
+        self.limiter = limiter or get_shared_rate_limiter()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    async def call(self, fn: Callable[..., Any], *args, cost: int = 1, **kwargs) -> Any:
+        """Run a blocking API call once the limiter and the in-flight cap allow it."""
+        wait = self.limiter.reserve(cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        async with self._sem:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def run(self, coro_factory: Callable[[], Any]) -> Any:
+        """Run coro_factory() to completion on a private event loop."""
+        async def _main():
+            self._sem = asyncio.Semaphore(self.max_in_flight)
+            return await coro_factory()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix='api')
+        try:
+            return asyncio.run(_main())
+        finally:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._sem = None
@@ -0,0 +1,130 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set
+
+try:
+    from src.config_manager import ConfigManager
+    from src.services.download_scheduler import DONE, QUEUED, RUNNING
+except ModuleNotFoundError:
+    from config_manager import ConfigManager
+    from services.download_scheduler import DONE, QUEUED, RUNNING
+
+# DownloadJournal records every download job (one per target folder) and the
+# state of each of its videos: queued, running, done or failed with the
+# error. State changes are committed as they happen, so a job interrupted by
+# a crash or by closing the app can be reopened: finished videos are skipped
+# without touching the network, interrupted ones are queued again and
+# yt-dlp continues their .part files.
+#
+# Each folder also gets a yt-dlp download archive (ARCHIVE_NAME). yt-dlp
+# appends a line per finished video; open_job() reads it too, so videos
+# finished before the journal existed, or whose state was lost, are skipped
+# as well.
+
+ARCHIVE_NAME = '.download_archive.txt'
+
+
+def archive_path(folder: str) -> str:
+    return os.path.join(folder, ARCHIVE_NAME)
+
+
+def read_archive(path: str) -> Set[str]:
+    """YouTube video ids listed in a yt-dlp download archive."""
+    ids = set()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[0].lower() == 'youtube':
+                    ids.add(parts[1])
+    except Exception:
+        pass
+    return ids
+
+
+class DownloadJournal:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or ConfigManager.get_download_journal_path()
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, folder TEXT, created_at REAL, updated_at REAL)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS job_items (job_id TEXT, video_id TEXT, title TEXT, position INTEGER, state TEXT, error TEXT, attempts INTEGER DEFAULT 0, updated_at REAL, PRIMARY KEY (job_id, video_id))')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_job_items_state ON job_items(job_id, state)')
+        self.conn.commit()
+
+    @staticmethod
+    def job_id_for(folder: str) -> str:
+        return os.path.normcase(os.path.abspath(folder))
+
+    def open_job(self, folder: str, videos: Iterable[Dict]) -> Dict[str, str]:
+        """Register videos for the folder's job; returns videoId -> state.
+
+        Videos left running by an earlier session are queued again, and ids in
+        the folder's download archive are marked done.
+        """
+        job_id = self.job_id_for(folder)
+        archived = read_archive(archive_path(folder))
+        now = time.time()
+        rows = []
+        for pos, v in enumerate(videos or []):
+            vid = v.get('videoId') if isinstance(v, dict) else None
+            if vid:
+                rows.append((job_id, vid, v.get('title', ''), pos, QUEUED, now))
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute('INSERT OR IGNORE INTO jobs (job_id, folder, created_at, updated_at) VALUES (?,?,?,?)', (job_id, folder, now, now))
+            cur.execute('UPDATE jobs SET updated_at=? WHERE job_id=?', (now, job_id))
+            cur.executemany('INSERT OR IGNORE INTO job_items (job_id, video_id, title, position, state, updated_at) VALUES (?,?,?,?,?,?)', rows)
+            cur.execute('UPDATE job_items SET state=?, updated_at=? WHERE job_id=? AND state=?', (QUEUED, now, job_id, RUNNING))
+            if archived:
+                cur.executemany("UPDATE job_items SET state=?, error='', updated_at=? WHERE job_id=? AND video_id=? AND state<>?",
+                                [(DONE, now, job_id, vid, DONE) for vid in archived])
+            self.conn.commit()
+            found = cur.execute('SELECT video_id, state FROM job_items WHERE job_id=?', (job_id,)).fetchall()
+        return {vid: state for vid, state in found}
+
+    def mark(self, job_id: str, video_id: str, state: str, error: str = '') -> None:
+        now = time.time()
+        with self._lock:
+            if state == RUNNING:
+                self.conn.execute('UPDATE job_items SET state=?, error=?, attempts=attempts+1, updated_at=? WHERE job_id=? AND video_id=?', (state, error or '', now, job_id, video_id))
+            else:
+                self.conn.execute('UPDATE job_items SET state=?, error=?, updated_at=? WHERE job_id=? AND video_id=?', (state, error or '', now, job_id, video_id))
+            self.conn.commit()
+
+    def items(self, job_id: str) -> Dict[str, Dict]:
+        with self._lock:
+            rows = self.conn.execute('SELECT video_id, title, position, state, error, attempts FROM job_items WHERE job_id=? ORDER BY position', (job_id,)).fetchall()
+        return {r[0]: {'title': r[1], 'position': r[2], 'state': r[3], 'error': r[4] or '', 'attempts': r[5] or 0} for r in rows}
+
+    def forget(self, job_id: str) -> None:
+        with self._lock:
+            self.conn.execute('DELETE FROM job_items WHERE job_id=?', (job_id,))
+            self.conn.execute('DELETE FROM jobs WHERE job_id=?', (job_id,))
+            self.conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+
+
+_default_journal = None
+_default_lock = threading.Lock()
+
+
+def get_default_download_journal() -> Optional[DownloadJournal]:
+    global _default_journal
+    with _default_lock:
+        if _default_journal is None:
+            try:
+                _default_journal = DownloadJournal()
+            except Exception:
+                return None
+        return _default_journal
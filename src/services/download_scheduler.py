@@ -0,0 +1,309 @@
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+# DownloadScheduler runs a download queue on N worker threads. Each worker
+# calls make_worker() once and reuses what it returns for every item it
+# takes, so per-connection setup (a YoutubeDL instance with the shared
+# options) is paid per worker, not per video. Items are taken in queue order.
+#
+# Workers report progress(key, downloaded, total, filename) from their
+# download callables. yt-dlp calls it for every received chunk, so it only
+# appends the event to a deque (no lock). A meter thread folds the events
+# into the items every `refresh` seconds, computes rolling speeds and ETAs
+# over the last RATE_WINDOW seconds and publishes the result as `latest`,
+# which a UI reads at its own fixed rate; snapshot() folds and builds one on
+# demand. The first count of each file is its baseline, so bytes a resumed
+# .part already holds are not counted as received.
+#
+# cancel() stops workers from taking new items and makes progress() raise
+# DownloadCancelled, which aborts the transfers in flight. on_change(key,
+# state, error) is called on the worker threads after every state change
+# (the download journal).
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+DEFAULT_WORKERS = 3
+DEFAULT_REFRESH = 0.25
+RATE_WINDOW = 5.0
+
+_NO_FILE = object()
+
+
+class DownloadCancelled(Exception):
+    """Raised inside a download when the scheduler was cancelled."""
+
+
+class RateWindow:
+    """Bytes per second over the last `window` seconds of (time, total) samples."""
+
+    def __init__(self, window: float = RATE_WINDOW):
+        self.window = float(window)
+        self._samples: Deque[Tuple[float, int]] = deque()
+
+    def add(self, now: float, total: int) -> None:
+        samples = self._samples
+        if samples and samples[-1][0] == now:
+            samples[-1] = (now, total)
+        else:
+            samples.append((now, total))
+        while len(samples) > 2 and now - samples[1][0] >= self.window:
+            samples.popleft()
+
+    def rate(self, now: float) -> float:
+        samples = self._samples
+        if not samples:
+            return 0.0
+        start_t, start_total = samples[0]
+        last_total = samples[-1][1]
+        elapsed = now - start_t
+        if elapsed <= 0:
+            return 0.0
+        return max(0.0, (last_total - start_total) / elapsed)
+
+    def reset(self) -> None:
+        self._samples.clear()
+
+
+def _eta(remaining: int, rate: float) -> Optional[float]:
+    if remaining <= 0:
+        return 0.0
+    return remaining / rate if rate > 0 else None
+
+
+class DownloadItem:
+    # A video may arrive as several streams (video, then audio); bytes of
+    # finished streams are kept in done_bytes while the current one counts up.
+    # received counts only bytes transferred by this session; rates use it.
+    __slots__ = ('key', 'title', 'state', 'error', 'done_bytes', 'file', 'file_bytes', 'file_total', 'received', 'rate')
+
+    def __init__(self, key: str, title: str = ''):
+        self.key = key
+        self.title = title or key
+        self.state = QUEUED
+        self.error = ''
+        self.done_bytes = 0
+        self.file = _NO_FILE
+        self.file_bytes = 0
+        self.file_total = 0
+        self.received = 0
+        self.rate = RateWindow()
+
+    @property
+    def downloaded(self) -> int:
+        return self.done_bytes + self.file_bytes
+
+    @property
+    def total(self) -> int:
+        return self.done_bytes + self.file_total if self.file_total else 0
+
+    def fraction(self) -> float:
+        if self.state == DONE:
+            return 1.0
+        total = self.total
+        return min(1.0, self.downloaded / total) if total > 0 else 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            'key': self.key,
+            'title': self.title,
+            'state': self.state,
+            'downloaded': self.downloaded,
+            'total': self.total,
+            'fraction': self.fraction(),
+            'speed': 0.0,
+            'eta': None,
+            'error': self.error,
+        }
+
+
+class DownloadScheduler:
+    def __init__(self, make_worker: Callable[[], Callable[[str], None]], workers: int = DEFAULT_WORKERS,
+                 on_change: Optional[Callable[[str, str, str], None]] = None,
+                 refresh: float = DEFAULT_REFRESH, clock: Callable[[], float] = time.monotonic):
+        self.make_worker = make_worker
+        self.on_change = on_change
+        self.refresh = max(0.01, float(refresh))
+        self._clock = clock
+        self._events: Deque[Tuple] = deque()
+        self._rate = RateWindow()
+        self.latest: Optional[Dict] = None
+        self.workers = max(1, int(workers or 1))
+        self._items: Dict[str, DownloadItem] = {}
+        self._order: List[str] = []
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._cancelled = threading.Event()
+        self.received = 0
+
+    def add(self, key: str, title: str = '', done: bool = False) -> None:
+        """Queue key; done=True lists it as already finished without queueing it."""
+        with self._lock:
+            if not key or key in self._items:
+                return
+            item = self._items[key] = DownloadItem(key, title)
+            self._order.append(key)
+            if done:
+                item.state = DONE
+                return
+        self._queue.put(key)
+
+    def start(self) -> None:
+        count = min(self.workers, max(1, self._queue.qsize()))
+        for _ in range(count):
+            t = threading.Thread(target=self._work, daemon=True)
+            self._threads.append(t)
+            t.start()
+        self.latest = self.snapshot()
+        threading.Thread(target=self._meter, daemon=True).start()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        for t in list(self._threads):
+            t.join(timeout)
+
+    def run(self) -> None:
+        """Download everything on the worker threads and wait for them."""
+        self.start()
+        self.join()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def progress(self, key: str, downloaded: int, total: Optional[int] = None, filename: Optional[str] = None) -> None:
+        """Queue a byte count for a running item; raises DownloadCancelled after cancel()."""
+        if self._cancelled.is_set():
+            raise DownloadCancelled()
+        # deque.append is atomic; the meter thread folds these in.
+        self._events.append((key, downloaded, total, filename))
+
+    def _fold_locked(self) -> None:
+        events = self._events
+        while events:
+            key, downloaded, total, filename = events.popleft()
+            item = self._items.get(key)
+            if item is None:
+                continue
+            downloaded = max(0, int(downloaded or 0))
+            if filename != item.file:
+                if item.file is not _NO_FILE:
+                    item.done_bytes += item.file_bytes
+                # The first count of a file is the baseline: a resumed .part
+                # reports what is already on disk, which was not received now.
+                item.file, item.file_bytes, item.file_total = filename, downloaded, 0
+            received = max(0, downloaded - item.file_bytes)
+            self.received += received
+            item.received += received
+            item.file_bytes = downloaded
+            if total:
+                item.file_total = int(total)
+        # Stalled items get samples too, so their rate decays to zero.
+        now = self._clock()
+        self._rate.add(now, self.received)
+        for item in self._items.values():
+            if item.state == RUNNING:
+                item.rate.add(now, item.received)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            self._fold_locked()
+            now = self._clock()
+            items = []
+            for key in self._order:
+                item = self._items[key]
+                row = item.as_dict()
+                if item.state == RUNNING:
+                    rate = item.rate.rate(now)
+                    row['speed'] = rate
+                    if item.total:
+                        row['eta'] = _eta(item.total - item.downloaded, rate)
+                items.append(row)
+            counts = {state: 0 for state in (QUEUED, RUNNING, DONE, FAILED, CANCELLED)}
+            for row in items:
+                counts[row['state']] += 1
+            speed = self._rate.rate(now)
+            # Queued videos are assumed to be the size of the known ones.
+            sizes = [row['total'] for row in items if row['total']]
+            mean = sum(sizes) / len(sizes) if sizes else 0
+            remaining = sum(max(0, (row['total'] or mean) - row['downloaded']) for row in items if row['state'] in (RUNNING, QUEUED))
+            return {
+                'items': items,
+                'counts': counts,
+                'total': len(items),
+                'speed': speed,
+                'eta': _eta(int(remaining), speed) if mean else None,
+                'received': self.received,
+                'finished': counts[QUEUED] == 0 and counts[RUNNING] == 0,
+            }
+
+    def _set_state(self, key, state, error=''):
+        with self._lock:
+            item = self._items[key]
+            item.state = state
+            item.error = error
+            item.rate.reset()
+        if self.on_change is not None:
+            try:
+                self.on_change(key, state, error)
+            except Exception:
+                pass
+
+    def _meter(self):
+        while True:
+            time.sleep(self.refresh)
+            snap = self.snapshot()
+            self.latest = snap
+            if snap['finished'] and all(not t.is_alive() for t in self._threads):
+                return
+
+    def _next(self) -> Optional[str]:
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _work(self):
+        download = None
+        try:
+            while True:
+                key = self._next()
+                if key is None:
+                    break
+                if self._cancelled.is_set():
+                    self._set_state(key, CANCELLED)
+                    continue
+                if download is None:
+                    try:
+                        download = self.make_worker()
+                    except Exception as e:
+                        self._set_state(key, FAILED, str(e))
+                        continue
+                self._set_state(key, RUNNING)
+                try:
+                    download(key)
+                except DownloadCancelled:
+                    self._set_state(key, CANCELLED)
+                except Exception as e:
+                    if self._cancelled.is_set():
+                        self._set_state(key, CANCELLED)
+                    else:
+                        self._set_state(key, FAILED, str(e) or e.__class__.__name__)
+                else:
+                    self._set_state(key, DONE)
+        finally:
+            close = getattr(download, 'close', None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
@@ -0,0 +1,94 @@
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+try:
+    from src.services.quota import next_quota_reset
+except ModuleNotFoundError:
+    from services.quota import next_quota_reset
+
+# ApiKeyPool hands out API keys round-robin so concurrent requests spread
+# across every key we hold. A key that answers 403 quotaExceeded is put on
+# cooldown until the next quota reset and skipped until then.
+
+QUOTA_REASONS = ('quotaExceeded', 'dailyLimitExceeded')
+
+
+class AllKeysExhausted(Exception):
+    """Raised when every key in the pool is cooling down."""
+
+
+def error_reason(err) -> str:
+    try:
+        content = err.content.decode() if isinstance(err.content, bytes) else str(err.content)
+        data = json.loads(content)
+        return data.get('error', {}).get('errors', [{}])[0].get('reason', '') or ''
+    except Exception:
+        return ''
+
+
+def is_quota_exceeded(err) -> bool:
+    status = getattr(getattr(err, 'resp', None), 'status', None)
+    return status == 403 and error_reason(err) in QUOTA_REASONS
+
+
+class ApiKeyPool:
+    def __init__(self, keys: List[str], clock: Callable[[], float] = time.time):
+        unique = []
+        for k in keys or []:
+            k = (k or '').strip()
+            if k and k not in unique:
+                unique.append(k)
+        self._keys = unique
+        self._clock = clock
+        self._cooldown: Dict[str, float] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[], None]] = []
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def primary(self) -> str:
+        return self._keys[0] if self._keys else ''
+
+    def available_keys(self) -> List[str]:
+        now = self._clock()
+        with self._lock:
+            return [k for k in self._keys if self._cooldown.get(k, 0) <= now]
+
+    def acquire(self) -> str:
+        now = self._clock()
+        with self._lock:
+            n = len(self._keys)
+            for i in range(n):
+                key = self._keys[(self._next + i) % n]
+                if self._cooldown.get(key, 0) <= now:
+                    self._next = (self._next + i + 1) % n
+                    return key
+        raise AllKeysExhausted("All API keys have exceeded their quota")
+
+    def mark_exhausted(self, key: str, until: Optional[float] = None) -> None:
+        with self._lock:
+            self._cooldown[key] = float(until if until is not None else next_quota_reset())
+            listeners = list(self._listeners)
+        for fn in listeners:
+            try:
+                fn()
+            except Exception:
+                pass
+
+    def add_listener(self, fn: Callable[[], None]) -> None:
+        """Call fn() whenever a key goes on cooldown."""
+        with self._lock:
+            self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[], None]) -> None:
+        with self._lock:
+            if fn in self._listeners:
+                self._listeners.remove(fn)
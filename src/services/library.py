@@ -0,0 +1,151 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+try:
+    from src.config_manager import ConfigManager
+except ModuleNotFoundError:
+    from config_manager import ConfigManager
+
+# Library is the offline-first layer over the datastore. Every video,
+# playlist and playlist membership the API returns is merged into the store,
+# and playlist pages are served back from it once a playlist is complete
+# locally (every counted video stored with its position). Pages served from
+# the store carry 'lib:' tokens so page flips stay local; callers revalidate
+# a served playlist in the background with check_freshness(), which compares
+# the stored count with the live itemCount and drops the playlist's rows when
+# they differ so the next open goes to the API.
+
+TOKEN_PREFIX = 'lib:'
+FRESHNESS_TTL = 600.0
+DEFAULT_PAGE_SIZE = 50
+
+
+class Library:
+    def __init__(self, store, freshness_ttl: float = FRESHNESS_TTL, clock: Callable[[], float] = time.monotonic):
+        self.store = store
+        self.freshness_ttl = float(freshness_ttl)
+        self._clock = clock
+        self._checked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_library_token(page_token: Optional[str]) -> bool:
+        return bool(page_token) and str(page_token).startswith(TOKEN_PREFIX)
+
+    def record_videos(self, videos: Iterable[Dict]) -> None:
+        videos = [v for v in videos or [] if isinstance(v, dict) and v.get('videoId')]
+        if videos:
+            self.store.merge_videos(videos)
+
+    def record_playlists(self, playlists: Iterable[Dict]) -> None:
+        playlists = [p for p in playlists or [] if isinstance(p, dict) and p.get('playlistId')]
+        if playlists:
+            self.store.merge_playlists(playlists)
+
+    def record_counts(self, counts: Dict[str, int]) -> None:
+        if counts:
+            self.store.set_playlist_video_counts(counts)
+
+    def record_page(self, playlist_id: str, videos: List[Dict], positions: Optional[List[Optional[int]]] = None) -> None:
+        """Store one fetched playlist page; positions align with videos."""
+        videos = [v for v in videos or [] if isinstance(v, dict)]
+        if not playlist_id or not videos:
+            return
+        self.record_videos(videos)
+        positions = list(positions or [])
+        links = []
+        for i, v in enumerate(videos):
+            pos = positions[i] if i < len(positions) else None
+            links.append((v.get('videoId'), pos))
+        self.store.link_videos_to_playlist(playlist_id, links)
+
+    def is_complete(self, playlist_id: str) -> bool:
+        info = self.store.get_playlist(playlist_id)
+        try:
+            total = int((info or {}).get('video_count'))
+        except Exception:
+            return False
+        return total > 0 and self.store.count_playlist_videos(playlist_id) >= total
+
+    def playlist_page(self, playlist_id: str, page_token: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Optional[Dict]:
+        """A page in Playlist.get_videos' shape, or None when the API must answer."""
+        if page_token and not self.is_library_token(page_token):
+            return None
+        if not page_token and not self.is_complete(playlist_id):
+            return None
+        cursor = page_token[len(TOKEN_PREFIX):] if page_token else None
+        page = self.store.get_playlist_videos_page(playlist_id, limit or DEFAULT_PAGE_SIZE, cursor)
+        if not page.get('videos') and page_token is None:
+            return None
+        for key in ('nextPageToken', 'prevPageToken'):
+            if page.get(key):
+                page[key] = TOKEN_PREFIX + page[key]
+        return page
+
+    def playlists_for_video(self, video_id: str) -> Set[str]:
+        if not video_id:
+            return set()
+        return set(self.store.get_video_playlist_ids(video_id))
+
+    def needs_check(self, playlist_id: str) -> bool:
+        """True at most once per freshness_ttl per playlist."""
+        now = self._clock()
+        with self._lock:
+            last = self._checked.get(playlist_id)
+            if last is not None and now - last < self.freshness_ttl:
+                return False
+            self._checked[playlist_id] = now
+            return True
+
+    def check_freshness(self, playlist_id: str, live_count: Callable[[], Optional[int]]) -> bool:
+        """Compare the stored count with live_count(); returns True when stale."""
+        try:
+            count = int(live_count())
+        except Exception:
+            return False
+        info = self.store.get_playlist(playlist_id) or {}
+        if info.get('video_count') == count and self.store.count_playlist_videos(playlist_id) == count:
+            return False
+        self.invalidate(playlist_id)
+        self.record_counts({playlist_id: count})
+        return True
+
+    def invalidate(self, playlist_id: str) -> None:
+        self.store.clear_playlist_videos(playlist_id)
+        with self._lock:
+            self._checked.pop(playlist_id, None)
+
+
+_default_library = None
+_default_lock = threading.Lock()
+
+
+def get_default_library() -> Optional[Library]:
+    """Process-wide library; None unless library mode is enabled."""
+    global _default_library
+    with _default_lock:
+        if _default_library is None:
+            if not ConfigManager.get_library_mode():
+                return None
+            try:
+                store = None
+                try:
+                    from src.data.factory import get_datastore
+                except ModuleNotFoundError:
+                    from data.factory import get_datastore
+                try:
+                    store = get_datastore()
+                except Exception:
+                    store = None
+                if not hasattr(store, 'get_playlist_videos_page'):
+                    # Only SqliteStore keeps the library tables.
+                    try:
+                        from src.data.sqlite_store import SqliteStore
+                    except ModuleNotFoundError:
+                        from data.sqlite_store import SqliteStore
+                    store = SqliteStore()
+                _default_library = Library(store)
+            except Exception:
+                return None
+        return _default_library
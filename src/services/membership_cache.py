@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    from src.config_manager import ConfigManager
+except ModuleNotFoundError:
+    from config_manager import ConfigManager
+
+# MembershipCache answers "is video V in playlist P?" for every Playlist
+# instance in the process. Entries live in a bounded LRU: the least recently
+# used pair is evicted one at a time instead of dropping everything at once.
+# Positive answers expire after POSITIVE_TTL, negative answers (which go stale
+# sooner, as playlists grow) after NEGATIVE_TTL. With a store attached
+# (SqliteStore's playlist_videos table), positive answers are written through
+# with the time they were fetched and looked up on a cold miss, so they
+# survive restarts but still expire POSITIVE_TTL after that time. A key that
+# expired in memory is not looked up again. Library mode attaches the store
+# too.
+
+DEFAULT_MAX_ENTRIES = 50000
+POSITIVE_TTL = 24 * 3600.0
+NEGATIVE_TTL = 3600.0
+
+
+class MembershipCache:
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, positive_ttl: float = POSITIVE_TTL, negative_ttl: float = NEGATIVE_TTL, store=None, clock: Callable[[], float] = time.monotonic, wall_clock: Callable[[], float] = time.time):
+        self.max_entries = max(1, int(max_entries))
+        self.positive_ttl = float(positive_ttl)
+        self.negative_ttl = float(negative_ttl)
+        self.store = store
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[bool, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._store_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+
+    def get(self, playlist_id: str, video_id: str) -> Optional[bool]:
+        """Return the cached answer, or None when it is unknown or expired."""
+        key = (playlist_id, video_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                has, expires = entry
+                if expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return has
+                del self._entries[key]
+                # Stored answers were written with this entry and are no fresher.
+                self.misses += 1
+                return None
+        expires = self._store_expires(playlist_id, video_id)
+        if expires is not None:
+            with self._lock:
+                self._put_locked(key, True, expires)
+                self.hits += 1
+                self.store_hits += 1
+            return True
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, playlist_id: str, video_id: str, has: bool, persist: bool = True) -> None:
+        ttl = self.positive_ttl if has else self.negative_ttl
+        with self._lock:
+            self._put_locked((playlist_id, video_id), bool(has), self._clock() + ttl)
+        if has and persist:
+            self._store_add([(playlist_id, video_id)])
+
+    def put_members(self, playlist_id: str, video_ids: Iterable[str]) -> None:
+        """Record a page of known members of a playlist."""
+        pairs = [(playlist_id, v) for v in video_ids if v]
+        if not pairs:
+            return
+        expires = self._clock() + self.positive_ttl
+        with self._lock:
+            for key in pairs:
+                self._put_locked(key, True, expires)
+        self._store_add(pairs)
+
+    def invalidate_playlist(self, playlist_id: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == playlist_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.store_hits = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'store_hits': self.store_hits,
+                'hit_rate': (self.hits / lookups) if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _put_locked(self, key, has, expires):
+        self._entries[key] = (has, expires)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _store_expires(self, playlist_id, video_id) -> Optional[float]:
+        """Expiry (on self._clock) of a stored positive answer still within its TTL."""
+        if self.store is None:
+            return None
+        try:
+            with self._store_lock:
+                fetched_at = self.store.playlist_video_fetched_at(playlist_id, video_id)
+        except Exception:
+            return None
+        if fetched_at is None:
+            return None
+        remaining = fetched_at + self.positive_ttl - self._wall_clock()
+        if remaining <= 0:
+            return None
+        return self._clock() + remaining
+
+    def _store_add(self, pairs):
+        if self.store is None:
+            return
+        try:
+            with self._store_lock:
+                self.store.add_playlist_memberships(pairs)
+        except Exception:
+            pass
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_default_membership_cache() -> MembershipCache:
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            store = None
+            try:
+                if ConfigManager.get_persistence_mode() == 'sqlite' or ConfigManager.get_library_mode():
+                    try:
+                        from src.data.sqlite_store import SqliteStore
+                    except ModuleNotFoundError:
+                        from data.sqlite_store import SqliteStore
+                    store = SqliteStore()
+            except Exception:
+                store = None
+            _default_cache = MembershipCache(store=store)
+        return _default_cache
@@ -0,0 +1,200 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# PlaylistPageCache holds the playlist pages MainPage has already fetched
+# (videos plus prev/next tokens, keyed by playlist and page token) and the
+# set of video ids seen per playlist, which membership checks and highlights
+# read. Every entry is charged its estimated size (serialized JSON bytes) and
+# the total is kept under max_bytes: least recently used pages are evicted
+# first, then least recently used id sets. restore() reads the
+# 'playlistPages'/'playlistIds' shape older last_videos_search.json files
+# carry; records()/load_records() are the page journal MainPage keeps on
+# disk instead.
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+FIRST_PAGE = '__first__'
+
+# Approximate JSON cost of one id in a list: quotes, comma and space.
+_ID_OVERHEAD = 4
+
+
+def _page_key(page_token: Optional[str]) -> str:
+    return page_token or FIRST_PAGE
+
+
+def estimate_bytes(value) -> int:
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8'))
+    except Exception:
+        return len(str(value))
+
+
+class PlaylistPageCache:
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max(int(max_bytes or 0), 0)
+        self._pages: "OrderedDict[Tuple[str, str], Tuple[List[Dict], Tuple[Optional[str], Optional[str]], int]]" = OrderedDict()
+        self._ids: "OrderedDict[str, Set[str]]" = OrderedDict()
+        self._id_bytes: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_page(self, playlist_id: str, page_token: Optional[str]) -> Optional[Dict]:
+        key = (playlist_id, _page_key(page_token))
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            videos, (prev_token, next_token), _ = entry
+            return {'videos': videos, 'prevPageToken': prev_token, 'nextPageToken': next_token}
+
+    def put_page(self, playlist_id: str, page_token: Optional[str], response: Dict, replace: bool = True) -> bool:
+        """Cache a page; with replace=False an already cached page is kept. Returns True when stored."""
+        if not playlist_id or not isinstance(response, dict):
+            return False
+        videos = list(response.get('videos') or [])
+        tokens = (response.get('prevPageToken'), response.get('nextPageToken'))
+        key = _page_key(page_token)
+        with self._lock:
+            if not replace and (playlist_id, key) in self._pages:
+                return False
+            self.add_video_ids(playlist_id, (v.get('videoId') for v in videos if isinstance(v, dict)))
+            self._put_page(playlist_id, key, videos, tokens)
+            return True
+
+    def video_ids(self, playlist_id: str) -> Optional[Set[str]]:
+        """Ids seen for playlist_id, or None when nothing is cached for it."""
+        with self._lock:
+            ids = self._ids.get(playlist_id)
+            if ids is not None:
+                self._ids.move_to_end(playlist_id)
+            return ids
+
+    def add_video_ids(self, playlist_id: str, video_ids: Iterable[str]) -> None:
+        with self._lock:
+            ids = self._ids.get(playlist_id)
+            if ids is None:
+                ids = self._ids[playlist_id] = set()
+                self._id_bytes[playlist_id] = 0
+            added = 0
+            for vid in video_ids:
+                if vid and vid not in ids:
+                    ids.add(vid)
+                    added += len(vid) + _ID_OVERHEAD
+            self._ids.move_to_end(playlist_id)
+            self._id_bytes[playlist_id] += added
+            self._bytes += added
+            self._evict_locked()
+
+    def set_video_ids(self, playlist_id: str, video_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._drop_ids_locked(playlist_id)
+            self.add_video_ids(playlist_id, video_ids)
+
+    def invalidate(self, playlist_id: str) -> None:
+        with self._lock:
+            for key in [k for k in self._pages if k[0] == playlist_id]:
+                self._bytes -= self._pages.pop(key)[2]
+            self._drop_ids_locked(playlist_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+            self._ids.clear()
+            self._id_bytes.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'pages': len(self._pages),
+                'playlists': len(self._ids),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / lookups) if lookups else 0.0,
+            }
+
+    def restore(self, pages: Optional[Dict] = None, ids: Optional[Dict] = None) -> None:
+        """Replace the contents with saved pages and ids; oversized data is trimmed."""
+        with self._lock:
+            self.clear()
+            for pid, s in (ids or {}).items() if isinstance(ids, dict) else ():
+                self.add_video_ids(pid, s or [])
+            for pid, cache in (pages or {}).items() if isinstance(pages, dict) else ():
+                if not isinstance(cache, dict):
+                    continue
+                tokens = cache.get('tokens') or {}
+                for key, videos in (cache.get('pages') or {}).items():
+                    tok = tokens.get(key) or (None, None)
+                    try:
+                        tok = (tok[0], tok[1])
+                    except Exception:
+                        tok = (None, None)
+                    videos = list(videos or [])
+                    self.add_video_ids(pid, (v.get('videoId') for v in videos if isinstance(v, dict)))
+                    self._put_page(pid, key, videos, tok)
+
+    def records(self) -> List[Dict]:
+        """Cached pages as journal records, least recently used first."""
+        with self._lock:
+            return [
+                {'playlistId': pid, 'pageToken': None if key == FIRST_PAGE else key, 'videos': list(videos), 'prevPageToken': tokens[0], 'nextPageToken': tokens[1]}
+                for (pid, key), (videos, tokens, _) in self._pages.items()
+            ]
+
+    def load_records(self, records: Iterable[Dict], replace: bool = True) -> None:
+        """Replay journal records; later records win and the ceiling applies.
+
+        With replace=False, pages already in the cache (fetched since the
+        journal was written) are kept and their records skipped.
+        """
+        latest: Dict[Tuple[str, str], Dict] = {}
+        for rec in records or ():
+            if isinstance(rec, dict) and rec.get('playlistId'):
+                key = (rec['playlistId'], _page_key(rec.get('pageToken')))
+                latest.pop(key, None)
+                latest[key] = rec
+        for rec in latest.values():
+            self.put_page(rec['playlistId'], rec.get('pageToken'), rec, replace=replace)
+
+    def _put_page(self, playlist_id, key, videos, tokens):
+        size = estimate_bytes(videos) + estimate_bytes(list(tokens))
+        with self._lock:
+            old = self._pages.pop((playlist_id, key), None)
+            if old is not None:
+                self._bytes -= old[2]
+            if size > self.max_bytes:
+                return
+            self._pages[(playlist_id, key)] = (videos, tokens, size)
+            self._bytes += size
+            self._evict_locked()
+
+    def _drop_ids_locked(self, playlist_id):
+        if self._ids.pop(playlist_id, None) is not None:
+            self._bytes -= self._id_bytes.pop(playlist_id, 0)
+
+    def _evict_locked(self):
+        while self._bytes > self.max_bytes and self._pages:
+            _, (_, _, size) = self._pages.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+        while self._bytes > self.max_bytes and self._ids:
+            pid, _ = self._ids.popitem(last=False)
+            self._bytes -= self._id_bytes.pop(pid, 0)
+            self.evictions += 1
@@ -0,0 +1,145 @@
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+try:
+    from src.config_manager import ConfigManager
+except ModuleNotFoundError:
+    from config_manager import ConfigManager
+
+# QuotaMeter accounts YouTube Data API quota units per API key per day.
+# Every request executed by Playlist is recorded against ENDPOINT_COSTS;
+# totals are persisted to data/quota_usage.json so the budget survives
+# restarts. Days roll over at midnight Pacific time, when Google resets quota.
+
+ENDPOINT_COSTS = {
+    'search.list': 100,
+    'playlists.list': 1,
+    'playlistItems.list': 1,
+    'videos.list': 1,
+    'channels.list': 1,
+}
+DEFAULT_COST = 1
+DEFAULT_DAILY_LIMIT = 10000
+LOW_BUDGET_RATIO = 0.1
+_SAVE_INTERVAL = 2.0
+
+
+def cost_of(endpoint: str) -> int:
+    return int(ENDPOINT_COSTS.get(endpoint, DEFAULT_COST))
+
+
+def _pacific(now: datetime) -> datetime:
+    try:
+        from zoneinfo import ZoneInfo
+        return now.astimezone(ZoneInfo('America/Los_Angeles'))
+    except Exception:
+        return now.astimezone(timezone(timedelta(hours=-8)))
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    return _pacific(now or datetime.now(timezone.utc)).strftime('%Y-%m-%d')
+
+
+def next_quota_reset(now: Optional[datetime] = None) -> float:
+    """Epoch seconds of the next midnight Pacific time."""
+    local = _pacific(now or datetime.now(timezone.utc))
+    midnight = (local + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return midnight.timestamp()
+
+
+def key_fingerprint(api_key: str) -> str:
+    # Raw keys are never written to disk.
+    return hashlib.sha1((api_key or '').encode('utf-8')).hexdigest()[:12]
+
+
+class QuotaMeter:
+    def __init__(self, path: Optional[str] = None, daily_limit: Optional[int] = None):
+        self.path = path or os.path.join(ConfigManager.get_data_dir(), 'quota_usage.json')
+        self.daily_limit = int(daily_limit or ConfigManager.get_daily_quota_limit())
+        self._lock = threading.Lock()
+        # Snapshots are numbered under _lock and written under _io_lock, so a
+        # flush that lost the race never replaces a newer file.
+        self._io_lock = threading.Lock()
+        self._seq = 0
+        self._written = 0
+        self._dirty = False
+        self._last_save = 0.0
+        data = ConfigManager.load_json(self.path) or {}
+        day = quota_day()
+        # Only today's totals matter; older days are dropped on load.
+        self._day = day
+        self._usage: Dict[str, Dict] = data.get(day, {}) if isinstance(data, dict) else {}
+
+    def _roll_locked(self):
+        day = quota_day()
+        if day != self._day:
+            self._day = day
+            self._usage = {}
+            self._dirty = True
+
+    def record(self, api_key: str, endpoint: str) -> int:
+        cost = cost_of(endpoint)
+        with self._lock:
+            self._roll_locked()
+            entry = self._usage.setdefault(key_fingerprint(api_key), {'units': 0, 'calls': {}})
+            entry['units'] = int(entry.get('units', 0)) + cost
+            calls = entry.setdefault('calls', {})
+            calls[endpoint] = int(calls.get(endpoint, 0)) + 1
+            self._dirty = True
+            due = (time.monotonic() - self._last_save) >= _SAVE_INTERVAL
+        if due:
+            self.flush()
+        return cost
+
+    # used/limit/remaining/is_low accept one key or a list of pooled keys.
+    @staticmethod
+    def _as_keys(api_keys) -> List[str]:
+        return [api_keys] if isinstance(api_keys, str) else list(api_keys or [])
+
+    def used(self, api_keys) -> int:
+        with self._lock:
+            self._roll_locked()
+            return sum(int(self._usage.get(key_fingerprint(k), {}).get('units', 0)) for k in self._as_keys(api_keys))
+
+    def limit(self, api_keys) -> int:
+        return self.daily_limit * max(1, len(self._as_keys(api_keys)))
+
+    def remaining(self, api_keys) -> int:
+        return max(0, self.limit(api_keys) - self.used(api_keys))
+
+    def is_low(self, api_keys, ratio: float = LOW_BUDGET_RATIO) -> bool:
+        return self.remaining(api_keys) <= int(self.limit(api_keys) * ratio)
+
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = {self._day: {k: {'units': v.get('units', 0), 'calls': dict(v.get('calls', {}))} for k, v in self._usage.items()}}
+            self._dirty = False
+            self._last_save = time.monotonic()
+            self._seq += 1
+            seq = self._seq
+        with self._io_lock:
+            if seq < self._written:
+                return
+            if ConfigManager.save_json(self.path, snapshot):
+                self._written = seq
+            else:
+                with self._lock:
+                    self._dirty = True
+
+
+_default_meter = None
+_default_lock = threading.Lock()
+
+
+def get_default_meter() -> QuotaMeter:
+    global _default_meter
+    with _default_lock:
+        if _default_meter is None:
+            _default_meter = QuotaMeter()
+        return _default_meter
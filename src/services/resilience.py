@@ -0,0 +1,133 @@
+import json
+import random
+import socket
+import ssl
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# Resilient request execution for the API layer: bounded retries with
+# decorrelated-jitter backoff for transient failures (5xx, timeouts,
+# rateLimitExceeded) and a circuit breaker that fails fast while the API
+# keeps failing, instead of hammering it and hanging the UI.
+
+TRANSIENT_STATUSES = (500, 502, 503, 504)
+TRANSIENT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded', 'backendError', 'internalError')
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the API while the circuit breaker is open."""
+
+
+def _reason(err) -> str:
+    try:
+        content = err.content.decode() if isinstance(err.content, bytes) else str(err.content)
+        return json.loads(content).get('error', {}).get('errors', [{}])[0].get('reason', '') or ''
+    except Exception:
+        return ''
+
+
+def is_transient(err: BaseException) -> bool:
+    status = getattr(getattr(err, 'resp', None), 'status', None)
+    if status is not None:
+        try:
+            status = int(status)
+        except Exception:
+            return False
+        if status in TRANSIENT_STATUSES:
+            return True
+        if status in (403, 429):
+            return _reason(err) in TRANSIENT_REASONS
+        return False
+    return isinstance(err, (socket.timeout, TimeoutError, ConnectionError, ssl.SSLError)) or 'timed out' in str(err).lower()
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+    def before_call(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_timeout - (self._clock() - self._opened_at)
+        if remaining > 0:
+            raise CircuitOpenError(f"YouTube API unavailable; retrying in {int(remaining) + 1}s")
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                # A failed half-open probe re-opens for another full timeout.
+                self._opened_at = self._clock()
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 8.0, rng: Callable[[], float] = random.random):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = float(base_delay)
+        self.max_delay = float(max_delay)
+        self._rng = rng
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: uniform(base, previous * 3), capped at max_delay."""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, self.base_delay + (upper - self.base_delay) * self._rng())
+
+
+class ResilientExecutor:
+    def __init__(self, policy: Optional[RetryPolicy] = None, breaker: Optional[CircuitBreaker] = None, sleep: Callable[[float], None] = time.sleep):
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self._sleep = sleep
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        delay = self.policy.base_delay
+        for attempt in range(1, self.policy.max_attempts + 1):
+            self.breaker.before_call()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as err:
+                if not is_transient(err):
+                    # The API answered (e.g. 304 or 404); it is not down.
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                if attempt >= self.policy.max_attempts:
+                    raise
+                delay = self.policy.next_delay(delay)
+                self._sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+
+_default_executor = None
+_default_lock = threading.Lock()
+
+
+def get_default_executor() -> ResilientExecutor:
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = ResilientExecutor()
+        return _default_executor
@@ -0,0 +1,180 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# SessionWriter persists session state from a background thread so the Tk
+# thread never serializes or touches disk. Two kinds of writes are queued:
+#
+# save(path, data)        whole-document snapshots (last_videos_search.json).
+#                         Only the newest pending document per path is kept;
+#                         it is written as compact JSON to a temp file in the
+#                         same directory and moved into place with os.replace,
+#                         so readers never see a partial file.
+# append(path, record)    one JSON line per record in an append-only journal
+#                         (the playlist page cache), so each write costs the
+#                         size of what changed. rewrite(path, records)
+#                         compacts a journal atomically.
+#
+# Writes are debounced: the writer waits for `delay` seconds without new
+# work (but no longer than `max_delay` after the first one) before flushing.
+# flush() writes everything pending on the calling thread.
+
+
+def write_atomic(path: str, text: str) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+        raise
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def read_journal(path: str) -> List[Dict[str, Any]]:
+    """Records of a journal in write order; a torn last line is skipped."""
+    records = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except Exception:
+                    continue
+    except Exception:
+        pass
+    return records
+
+
+class SessionWriter:
+    def __init__(self, delay: float = 0.5, max_delay: float = 3.0, clock: Callable[[], float] = time.monotonic):
+        self.delay = max(0.0, float(delay))
+        self.max_delay = max(self.delay, float(max_delay))
+        self._clock = clock
+        self._docs: Dict[str, Any] = {}
+        self._journals: Dict[str, Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._first = None
+        self._last = None
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0
+
+    def save(self, path: str, data: Any) -> None:
+        with self._cond:
+            self._docs[path] = data
+            self._touch_locked()
+
+    def append(self, path: str, record: Any) -> None:
+        with self._cond:
+            self._journal_locked(path)['append'].append(record)
+            self._touch_locked()
+
+    def rewrite(self, path: str, records: Iterable[Any]) -> None:
+        """Replace a journal; appends queued before this call are dropped."""
+        with self._cond:
+            self._journals[path] = {'rewrite': list(records), 'append': []}
+            self._touch_locked()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._docs) + len(self._journals)
+
+    def flush(self) -> None:
+        # Batches are taken under the I/O lock so concurrent flushes cannot
+        # reorder journal appends.
+        with self._io_lock:
+            with self._cond:
+                docs, self._docs = self._docs, {}
+                journals, self._journals = self._journals, {}
+                self._first = self._last = None
+            for path, data in docs.items():
+                try:
+                    write_atomic(path, self._serialize(data))
+                    self.writes += 1
+                except Exception:
+                    pass
+            for path, ops in journals.items():
+                try:
+                    if ops['rewrite'] is not None:
+                        write_atomic(path, ''.join(_dumps(r) + '\n' for r in ops['rewrite']))
+                        self.writes += 1
+                    if ops['append']:
+                        with open(path, 'a', encoding='utf-8') as f:
+                            f.write(''.join(_dumps(r) + '\n' for r in ops['append']))
+                        self.writes += 1
+                except Exception:
+                    pass
+
+    @staticmethod
+    def _serialize(data) -> str:
+        # Snapshots are serialized here, off the thread that queued them; a
+        # dict grown concurrently by the UI raises RuntimeError, so retry.
+        for _ in range(3):
+            try:
+                return _dumps(data)
+            except RuntimeError:
+                time.sleep(0.01)
+        return _dumps(data)
+
+    def _journal_locked(self, path):
+        ops = self._journals.get(path)
+        if ops is None:
+            ops = self._journals[path] = {'rewrite': None, 'append': []}
+        return ops
+
+    def _touch_locked(self):
+        now = self._clock()
+        if self._first is None:
+            self._first = now
+        self._last = now
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        self._cond.notify_all()
+
+    def _due_in_locked(self) -> Optional[float]:
+        if self._first is None:
+            return None
+        now = self._clock()
+        return max(0.0, min(self._last + self.delay, self._first + self.max_delay) - now)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                wait = self._due_in_locked()
+                while wait is None or wait > 0:
+                    self._cond.wait(timeout=wait)
+                    wait = self._due_in_locked()
+            self.flush()
+
+
+_default_writer = None
+_default_lock = threading.Lock()
+
+
+def get_default_session_writer() -> SessionWriter:
+    global _default_writer
+    with _default_lock:
+        if _default_writer is None:
+            _default_writer = SessionWriter()
+            atexit.register(_default_writer.flush)
+        return _default_writer
@@ -1,23 +1,42 @@
-from typing import Callable, List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+from typing import Callable, List, Dict, Any, Optional
 
 # VideoPlaylistScanner centralizes the logic that scans channel playlists
 # for each video result, maps videos to playlists, and reports progress.
 # It isolates this behavior from UI code so later UI refactors do not
 # impact the scanning/mapping functionality.
+#
+# Videos are grouped by channel so each channel's playlists are listed once.
+# Every candidate playlist is paged a single time into a video -> playlists
+# inverted index, and membership questions are answered from that index.
+# Requests run on an AsyncApiEngine, so many pages are in flight at once
+# while a shared semaphore and rate limiter keep the scan within budget.
+# The limiter's quota is sized from today's recorded usage of the keys that
+# are not cooling down, and resized whenever a key goes on cooldown. When the
+# budget runs out the scan stops issuing requests and reports it through
+# on_budget_exhausted; those playlists are not treated as merely truncated.
 
 try:
     from src.playlist import Playlist
+    from src.services.api_engine import AsyncApiEngine, QuotaBudgetExceeded, sync_quota
+    from src.services.quota import get_default_meter
 except ModuleNotFoundError:
     from playlist import Playlist
+    from services.api_engine import AsyncApiEngine, QuotaBudgetExceeded, sync_quota
+    from services.quota import get_default_meter
 
 
 class VideoPlaylistScanner:
-    def __init__(self, api_key: str, max_workers: int = 4, channel_playlist_limit: int = 50, prefetch_page_size: int = 10):
+    def __init__(self, api_key: str, max_in_flight: int = 64, channel_playlist_limit: int = 50, membership_page_limit: Optional[int] = 20, engine: Optional[AsyncApiEngine] = None, key_pool=None):
         self.api_key = api_key
-        self.max_workers = max_workers
+        self.key_pool = key_pool
+        self.max_in_flight = max_in_flight
+        self.engine = engine
+        self.budget_exhausted = False
         self.channel_playlist_limit = channel_playlist_limit
-        self.prefetch_page_size = prefetch_page_size
+        # Pages of 50 items walked per playlist when indexing; playlists longer
+        # than this fall back to a direct membership check.
+        self.membership_page_limit = membership_page_limit
 
     def scan(
         self,
@@ -26,88 +45,186 @@ class VideoPlaylistScanner:
         on_prefetch_page: Callable[[str], None],
         on_progress: Callable[[int, int], None],
         on_video_index: Callable[[str, str, int], None],
+        on_budget_exhausted: Optional[Callable[[], None]] = None,
     ) -> List[Dict[str, Any]]:
         """Scan playlists for a list of videos and report findings.
 
         Parameters:
         - videos: list of video dicts
-        - on_playlist_found: callback when a playlist contains the video; returns assigned index
+        - on_playlist_found: callback when a playlist contains a video; called once per playlist, returns assigned index
         - on_prefetch_page: callback to prefetch first page for a discovered playlist
         - on_progress: callback with (processed, total)
         - on_video_index: callback to update the video's playlist assignment (vid, pid, index)
+        - on_budget_exhausted: called once if the daily quota budget runs out mid-scan;
+          membership results are incomplete from then on
 
         Returns: list of discovered unique playlists
         """
+        engine = self.engine or AsyncApiEngine(max_in_flight=self.max_in_flight)
+        self.budget_exhausted = False
+        return engine.run(lambda: self._scan_async(engine, videos, on_playlist_found, on_prefetch_page, on_progress, on_video_index, on_budget_exhausted))
+
+    async def _scan_async(self, engine, videos, on_playlist_found, on_prefetch_page, on_progress, on_video_index, on_budget_exhausted=None):
+        ph = Playlist(self.api_key, key_pool=self.key_pool)
+
+        def _sync_quota():
+            try:
+                sync_quota(engine.limiter, ph.keys.available_keys())
+            except Exception:
+                pass
+        _sync_quota()
+        add_listener = getattr(ph.keys, 'add_listener', None)
+        if add_listener is not None:
+            add_listener(_sync_quota)
+        try:
+            return await self._scan_with(engine, ph, videos, on_playlist_found, on_prefetch_page, on_progress, on_video_index, on_budget_exhausted)
+        finally:
+            remove_listener = getattr(ph.keys, 'remove_listener', None)
+            if remove_listener is not None:
+                remove_listener(_sync_quota)
+
+    async def _scan_with(self, engine, ph, videos, on_playlist_found, on_prefetch_page, on_progress, on_video_index, on_budget_exhausted):
         total = len(videos or [])
         collected: List[Dict[str, Any]] = []
-        seen: set[str] = set()
+        found_index: Dict[str, Any] = {}
+        membership: Dict[str, List[str]] = {}
+        truncated: set[str] = set()
+        indexing: Dict[str, asyncio.Task] = {}
+        state = {'processed': 0}
+        # With little quota left, index only the first page of each playlist,
+        # skip per-pair fallback checks and page prefetches.
+        try:
+            budget_low = get_default_meter().is_low(ph.keys.keys)
+        except Exception:
+            budget_low = False
+        page_limit = 1 if budget_low else self.membership_page_limit
 
-        def _scan_one(v: Dict[str, Any]):
-            ph = Playlist(self.api_key)
+        by_channel: Dict[str, List[Dict[str, Any]]] = {}
+        skipped = 0
+        for v in (videos or []):
             vid = v.get('videoId')
             cid = v.get('channelId')
             if not vid or not cid:
-                return None
-            try:
-                chpls = ph.get_channel_playlists(cid, max_results=self.channel_playlist_limit)
-            except Exception:
-                chpls = []
-            first_index = None
-            first_plid = None
-            for pl in chpls:
-                plid = pl.get('playlistId')
-                if not plid:
-                    continue
-                try:
-                    has = ph.playlist_contains_video(plid, vid)
-                except Exception:
-                    has = False
-                if not has:
-                    continue
-                idx = on_playlist_found(pl)
+                skipped += 1
+                continue
+            by_channel.setdefault(cid, []).append(v)
+
+        # All callbacks run on the event loop thread, one at a time, so the
+        # shared dicts above need no locking.
+        def _exhausted():
+            if self.budget_exhausted:
+                return
+            self.budget_exhausted = True
+            if on_budget_exhausted is not None:
                 try:
-                    pid = plid
-                    if pid and pid not in seen:
-                        seen.add(pid)
-                        collected.append(pl)
+                    on_budget_exhausted()
                 except Exception:
                     pass
+
+        def _advance(n: int = 1):
+            state['processed'] += n
+            try:
+                on_progress(state['processed'], total)
+            except Exception:
+                pass
+
+        async def _page_playlist(plid: str):
+            token = None
+            pages = 0
+            while True:
+                if self.budget_exhausted:
+                    return
                 try:
-                    on_prefetch_page(plid)
+                    ids, token = await engine.call(ph.get_playlist_video_ids_page, plid, token)
+                except QuotaBudgetExceeded:
+                    _exhausted()
+                    return
                 except Exception:
-                    pass
-                if first_index is None and isinstance(idx, int):
-                    first_index = idx
-                    first_plid = plid
-            if first_index and first_plid:
+                    truncated.add(plid)
+                    return
+                for vid in ids:
+                    membership.setdefault(vid, []).append(plid)
+                pages += 1
+                if not token:
+                    return
+                if page_limit is not None and pages >= page_limit:
+                    truncated.add(plid)
+                    return
+
+        def _index_playlist(plid: str) -> asyncio.Task:
+            task = indexing.get(plid)
+            if task is None:
+                task = asyncio.ensure_future(_page_playlist(plid))
+                indexing[plid] = task
+            return task
+
+        async def _contains(plid: str, vid: str) -> bool:
+            if plid in membership.get(vid, ()):
+                return True
+            if plid not in truncated:
+                return False
+            if budget_low or self.budget_exhausted:
+                # Only what the shared membership cache already knows.
+                return bool(ph.membership.get(plid, vid))
+            try:
+                return await engine.call(ph.playlist_contains_video, plid, vid)
+            except QuotaBudgetExceeded:
+                _exhausted()
+                return bool(ph.membership.get(plid, vid))
+            except Exception:
+                return False
+
+        async def _found(pl: Dict[str, Any]):
+            plid = pl.get('playlistId')
+            if plid in found_index:
+                return found_index[plid]
+            idx = on_playlist_found(pl)
+            found_index[plid] = idx
+            collected.append(pl)
+            if budget_low or self.budget_exhausted:
+                return idx
+            try:
+                await engine.call(on_prefetch_page, plid, cost=2)
+            except QuotaBudgetExceeded:
+                _exhausted()
+            except Exception:
+                pass
+            return idx
+
+        async def _scan_channel(cid: str, chan_videos: List[Dict[str, Any]]):
+            chpls = []
+            if not self.budget_exhausted:
                 try:
-                    on_video_index(vid, first_plid, first_index)
+                    chpls = await engine.call(ph.get_channel_playlists, cid, max_results=self.channel_playlist_limit)
+                except QuotaBudgetExceeded:
+                    _exhausted()
                 except Exception:
-                    pass
-            return True
-
-        try:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
-                futs = [ex.submit(_scan_one, v) for v in (videos or [])]
-                processed = 0
-                for _ in as_completed(futs):
-                    processed += 1
+                    chpls = []
+            chpls = [pl for pl in chpls if pl.get('playlistId')]
+            await asyncio.gather(*[_index_playlist(pl['playlistId']) for pl in chpls], return_exceptions=True)
+            for v in chan_videos:
+                vid = v.get('videoId')
+                first_index = None
+                first_plid = None
+                for pl in chpls:
+                    plid = pl['playlistId']
+                    if not await _contains(plid, vid):
+                        continue
                     try:
-                        on_progress(processed, total)
+                        idx = await _found(pl)
+                    except Exception:
+                        idx = None
+                    if first_index is None and isinstance(idx, int):
+                        first_index = idx
+                        first_plid = plid
+                if first_index and first_plid:
+                    try:
+                        on_video_index(vid, first_plid, first_index)
                     except Exception:
                         pass
-        except Exception:
-            # Fallback sequential
-            processed = 0
-            for v in (videos or []):
-                try:
-                    _scan_one(v)
-                except Exception:
-                    pass
-                processed += 1
-                try:
-                    on_progress(processed, total)
-                except Exception:
-                    pass
+                _advance()
 
+        if skipped:
+            _advance(skipped)
+        await asyncio.gather(*[_scan_channel(cid, vs) for cid, vs in by_channel.items()], return_exceptions=True)
         return collected
@@ -0,0 +1,52 @@
+import threading
+
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.http import build_http
+
+# Process-wide YouTube Data API service factory. Building a client parses the
+# discovery document (and may fetch it over the network), so each API key is
+# built once from the discovery document bundled with google-api-python-client
+# and shared by every Playlist instance. httplib2 transports are not
+# thread-safe, so each worker thread executes requests on its own Http object.
+
+_services = {}
+_services_lock = threading.Lock()
+_discovery_doc = None
+_local = threading.local()
+
+
+def _load_discovery_document():
+    global _discovery_doc
+    if _discovery_doc is None:
+        try:
+            from googleapiclient.discovery_cache import get_static_doc
+            _discovery_doc = get_static_doc('youtube', 'v3')
+        except Exception:
+            _discovery_doc = None
+    return _discovery_doc
+
+
+def _build_service(api_key):
+    doc = _load_discovery_document()
+    if doc:
+        return build_from_document(doc, developerKey=api_key)
+    return build('youtube', 'v3', developerKey=api_key, cache_discovery=False)
+
+
+def get_service(api_key):
+    """Return the shared service for api_key, building it on first use."""
+    with _services_lock:
+        svc = _services.get(api_key)
+        if svc is None:
+            svc = _build_service(api_key)
+            _services[api_key] = svc
+        return svc
+
+
+def get_http():
+    """Return the calling thread's HTTP transport."""
+    http = getattr(_local, 'http', None)
+    if http is None:
+        http = build_http()
+        _local.http = http
+    return http
@@ -0,0 +1,117 @@
+from typing import Callable, Dict, Iterable, Optional, Set
+
+# HighlightEngine decides which Videos-table rows are starred for the pinned
+# playlist and reports only the rows whose state changes, so switching pins
+# or clearing costs O(changed rows) rather than a rewrite of the table.
+#
+# Row states: 'hit' (starred and tagged), 'tagged' (tagged by the initial
+# render, not starred) and plain (not tracked). Playlist membership comes
+# from two places: PlaylistMembershipMap (videoId -> playlistId as found by
+# scans and selections, with a reverse index) and a lookup for the
+# per-playlist id sets MainPage collects from fetched pages.
+
+HIT = 'hit'
+TAGGED = 'tagged'
+PLAIN = 'plain'
+
+
+class PlaylistMembershipMap(dict):
+    """videoId -> playlistId dict that also indexes videos per playlist."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._by_playlist: Dict[str, Set[str]] = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, video_id, playlist_id):
+        old = self.get(video_id)
+        if old is not None and old != playlist_id:
+            self._by_playlist.get(old, set()).discard(video_id)
+        super().__setitem__(video_id, playlist_id)
+        self._by_playlist.setdefault(playlist_id, set()).add(video_id)
+
+    def __delitem__(self, video_id):
+        old = self.get(video_id)
+        super().__delitem__(video_id)
+        self._by_playlist.get(old, set()).discard(video_id)
+
+    def pop(self, video_id, *default):
+        if video_id in self:
+            old = self[video_id]
+            self._by_playlist.get(old, set()).discard(video_id)
+        return super().pop(video_id, *default)
+
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def setdefault(self, video_id, playlist_id=None):
+        if video_id not in self:
+            self[video_id] = playlist_id
+        return self[video_id]
+
+    def clear(self):
+        super().clear()
+        self._by_playlist.clear()
+
+    def videos_in(self, playlist_id) -> Set[str]:
+        return self._by_playlist.get(playlist_id, set())
+
+
+class HighlightEngine:
+    def __init__(self, video_playlists: PlaylistMembershipMap, playlist_ids: Optional[Callable[[str], Optional[Set[str]]]] = None):
+        self.video_playlists = video_playlists
+        self.playlist_ids = playlist_ids or (lambda playlist_id: None)
+        self.visible: Set[str] = set()
+        self.states: Dict[str, str] = {}
+        self.pinned: Optional[str] = None
+
+    def reset(self, visible: Iterable[str], hits: Iterable[str] = (), tagged: Iterable[str] = ()) -> None:
+        """Start over after the table was re-rendered with the given row states."""
+        self.visible = set(v for v in visible if v)
+        self.states = {v: TAGGED for v in tagged if v}
+        self.states.update({v: HIT for v in hits if v})
+        self.pinned = None
+
+    def state(self, video_id: str) -> str:
+        return self.states.get(video_id, PLAIN)
+
+    def is_hit(self, video_id: str) -> bool:
+        return self.states.get(video_id) == HIT
+
+    def hits(self, playlist_id: str) -> Set[str]:
+        """Visible videos known to belong to playlist_id."""
+        found = set()
+        for members in (self.playlist_ids(playlist_id) or set(), self.video_playlists.videos_in(playlist_id)):
+            # Worker threads may add members meanwhile; iterate a copy.
+            members = list(members)
+            if len(members) < len(self.visible):
+                found.update(v for v in members if v in self.visible)
+            else:
+                members = set(members)
+                found.update(v for v in self.visible if v in members)
+        return found
+
+    def pin(self, playlist_id: str) -> Dict[str, str]:
+        """Star playlist_id's visible videos; returns {videoId: new_state} for changed rows."""
+        new_hits = self.hits(playlist_id)
+        changes = {v: HIT for v in new_hits if self.states.get(v) != HIT}
+        for v in self.states:
+            if v not in new_hits:
+                changes[v] = PLAIN
+        self._apply(changes)
+        self.pinned = playlist_id
+        return changes
+
+    def clear(self) -> Dict[str, str]:
+        changes = {v: PLAIN for v in self.states}
+        self._apply(changes)
+        self.pinned = None
+        return changes
+
+    def _apply(self, changes):
+        for v, st in changes.items():
+            if st == PLAIN:
+                self.states.pop(v, None)
+            else:
+                self.states[v] = st
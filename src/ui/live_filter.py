@@ -0,0 +1,125 @@
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+# LiveFilter answers "which rows contain this text?" fast enough to run on
+# every keystroke. prepare() builds a trigram index for the dataset
+# (each 3-character substring of a lowercased row text maps to the sorted
+# rows containing it); a query is answered by intersecting the posting lists
+# of its trigrams and confirming the substring on the few survivors. Queries
+# shorter than a trigram scan the lowercased texts. While the user keeps
+# typing, each new query contains the previous one, so it is answered by
+# re-checking only the previous matches.
+#
+# Results are row positions into the source sequence, in source order.
+
+GRAM = 3
+
+
+class NgramIndex:
+    def __init__(self, texts: Sequence[str], n: int = GRAM):
+        self.n = max(1, int(n))
+        self.texts: List[str] = [(t or '').lower() for t in texts]
+        postings: Dict[str, List[int]] = {}
+        n = self.n
+        for row, text in enumerate(self.texts):
+            for gram in {text[i:i + n] for i in range(len(text) - n + 1)}:
+                posting = postings.get(gram)
+                if posting is None:
+                    postings[gram] = [row]
+                else:
+                    posting.append(row)
+        # Rows are visited in order, so every posting list is sorted.
+        self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def candidates(self, query: str) -> Optional[Set[int]]:
+        """Rows holding every n-gram of query, or None when query is shorter
+        than n and every row is a candidate."""
+        query = (query or '').lower()
+        if len(query) < self.n:
+            return None
+        grams = {query[i:i + self.n] for i in range(len(query) - self.n + 1)}
+        postings = sorted((self._postings.get(g, ()) for g in grams), key=len)
+        if not postings[0]:
+            return set()
+        return set(postings[0]).intersection(*postings[1:])
+
+    def search(self, query: str, within: Optional[Sequence[int]] = None) -> List[int]:
+        """Rows whose text contains query, in row order."""
+        query = (query or '').lower()
+        if within is None:
+            if not query:
+                return list(range(len(self.texts)))
+            found = self.candidates(query)
+            within = range(len(self.texts)) if found is None else sorted(found)
+            if found is not None and len(query) == self.n:
+                return list(within)
+        elif not query:
+            return list(within)
+        texts = self.texts
+        return [r for r in within if query in texts[r]]
+
+
+class LiveFilter:
+    def __init__(self, text_of: Callable[[dict], str], n: int = GRAM):
+        self.text_of = text_of
+        self.n = n
+        self.source: Sequence[dict] = []
+        self.texts: Optional[List[str]] = None
+        self.index: Optional[NgramIndex] = None
+        self.query = ''
+        self.matches: Optional[List[int]] = None
+        self._lock = threading.Lock()
+
+    def set_source(self, rows: Sequence[dict]) -> None:
+        """Point at a new dataset; its index is built by prepare()."""
+        with self._lock:
+            self.source = rows if rows is not None else []
+            self.texts = None
+            self.index = None
+            self.query = ''
+            self.matches = None
+
+    def prepare(self) -> None:
+        """Build the index for the current dataset; safe on a worker thread.
+
+        Until it is ready, queries scan the texts, which is still fast for
+        short datasets; the index keeps long ones within a frame.
+        """
+        with self._lock:
+            source = self.source
+            texts = self._texts_locked()
+            if self.index is not None:
+                return
+        index = NgramIndex(texts, self.n)
+        with self._lock:
+            if self.source is source and self.index is None:
+                self.index = index
+
+    def apply(self, query: str) -> List[int]:
+        query = (query or '').strip().lower()
+        with self._lock:
+            if not query:
+                self.query, self.matches = '', None
+                return list(range(len(self.source)))
+            texts = self._texts_locked()
+            if self.matches is not None and self.query and self.query in query:
+                matches = [r for r in self.matches if query in texts[r]]
+            elif self.index is not None:
+                matches = self.index.search(query)
+            else:
+                matches = [r for r, text in enumerate(texts) if query in text]
+            self.query, self.matches = query, matches
+            return matches
+
+    @property
+    def active(self) -> bool:
+        return bool(self.query)
+
+    def _texts_locked(self) -> List[str]:
+        if self.texts is None or len(self.texts) != len(self.source):
+            self.texts = [(self.text_of(r) or '').lower() for r in self.source]
+            self.index = None
+        return self.texts
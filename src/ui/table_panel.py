@@ -1,13 +1,27 @@
 import tkinter as tk
 from tkinter import ttk
 from .pagination_bar import PaginationBar
+from .virtual_rows import VirtualRows
 try:
     from src.config_manager import ConfigManager
 except ModuleNotFoundError:
     from config_manager import ConfigManager
 
+# In virtual mode the panel keeps every row in a VirtualRows model and only
+# materializes the rows that fit the viewport, reusing a fixed pool of
+# Treeview items as the user scrolls. Callers go through the row API
+# (set_rows, append_row, update_row, row_index, ...) which behaves the same
+# in both modes, so a section can switch modes without other changes.
+# Scrolling moves the selected row between pooled items, which makes the
+# Treeview report a selection change; bind_select() callbacks only run when
+# the selected model row actually changes.
+
+DEFAULT_ROW_HEIGHT = 20
+HEADING_HEIGHT = 24
+
+
 class TablePanel(ttk.Frame):
-    def __init__(self, parent, columns, show_page_size=True, size_label="Rows per page:"):
+    def __init__(self, parent, columns, show_page_size=True, size_label="Rows per page:", virtual=False):
         super().__init__(parent)
         self.pack(fill="both", expand=True)
         self.pagination = PaginationBar(self, show_page_size=show_page_size, size_label=size_label)
@@ -20,6 +34,253 @@ class TablePanel(ttk.Frame):
         self.tree.configure(yscrollcommand=sb.set)
         self.tree.pack(side="left", fill="both", expand=True)
         sb.pack(side="right", fill="y")
+        self._scrollbar = sb
+        self.virtual = bool(virtual)
+        self.model = None
+        if self.virtual:
+            self._setup_virtual()
+
+    # ---- row API -------------------------------------------------------
+
+    def set_rows(self, rows):
+        """Replace all rows; rows is an iterable of (values, tags)."""
+        rows = list(rows)
+        if self.virtual:
+            self.model.set_rows(rows)
+            self._selected_row = None
+            self._dispatched_row = None
+            self._render()
+            return
+        self.tree.delete(*self.tree.get_children())
+        for values, tags in rows:
+            self.tree.insert('', 'end', values=values, tags=tuple(tags or ()))
+
+    def append_row(self, values, tags=()):
+        if self.virtual:
+            index = self.model.append(values, tags)
+            start, end = self.model.window()
+            if end - start < self.model.capacity or index < end:
+                self._render()
+            else:
+                self._sync_scrollbar()
+            return
+        self.tree.insert('', 'end', values=values, tags=tuple(tags or ()))
+
+    def update_row(self, index, values=None, tags=None):
+        if self.virtual:
+            if self.model.update(index, values, tags):
+                self._render()
+            return
+        self.update_rows([(index, values, tags)])
+
+    def update_rows(self, updates):
+        """Apply many (index, values, tags) changes with a single re-render."""
+        if self.virtual:
+            visible = False
+            for index, values, tags in updates:
+                visible = self.model.update(index, values, tags) or visible
+            if visible:
+                self._render()
+            return
+        items = self.tree.get_children()
+        for index, values, tags in updates:
+            if 0 <= index < len(items):
+                kw = {'values': values} if values is not None else {}
+                if tags is not None:
+                    kw['tags'] = tuple(tags)
+                self.tree.item(items[index], **kw)
+
+    def clear_rows(self):
+        self.set_rows([])
+
+    def row_count(self):
+        if self.virtual:
+            return len(self.model)
+        return len(self.tree.get_children())
+
+    def row_values(self, index):
+        if self.virtual:
+            return self.model.rows[index][0] if 0 <= index < len(self.model) else ()
+        items = self.tree.get_children()
+        return tuple(self.tree.item(items[index]).get('values', ())) if 0 <= index < len(items) else ()
+
+    def row_index(self, iid):
+        """Model index of a Treeview item (row position in non-virtual mode)."""
+        if self.virtual:
+            try:
+                return self.model.offset + self._pool.index(iid)
+            except ValueError:
+                return -1
+        return self.tree.index(iid)
+
+    def selected_index(self):
+        sel = self.tree.selection()
+        if sel:
+            return self.row_index(sel[0])
+        if self.virtual:
+            return self._selected_row
+        return None
+
+    def bind_select(self, callback):
+        """Call callback(event) when the user selects a row."""
+        if self.virtual:
+            self._select_callbacks.append(callback)
+        else:
+            self.tree.bind('<<TreeviewSelect>>', callback, add='+')
+
+    def see_row(self, index):
+        if self.virtual:
+            if self.model.ensure_visible(index):
+                self._render()
+            return
+        items = self.tree.get_children()
+        if 0 <= index < len(items):
+            self.tree.see(items[index])
+
+    # ---- virtual mode --------------------------------------------------
+
+    def _setup_virtual(self):
+        self.model = VirtualRows(capacity=int(self.tree.cget('height') or 10))
+        self._pool = []
+        self._attached = 0
+        self._selected_row = None
+        self._dispatched_row = None
+        self._select_callbacks = []
+        self.tree.configure(yscrollcommand=lambda *a: None)
+        self._scrollbar.configure(command=self._on_scrollbar)
+        self.tree.bind('<Configure>', self._on_resize, add='+')
+        self.tree.bind('<MouseWheel>', self._on_wheel, add='+')
+        self.tree.bind('<Button-4>', lambda e: self._scroll(-3), add='+')
+        self.tree.bind('<Button-5>', lambda e: self._scroll(3), add='+')
+        self.tree.bind('<<TreeviewSelect>>', self._on_select, add='+')
+        self.tree.bind('<Up>', lambda e: self._on_arrow(-1), add='+')
+        self.tree.bind('<Down>', lambda e: self._on_arrow(1), add='+')
+        self.tree.bind('<Prior>', lambda e: self._scroll_pages(-1), add='+')
+        self.tree.bind('<Next>', lambda e: self._scroll_pages(1), add='+')
+
+    def _row_height(self):
+        try:
+            rh = int(ttk.Style().lookup('Treeview', 'rowheight') or 0)
+            return rh if rh > 0 else DEFAULT_ROW_HEIGHT
+        except Exception:
+            return DEFAULT_ROW_HEIGHT
+
+    def _on_resize(self, event=None):
+        try:
+            height = int(self.tree.winfo_height())
+        except Exception:
+            return
+        if height <= 1:
+            return
+        capacity = max(1, (height - HEADING_HEIGHT) // self._row_height())
+        if capacity != self.model.capacity:
+            self.model.set_capacity(capacity)
+            self._render()
+
+    def _scroll(self, delta):
+        if self.model.scroll(delta):
+            self._render()
+        return "break"
+
+    def _scroll_pages(self, pages):
+        if self.model.scroll_pages(pages):
+            self._render()
+        return "break"
+
+    def _on_wheel(self, event):
+        delta = getattr(event, 'delta', 0) or 0
+        if not delta:
+            return "break"
+        # Windows reports multiples of 120 per notch, macOS small deltas.
+        steps = -int(delta / 120) if abs(delta) >= 120 else (-1 if delta > 0 else 1)
+        return self._scroll(steps * 3)
+
+    def _on_scrollbar(self, action, *args):
+        changed = False
+        try:
+            if action == 'moveto':
+                changed = self.model.moveto(float(args[0]))
+            elif action == 'scroll':
+                n = int(args[0])
+                changed = self.model.scroll_pages(n) if (len(args) > 1 and args[1] == 'pages') else self.model.scroll(n)
+        except Exception:
+            return
+        if changed:
+            self._render()
+
+    def _on_arrow(self, step):
+        index = self.selected_index()
+        if index is None:
+            return None
+        target = index + step
+        if target < 0 or target >= len(self.model):
+            return "break"
+        if self.model.position_of(target) is not None:
+            # Inside the window the Treeview moves the selection itself.
+            return None
+        self.model.ensure_visible(target)
+        self._selected_row = target
+        self._render()
+        return "break"
+
+    def _on_select(self, event=None):
+        sel = self.tree.selection()
+        if not sel:
+            return
+        index = self.row_index(sel[0])
+        if index < 0:
+            return
+        self._selected_row = index
+        # <<TreeviewSelect>> arrives after _sync_selection() re-selected the
+        # same row on another pooled item; only a new row is dispatched.
+        if index == self._dispatched_row:
+            return
+        self._dispatched_row = index
+        for callback in list(self._select_callbacks):
+            try:
+                callback(event)
+            except Exception:
+                pass
+
+    def _render(self):
+        start, end = self.model.window()
+        want = end - start
+        attached = self._attached
+        while len(self._pool) < want:
+            self._pool.append(self.tree.insert('', 'end'))
+        for pos in range(want):
+            values, tags = self.model.rows[start + pos]
+            iid = self._pool[pos]
+            self.tree.item(iid, values=values, tags=tags)
+            if pos >= attached:
+                # Reattach a recycled item (a no-op for freshly inserted ones).
+                self.tree.move(iid, '', pos)
+        for pos in range(want, attached):
+            self.tree.detach(self._pool[pos])
+        self._attached = want
+        self._sync_selection()
+        self._sync_scrollbar()
+
+    def _sync_selection(self):
+        target = None
+        if self._selected_row is not None:
+            pos = self.model.position_of(self._selected_row)
+            if pos is not None:
+                target = self._pool[pos]
+        current = self.tree.selection()
+        if target is None:
+            if current:
+                self.tree.selection_remove(*current)
+        elif tuple(current) != (target,):
+            self.tree.selection_set(target)
+            self.tree.focus(target)
+
+    def _sync_scrollbar(self):
+        try:
+            first, last = self.model.fractions()
+            self._scrollbar.set(first, last)
+        except Exception:
+            pass
 
     def update_visibility(self, row_count: int):
         try:
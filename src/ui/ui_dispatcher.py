@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+# UiDispatcher is the one way worker threads touch Tk widgets. Threads post
+# callables into a locked queue; the Tk loop drains it every interval_ms and
+# stops after budget_ms so a burst of updates cannot starve input handling.
+#
+# post(fn)                      runs every fn, in order.
+# post_latest(key, fn)          keeps only the newest fn per key (progress text,
+#                               progress bars); it runs at the queue position of
+#                               the first pending post for that key.
+# post_batch(key, item, apply)  collects items and calls apply(items) once per
+#                               drain (row updates).
+
+
+class _Slot:
+    __slots__ = ('key', 'fn', 'items')
+
+    def __init__(self, key, fn, items=None):
+        self.key = key
+        self.fn = fn
+        self.items = items
+
+
+class UiDispatcher:
+    def __init__(self, widget=None, interval_ms: int = 50, budget_ms: int = 15, clock: Callable[[], float] = time.monotonic):
+        self.widget = widget
+        self.interval_ms = max(1, int(interval_ms))
+        self.budget = max(1, int(budget_ms)) / 1000.0
+        self._clock = clock
+        self._queue: Deque[_Slot] = deque()
+        self._pending: Dict[Hashable, _Slot] = {}
+        self._lock = threading.Lock()
+        self._running = False
+
+    def post(self, fn: Callable[[], Any]) -> None:
+        with self._lock:
+            self._queue.append(_Slot(None, fn))
+
+    def post_latest(self, key: Hashable, fn: Callable[[], Any]) -> None:
+        with self._lock:
+            slot = self._pending.get(key)
+            if slot is not None and slot.items is None:
+                slot.fn = fn
+                return
+            slot = _Slot(key, fn)
+            self._pending[key] = slot
+            self._queue.append(slot)
+
+    def post_batch(self, key: Hashable, item: Any, apply: Callable[[List[Any]], Any]) -> None:
+        with self._lock:
+            slot = self._pending.get(key)
+            if slot is not None and slot.items is not None:
+                slot.items.append(item)
+                slot.fn = apply
+                return
+            slot = _Slot(key, apply, [item])
+            self._pending[key] = slot
+            self._queue.append(slot)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def drain(self, budget: Optional[float] = None) -> int:
+        """Run queued work on the calling (Tk) thread until the budget is spent."""
+        deadline = self._clock() + (self.budget if budget is None else budget)
+        ran = 0
+        while True:
+            with self._lock:
+                if not self._queue:
+                    return ran
+                slot = self._queue.popleft()
+                if slot.key is not None and self._pending.get(slot.key) is slot:
+                    del self._pending[slot.key]
+            try:
+                if slot.items is not None:
+                    slot.fn(slot.items)
+                else:
+                    slot.fn()
+            except Exception:
+                pass
+            ran += 1
+            if self._clock() >= deadline:
+                return ran
+
+    def start(self) -> None:
+        if self._running or self.widget is None:
+            return
+        self._running = True
+        self._schedule()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def _schedule(self):
+        try:
+            self.widget.after(self.interval_ms, self._tick)
+        except Exception:
+            self._running = False
+
+    def _tick(self):
+        if not self._running:
+            return
+        try:
+            if not self.widget.winfo_exists():
+                self._running = False
+                return
+        except Exception:
+            self._running = False
+            return
+        self.drain()
+        self._schedule()
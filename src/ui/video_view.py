@@ -0,0 +1,58 @@
+from typing import Dict, List, Optional
+
+# VideoView indexes the videos behind the Videos table. `source` is the full
+# result list (MainPage.current_videos) and `rows` is what the table shows,
+# in display order, after sorting or filtering. Lookups by videoId return
+# the video dict and its table rows in O(1), so row updates never depend on a
+# list position that sorting or filtering may have changed.
+
+
+class VideoView:
+    def __init__(self):
+        self.source: List[Dict] = []
+        self.rows: List[Dict] = []
+        self._by_id: Dict[str, Dict] = {}
+        self._rows_by_id: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def set_source(self, videos) -> None:
+        self.source = videos if isinstance(videos, list) else list(videos or [])
+        self._by_id = {}
+        for v in self.source:
+            vid = v.get('videoId') if isinstance(v, dict) else None
+            if vid and vid not in self._by_id:
+                self._by_id[vid] = v
+
+    def show(self, videos) -> None:
+        """Record the videos displayed by the table, one per row."""
+        self.rows = list(videos or [])
+        self._rows_by_id = {}
+        for row, v in enumerate(self.rows):
+            vid = v.get('videoId') if isinstance(v, dict) else None
+            if vid:
+                self._rows_by_id.setdefault(vid, []).append(row)
+
+    def video(self, video_id: str) -> Optional[Dict]:
+        v = self._by_id.get(video_id)
+        if v is None:
+            rows = self._rows_by_id.get(video_id)
+            if rows:
+                v = self.rows[rows[0]]
+        return v
+
+    def video_at(self, row: Optional[int]) -> Optional[Dict]:
+        if row is None or row < 0 or row >= len(self.rows):
+            return None
+        return self.rows[row]
+
+    def rows_of(self, video_id: str) -> List[int]:
+        return list(self._rows_by_id.get(video_id, ()))
+
+    def row_of(self, video_id: str) -> Optional[int]:
+        rows = self._rows_by_id.get(video_id)
+        return rows[0] if rows else None
+
+    def is_filtered(self) -> bool:
+        return len(self.rows) != len(self.source)
@@ -0,0 +1,85 @@
+from typing import List, Optional, Sequence, Tuple
+
+# VirtualRows is the model behind TablePanel's virtual mode: the full list of
+# (values, tags) rows plus the scroll window currently materialized in the
+# Treeview. It has no Tk dependency so the windowing arithmetic can be
+# exercised without a display.
+
+Row = Tuple[Sequence, Tuple[str, ...]]
+
+
+class VirtualRows:
+    def __init__(self, capacity: int = 20):
+        self.rows: List[Row] = []
+        self.offset = 0
+        self.capacity = max(1, int(capacity))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def set_rows(self, rows) -> None:
+        self.rows = [(tuple(values), tuple(tags or ())) for values, tags in rows]
+        self.offset = 0
+
+    def append(self, values, tags=()) -> int:
+        self.rows.append((tuple(values), tuple(tags or ())))
+        return len(self.rows) - 1
+
+    def update(self, index: int, values=None, tags=None) -> bool:
+        """Change one row in place; returns True when it is inside the window."""
+        if index < 0 or index >= len(self.rows):
+            return False
+        old_values, old_tags = self.rows[index]
+        self.rows[index] = (
+            tuple(values) if values is not None else old_values,
+            tuple(tags) if tags is not None else old_tags,
+        )
+        start, end = self.window()
+        return start <= index < end
+
+    def set_capacity(self, capacity: int) -> None:
+        self.capacity = max(1, int(capacity))
+        self._clamp()
+
+    def window(self) -> Tuple[int, int]:
+        self._clamp()
+        return self.offset, min(len(self.rows), self.offset + self.capacity)
+
+    def scroll(self, delta: int) -> bool:
+        before = self.offset
+        self.offset += int(delta)
+        self._clamp()
+        return self.offset != before
+
+    def scroll_pages(self, pages: int) -> bool:
+        return self.scroll(int(pages) * max(1, self.capacity - 1))
+
+    def moveto(self, fraction: float) -> bool:
+        before = self.offset
+        self.offset = int(round(float(fraction) * len(self.rows)))
+        self._clamp()
+        return self.offset != before
+
+    def ensure_visible(self, index: int) -> bool:
+        before = self.offset
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self.capacity:
+            self.offset = index - self.capacity + 1
+        self._clamp()
+        return self.offset != before
+
+    def fractions(self) -> Tuple[float, float]:
+        """Scrollbar (first, last) for the current window."""
+        total = len(self.rows)
+        if total == 0:
+            return 0.0, 1.0
+        start, end = self.window()
+        return start / total, end / total
+
+    def position_of(self, index: int) -> Optional[int]:
+        start, end = self.window()
+        return index - start if start <= index < end else None
+
+    def _clamp(self):
+        self.offset = max(0, min(self.offset, max(0, len(self.rows) - self.capacity)))
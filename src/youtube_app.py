@@ -3,6 +3,7 @@ from .config_manager import ConfigManager
 from .pages.setup_page import SetupPage
 from .pages.main.main_page import MainPage
 from .playlist import Playlist
+from .services.key_pool import ApiKeyPool
 import yt_dlp  # Import yt-dlp for downloading videos
 
 class YouTubeApp:
@@ -11,9 +12,18 @@ class YouTubeApp:
         self.config = ConfigManager.load_config()
         self.api_key = self.config.get("api_key", "")
         self.default_folder = self.config.get("default_folder", "")
-        self.playlist_handler = Playlist(self.api_key)
+        self.key_pool = self._build_key_pool(self.api_key)
+        self.playlist_handler = Playlist(self.api_key, key_pool=self.key_pool)
         self._initialize_gui()
 
+    def _build_key_pool(self, api_key):
+        """Pool the configured key with every other key from .env / settings.py."""
+        try:
+            extra = ConfigManager.get_available_api_keys()
+        except Exception:
+            extra = []
+        return ApiKeyPool([api_key] + list(extra))
+
     def _initialize_gui(self):
         """Initialize the GUI components and window properties."""
         self.setup_window()
@@ -89,7 +99,8 @@ class YouTubeApp:
         self.api_key = api_key
         self.default_folder = default_folder
         ConfigManager.save_config(api_key, default_folder)
-        self.playlist_handler = Playlist(api_key)
+        self.key_pool = self._build_key_pool(api_key)
+        self.playlist_handler = Playlist(api_key, key_pool=self.key_pool)
 
     def get_current_config(self):
         """Get current configuration values."""
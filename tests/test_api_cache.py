@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from src.services.api_cache import ApiResponseCache
+
+
+class ApiResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache.sqlite3')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_ignores_none_params_and_api_key(self):
+        a = ApiResponseCache.make_key('search.list', {'q': 'x', 'maxResults': 10, 'pageToken': None})
+        b = ApiResponseCache.make_key('search.list', {'maxResults': 10, 'q': 'x', 'key': 'secret'})
+        c = ApiResponseCache.make_key('search.list', {'q': 'y', 'maxResults': 10})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+
+    def test_roundtrip_and_ttl(self):
+        cache = ApiResponseCache(self.path, ttls={'search.list': 3600, 'videos.list': 0})
+        cache.put('k1', 'search.list', {'items': [1]}, 'etag-1')
+        cache.put('k2', 'videos.list', {'items': [2]}, 'etag-2')
+        e1 = cache.get('k1')
+        e2 = cache.get('k2')
+        self.assertTrue(e1.fresh)
+        self.assertEqual(e1.body, {'items': [1]})
+        self.assertFalse(e2.fresh)
+        self.assertEqual(e2.etag, 'etag-2')
+        self.assertIsNone(cache.get('missing'))
+
+    def test_persists_across_instances(self):
+        ApiResponseCache(self.path).put('k', 'playlists.list', {'items': []}, 'e')
+        self.assertIsNotNone(ApiResponseCache(self.path).get('k'))
+
+    def test_lru_eviction_bounds_size(self):
+        cache = ApiResponseCache(self.path, max_bytes=300)
+        body = {'pad': 'x' * 100}
+        cache.put('a', 'videos.list', body)
+        cache.put('b', 'videos.list', body)
+        cache.get('a')
+        cache.put('c', 'videos.list', body)
+        self.assertLessEqual(cache.total_bytes(), 300)
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+
+if __name__ == '__main__':
+    unittest.main()
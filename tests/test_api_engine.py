@@ -0,0 +1,78 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from src.services.api_engine import AsyncApiEngine, QuotaBudgetExceeded, RateLimiter, TokenBucket, sync_quota
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeMeter:
+    def __init__(self, used=0):
+        self.used = used
+
+    def limit(self, keys):
+        return 10000 * len(keys)
+
+    def remaining(self, keys):
+        return self.limit(keys) - self.used
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_reserve_reports_wait_when_empty(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        clock.now = 10.0
+        self.assertAlmostEqual(bucket.available(), 2.0)
+
+    def test_quota_budget_exceeded(self):
+        limiter = RateLimiter(requests_per_second=1000, daily_quota_units=100, max_quota_wait=1.0)
+        limiter.reserve(100)
+        with self.assertRaises(QuotaBudgetExceeded):
+            limiter.reserve(100)
+
+    def test_sync_quota_uses_pool_limit_and_todays_usage(self):
+        limiter = RateLimiter(requests_per_second=1000, daily_quota_units=10000, max_quota_wait=1.0)
+        self.assertEqual(sync_quota(limiter, ['k1', 'k2'], meter=FakeMeter(used=19950)), 50)
+        self.assertEqual(limiter.quota.capacity, 20000)
+        limiter.reserve(50)
+        with self.assertRaises(QuotaBudgetExceeded):
+            limiter.reserve(50)
+
+
+class AsyncApiEngineTests(unittest.TestCase):
+    def test_in_flight_cap(self):
+        engine = AsyncApiEngine(max_in_flight=3, limiter=RateLimiter(requests_per_second=1000, daily_quota_units=10000))
+        lock = threading.Lock()
+        state = {'cur': 0, 'peak': 0}
+
+        def work(i):
+            with lock:
+                state['cur'] += 1
+                state['peak'] = max(state['peak'], state['cur'])
+            time.sleep(0.02)
+            with lock:
+                state['cur'] -= 1
+            return i * 2
+
+        async def main():
+            return await asyncio.gather(*[engine.call(work, i) for i in range(12)])
+
+        result = engine.run(main)
+        self.assertEqual(result, [i * 2 for i in range(12)])
+        self.assertLessEqual(state['peak'], 3)
+        self.assertGreater(state['peak'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+
+from src.services.download_journal import DownloadJournal, archive_path
+from src.services.download_scheduler import DONE, FAILED, QUEUED, RUNNING, DownloadScheduler
+
+
+def _videos(*ids):
+    return [{'videoId': vid, 'title': f"Title {vid}"} for vid in ids]
+
+
+class DownloadJournalTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.tmp.name, 'Playlist - Course')
+        os.makedirs(self.folder)
+        self.db = os.path.join(self.tmp.name, 'downloads.sqlite3')
+        self.journal = DownloadJournal(self.db)
+
+    def tearDown(self):
+        self.journal.close()
+        self.tmp.cleanup()
+
+    def test_interrupted_job_resumes_where_it_stopped(self):
+        states = self.journal.open_job(self.folder, _videos('a', 'b', 'c'))
+        self.assertEqual(states, {'a': QUEUED, 'b': QUEUED, 'c': QUEUED})
+        job = self.journal.job_id_for(self.folder)
+        self.journal.mark(job, 'a', DONE)
+        self.journal.mark(job, 'b', RUNNING)
+        self.journal.mark(job, 'c', FAILED, 'HTTP Error 403')
+        self.journal.close()
+
+        # A new session (the app was closed while 'b' was downloading).
+        self.journal = DownloadJournal(self.db)
+        states = self.journal.open_job(self.folder, _videos('a', 'b', 'c', 'd'))
+        self.assertEqual(states, {'a': DONE, 'b': QUEUED, 'c': FAILED, 'd': QUEUED})
+        items = self.journal.items(job)
+        self.assertEqual(items['b']['attempts'], 1)
+        self.assertEqual(items['c']['error'], 'HTTP Error 403')
+        self.assertEqual([items[k]['position'] for k in 'abcd'], [0, 1, 2, 3])
+
+    def test_download_archive_marks_videos_done(self):
+        with open(archive_path(self.folder), 'w', encoding='utf-8') as f:
+            f.write('youtube b\nvimeo c\n')
+        states = self.journal.open_job(self.folder, _videos('a', 'b', 'c'))
+        self.assertEqual(states, {'a': QUEUED, 'b': DONE, 'c': QUEUED})
+
+    def test_scheduler_skips_finished_items_and_reports_states(self):
+        job = self.journal.job_id_for(self.folder)
+        self.journal.open_job(self.folder, _videos('a', 'b', 'c'))
+        self.journal.mark(job, 'a', DONE)
+        states = self.journal.open_job(self.folder, _videos('a', 'b', 'c'))
+        downloaded = []
+
+        def make_worker():
+            def download(key):
+                if key == 'c':
+                    raise RuntimeError('gone')
+                downloaded.append(key)
+            return download
+
+        sched = DownloadScheduler(make_worker, workers=2, on_change=lambda k, s, e: self.journal.mark(job, k, s, e))
+        for v in _videos('a', 'b', 'c'):
+            sched.add(v['videoId'], v['title'], done=states.get(v['videoId']) == DONE)
+        sched.run()
+        self.assertEqual(downloaded, ['b'])
+        self.assertEqual(sched.snapshot()['counts'][DONE], 2)
+        items = self.journal.items(job)
+        self.assertEqual({k: i['state'] for k, i in items.items()}, {'a': DONE, 'b': DONE, 'c': FAILED})
+        self.assertEqual(items['c']['error'], 'gone')
+
+    def test_forget_drops_the_job(self):
+        self.journal.open_job(self.folder, _videos('a'))
+        self.journal.forget(self.journal.job_id_for(self.folder))
+        self.assertEqual(self.journal.items(self.journal.job_id_for(self.folder)), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
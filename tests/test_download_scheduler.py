@@ -0,0 +1,162 @@
+import threading
+import time
+import unittest
+
+from src.services.download_scheduler import CANCELLED, DONE, FAILED, QUEUED, RUNNING, DownloadScheduler
+
+
+class DownloadSchedulerTests(unittest.TestCase):
+    def test_runs_items_in_parallel_with_one_worker_object_per_thread(self):
+        made = []
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def make_worker():
+            seen = []
+            made.append(seen)
+
+            def download(key):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.05)
+                seen.append(key)
+                with lock:
+                    active[0] -= 1
+            return download
+
+        sched = DownloadScheduler(make_worker, workers=3)
+        for i in range(9):
+            sched.add(f"v{i}", f"Video {i}")
+        sched.run()
+        snap = sched.snapshot()
+        self.assertEqual(snap['counts'][DONE], 9)
+        self.assertTrue(snap['finished'])
+        self.assertEqual(len(made), 3)
+        self.assertEqual(peak[0], 3)
+        self.assertEqual(sorted(k for seen in made for k in seen), sorted(f"v{i}" for i in range(9)))
+
+    def test_failures_are_recorded_per_item(self):
+        def make_worker():
+            def download(key):
+                if key == 'bad':
+                    raise RuntimeError('unavailable')
+            return download
+
+        sched = DownloadScheduler(make_worker, workers=2)
+        for key in ('a', 'bad', 'b'):
+            sched.add(key)
+        sched.run()
+        states = {i['key']: (i['state'], i['error']) for i in sched.snapshot()['items']}
+        self.assertEqual(states['bad'], (FAILED, 'unavailable'))
+        self.assertEqual(states['a'][0], DONE)
+        self.assertEqual(states['b'][0], DONE)
+
+    def test_progress_sums_streams(self):
+        sched = DownloadScheduler(lambda: None)
+        sched.add('a')
+        sched._set_state('a', RUNNING)
+        sched.progress('a', 50, 100, 'a.f137.mp4')
+        sched.progress('a', 100, 100, 'a.f137.mp4')
+        sched.progress('a', 20, 40, 'a.f140.m4a')
+        item = sched.snapshot()['items'][0]
+        self.assertEqual(item['downloaded'], 120)
+        self.assertEqual(item['total'], 140)
+        # The first count of each stream is its baseline, not received bytes.
+        self.assertEqual(sched.received, 50)
+
+    def test_resumed_part_file_does_not_spike_speed(self):
+        now = [0.0]
+        sched = DownloadScheduler(lambda: None, clock=lambda: now[0])
+        sched.add('a')
+        sched._set_state('a', RUNNING)
+        sched.snapshot()
+        for t in range(1, 5):
+            now[0] = float(t)
+            # 900 bytes were on disk from an earlier session.
+            sched.progress('a', 900 + 10 * t, 2000, 'a.mp4')
+            sched.snapshot()
+        snap = sched.snapshot()
+        item = snap['items'][0]
+        self.assertEqual(item['downloaded'], 940)
+        self.assertEqual(sched.received, 30)
+        self.assertAlmostEqual(item['speed'], 7.5)
+        self.assertAlmostEqual(snap['speed'], 7.5)
+
+    def test_rolling_speed_and_eta_come_from_folded_events(self):
+        now = [0.0]
+        sched = DownloadScheduler(lambda: None, clock=lambda: now[0])
+        for key in ('a', 'b'):
+            sched.add(key)
+        sched._set_state('a', RUNNING)
+        sched.progress('a', 0, 1000, 'a.mp4')
+        sched.snapshot()
+        for t in range(1, 5):
+            now[0] = float(t)
+            sched.progress('a', 100 * t, 1000, 'a.mp4')
+            sched.snapshot()
+        snap = sched.snapshot()
+        item = snap['items'][0]
+        self.assertAlmostEqual(item['speed'], 100.0)
+        self.assertAlmostEqual(item['eta'], 6.0)
+        # 'b' is queued and assumed to be as large as 'a'.
+        self.assertAlmostEqual(snap['speed'], 100.0)
+        self.assertAlmostEqual(snap['eta'], 16.0)
+        # A stalled transfer decays once its samples leave the window.
+        now[0] = 20.0
+        self.assertEqual(sched.snapshot()['items'][0]['speed'], 0.0)
+
+    def test_progress_does_not_take_the_lock(self):
+        sched = DownloadScheduler(lambda: None)
+        sched.add('a')
+        with sched._lock:
+            sched.progress('a', 10, 100)
+        self.assertEqual(sched.snapshot()['items'][0]['downloaded'], 10)
+
+    def test_meter_publishes_latest_snapshot(self):
+        def make_worker():
+            def download(key):
+                for i in range(1, 6):
+                    sched.progress(key, i * 10, 50)
+                    time.sleep(0.01)
+            return download
+
+        sched = DownloadScheduler(make_worker, workers=2, refresh=0.01)
+        for key in ('a', 'b'):
+            sched.add(key)
+        sched.run()
+        deadline = time.monotonic() + 2
+        while not (sched.latest and sched.latest['finished']) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(sched.latest['finished'])
+        self.assertEqual(sched.latest['counts'][DONE], 2)
+        # Each item's first count (10) is its baseline.
+        self.assertEqual(sched.latest['received'], 80)
+
+    def test_cancel_stops_running_and_queued_items(self):
+        started = threading.Event()
+
+        def make_worker():
+            def download(key):
+                started.set()
+                while True:
+                    sched.progress(key, 1, 10)
+                    time.sleep(0.01)
+            return download
+
+        sched = DownloadScheduler(make_worker, workers=1)
+        for key in ('a', 'b', 'c'):
+            sched.add(key)
+        sched.start()
+        self.assertTrue(started.wait(2))
+        sched.cancel()
+        sched.join(2)
+        snap = sched.snapshot()
+        self.assertEqual(snap['counts'][CANCELLED], 3)
+        self.assertEqual(snap['counts'][QUEUED], 0)
+        self.assertTrue(snap['finished'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from src.ui.highlight_engine import HIT, PLAIN, HighlightEngine, PlaylistMembershipMap
+
+
+class PlaylistMembershipMapTests(unittest.TestCase):
+    def test_reverse_index_follows_reassignment(self):
+        m = PlaylistMembershipMap({'a': 'p1'})
+        m['b'] = 'p1'
+        m['a'] = 'p2'
+        self.assertEqual(m.videos_in('p1'), {'b'})
+        self.assertEqual(m.videos_in('p2'), {'a'})
+        del m['b']
+        m.pop('a')
+        self.assertEqual(m.videos_in('p1'), set())
+        self.assertEqual(m.videos_in('p2'), set())
+
+
+class HighlightEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = PlaylistMembershipMap()
+        self.ids = {}
+        self.engine = HighlightEngine(self.cache, self.ids.get)
+
+    def test_pin_uses_both_membership_sources_within_visible(self):
+        self.cache['a'] = 'p1'
+        self.ids['p1'] = {'b', 'hidden'}
+        self.engine.reset(['a', 'b', 'c'])
+        self.assertEqual(self.engine.pin('p1'), {'a': HIT, 'b': HIT})
+
+    def test_switching_pins_reports_only_changed_rows(self):
+        self.ids['p1'] = {'a', 'b'}
+        self.ids['p2'] = {'b', 'c'}
+        self.engine.reset([chr(ord('a') + i) for i in range(26)])
+        self.engine.pin('p1')
+        self.assertEqual(self.engine.pin('p2'), {'c': HIT, 'a': PLAIN})
+        self.assertEqual(self.engine.pin('p2'), {})
+        self.assertEqual(self.engine.clear(), {'b': PLAIN, 'c': PLAIN})
+        self.assertEqual(self.engine.clear(), {})
+
+    def test_initially_tagged_rows_are_cleared_once(self):
+        self.ids['p1'] = {'a'}
+        self.engine.reset(['a', 'b', 'c'], tagged=['a', 'b', 'c'])
+        self.assertEqual(self.engine.pin('p1'), {'a': HIT, 'b': PLAIN, 'c': PLAIN})
+        self.assertTrue(self.engine.is_hit('a'))
+        self.assertEqual(self.engine.state('b'), PLAIN)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import json
+import unittest
+
+from src.services.key_pool import AllKeysExhausted, ApiKeyPool, is_quota_exceeded
+
+
+class FakeResp:
+    def __init__(self, status):
+        self.status = status
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status, reason):
+        self.resp = FakeResp(status)
+        self.content = json.dumps({'error': {'errors': [{'reason': reason}]}}).encode()
+
+
+class ApiKeyPoolTests(unittest.TestCase):
+    def test_round_robin_and_dedupe(self):
+        pool = ApiKeyPool(['a', 'b', 'a', '', 'c'])
+        self.assertEqual(pool.keys, ['a', 'b', 'c'])
+        self.assertEqual([pool.acquire() for _ in range(4)], ['a', 'b', 'c', 'a'])
+
+    def test_cooldown_skips_exhausted_key_until_reset(self):
+        now = [1000.0]
+        pool = ApiKeyPool(['a', 'b'], clock=lambda: now[0])
+        pool.mark_exhausted('a', until=2000.0)
+        self.assertEqual([pool.acquire() for _ in range(3)], ['b', 'b', 'b'])
+        pool.mark_exhausted('b', until=1500.0)
+        with self.assertRaises(AllKeysExhausted):
+            pool.acquire()
+        now[0] = 1600.0
+        self.assertEqual(pool.acquire(), 'b')
+        self.assertEqual(pool.available_keys(), ['b'])
+
+    def test_listeners_hear_about_cooldowns(self):
+        pool = ApiKeyPool(['a', 'b'])
+        calls = []
+        listener = lambda: calls.append(pool.available_keys())
+        pool.add_listener(listener)
+        pool.mark_exhausted('a', until=float('inf'))
+        pool.remove_listener(listener)
+        pool.mark_exhausted('b', until=float('inf'))
+        self.assertEqual(calls, [['b']])
+
+    def test_quota_error_detection(self):
+        self.assertTrue(is_quota_exceeded(FakeHttpError(403, 'quotaExceeded')))
+        self.assertFalse(is_quota_exceeded(FakeHttpError(403, 'forbidden')))
+        self.assertFalse(is_quota_exceeded(FakeHttpError(500, 'quotaExceeded')))
+
+
+if __name__ == '__main__':
+    unittest.main()
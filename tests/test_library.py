@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+from src.data.sqlite_store import SqliteStore
+from src.services.library import Library
+
+
+def _videos(n, start=0):
+    return [{'videoId': f'v{i:02d}', 'title': f'T{i}', 'channelTitle': 'ch', 'duration': '1:00', 'published': '2024', 'views': '3'} for i in range(start, start + n)]
+
+
+class LibraryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SqliteStore(os.path.join(self.tmp.name, 'lib.sqlite3'))
+        self.now = [0.0]
+        self.lib = Library(self.store, freshness_ttl=60, clock=lambda: self.now[0])
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def _fill(self, total=7):
+        self.lib.record_playlists([{'playlistId': 'PL', 'title': 'P', 'channelTitle': 'ch', 'video_count': total}])
+        self.lib.record_page('PL', _videos(5), list(range(5)))
+        self.lib.record_page('PL', _videos(2, 5), [5, 6])
+
+    def test_incomplete_playlist_goes_to_api(self):
+        self.lib.record_playlists([{'playlistId': 'PL', 'video_count': 9}])
+        self.lib.record_page('PL', _videos(5), list(range(5)))
+        self.assertFalse(self.lib.is_complete('PL'))
+        self.assertIsNone(self.lib.playlist_page('PL'))
+
+    def test_complete_playlist_pages_locally(self):
+        self._fill()
+        first = self.lib.playlist_page('PL', None, 4)
+        self.assertEqual([v['videoId'] for v in first['videos']], ['v00', 'v01', 'v02', 'v03'])
+        self.assertTrue(self.lib.is_library_token(first['nextPageToken']))
+        self.assertIsNone(first['prevPageToken'])
+        second = self.lib.playlist_page('PL', first['nextPageToken'], 4)
+        self.assertEqual([v['videoId'] for v in second['videos']], ['v04', 'v05', 'v06'])
+        self.assertIsNone(second['nextPageToken'])
+        back = self.lib.playlist_page('PL', second['prevPageToken'], 4)
+        self.assertEqual(back['videos'], first['videos'])
+        self.assertIsNone(self.lib.playlist_page('PL', 'CAUQAA', 4))
+
+    def test_merge_keeps_known_fields(self):
+        self._fill()
+        self.lib.record_playlists([{'playlistId': 'PL', 'title': 'Renamed'}])
+        self.lib.record_videos([{'videoId': 'v00', 'title': 'T0', 'duration': 'N/A'}])
+        info = self.store.get_playlist('PL')
+        self.assertEqual((info['title'], info['video_count']), ('Renamed', 7))
+        page = self.lib.playlist_page('PL', None, 1)
+        self.assertEqual(page['videos'][0]['duration'], '1:00')
+
+    def test_video_to_playlist_lookup(self):
+        self._fill()
+        self.lib.record_page('OTHER', _videos(1, 3), [0])
+        self.assertEqual(self.lib.playlists_for_video('v03'), {'PL', 'OTHER'})
+        self.assertEqual(self.lib.playlists_for_video('zz'), set())
+
+    def test_freshness_check_is_throttled_and_invalidates(self):
+        self._fill()
+        self.assertTrue(self.lib.needs_check('PL'))
+        self.assertFalse(self.lib.needs_check('PL'))
+        self.assertFalse(self.lib.check_freshness('PL', lambda: 7))
+        self.now[0] = 61
+        self.assertTrue(self.lib.needs_check('PL'))
+        self.assertTrue(self.lib.check_freshness('PL', lambda: 8))
+        self.assertIsNone(self.lib.playlist_page('PL'))
+        self.assertEqual(self.store.get_playlist('PL')['video_count'], 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import random
+import string
+import unittest
+
+from src.ui.live_filter import LiveFilter, NgramIndex
+
+
+def _text(v):
+    return f"{v['title']}\n{v['channelTitle']}"
+
+
+def _rows(count, seed=7):
+    rnd = random.Random(seed)
+    words = [''.join(rnd.choice(string.ascii_lowercase) for _ in range(rnd.randint(3, 9))) for _ in range(2000)]
+    return [{'title': ' '.join(rnd.choice(words) for _ in range(8)).title(), 'channelTitle': rnd.choice(words)} for _ in range(count)], words
+
+
+class _CountingList(list):
+    reads = 0
+
+    def __getitem__(self, i):
+        self.reads += 1
+        return super().__getitem__(i)
+
+
+def _naive(rows, query):
+    query = query.strip().lower()
+    return [r for r, v in enumerate(rows) if query in _text(v).lower()]
+
+
+class NgramIndexTests(unittest.TestCase):
+    def test_search_matches_substring_scan(self):
+        texts = ['Python Tutorial', 'Learn python fast', 'Cooking', 'py']
+        index = NgramIndex(texts)
+        self.assertEqual(index.search('python'), [0, 1])
+        self.assertEqual(index.search('pyt'), [0, 1])
+        self.assertEqual(index.search('py'), [0, 1, 3])
+        self.assertEqual(index.search('zzz'), [])
+        self.assertIsNone(index.candidates('py'))
+
+    def test_search_within_restricts_rows(self):
+        index = NgramIndex(['abc', 'abcd', 'xabc'])
+        self.assertEqual(index.search('abc', within=[1, 2]), [1, 2])
+
+
+class LiveFilterTests(unittest.TestCase):
+    def setUp(self):
+        self.rows, self.words = _rows(2000)
+        self.live = LiveFilter(_text)
+        self.live.set_source(self.rows)
+
+    def test_typing_matches_naive_scan_with_and_without_index(self):
+        for prepared in (False, True):
+            if prepared:
+                self.live.prepare()
+            for word in self.words[:30]:
+                self.live.apply('')
+                for i in range(1, len(word) + 1):
+                    self.assertEqual(self.live.apply(word[:i]), _naive(self.rows, word[:i]))
+                # Backspacing widens the query again.
+                self.assertEqual(self.live.apply(word[:1]), _naive(self.rows, word[:1]))
+
+    def test_channel_is_searched_and_case_ignored(self):
+        rows = [{'title': 'Alpha', 'channelTitle': 'Beta Channel'}, {'title': 'Gamma', 'channelTitle': 'Delta'}]
+        self.live.set_source(rows)
+        self.assertEqual(self.live.apply('BETA'), [0])
+        self.assertEqual(self.live.apply('  '), [0, 1])
+        self.assertFalse(self.live.active)
+
+    def test_set_source_drops_index_and_previous_matches(self):
+        self.live.prepare()
+        self.live.apply('a')
+        rows = [{'title': 'one', 'channelTitle': ''}, {'title': 'two', 'channelTitle': ''}]
+        self.live.set_source(rows)
+        self.assertIsNone(self.live.index)
+        self.assertEqual(self.live.apply('o'), [0, 1])
+        self.assertEqual(self.live.apply('on'), [0])
+
+    def test_keystrokes_touch_only_candidates_on_large_results(self):
+        rows, words = _rows(10000, seed=3)
+        live = LiveFilter(_text)
+        live.set_source(rows)
+        live.prepare()
+        live.texts = live.index.texts = _CountingList(live.texts)
+        for word in [w for w in words if len(w) >= 4][:100]:
+            # A fresh query only confirms the rows holding all its trigrams.
+            live.apply('')
+            live.texts.reads = 0
+            matches = live.apply(word)
+            self.assertEqual(matches, _naive(rows, word))
+            self.assertLessEqual(live.texts.reads, len(live.index.candidates(word)))
+            self.assertLess(live.texts.reads, len(rows) // 10)
+            # Typing on re-checks only the previous matches.
+            live.apply('')
+            live.apply(word[:1])
+            for i in range(2, len(word) + 1):
+                previous = len(live.matches)
+                live.texts.reads = 0
+                live.apply(word[:i])
+                self.assertLessEqual(live.texts.reads, previous)
+
+if __name__ == '__main__':
+    unittest.main()
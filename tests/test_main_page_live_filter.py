@@ -0,0 +1,59 @@
+import unittest
+import tkinter as tk
+
+from src.pages.main.main_page import MainPage
+
+
+class MockDatastore:
+    def load_last_videos_result(self):
+        return {}
+
+
+class MockController:
+    def __init__(self, root):
+        self.playlist_handler = None
+        self.datastore = MockDatastore()
+        self.default_folder = ""
+        self.root = root
+    def show_frame(self, *args, **kwargs):
+        return None
+
+
+class PlaylistModeLiveFilterTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tk.Tk()
+
+    def tearDown(self):
+        try:
+            self.root.destroy()
+        except Exception:
+            pass
+
+    def _rows(self, mp):
+        panel = mp.video._panel
+        return [(panel.row_values(i)[0], mp.video_view.video_at(i).get('videoId')) for i in range(panel.row_count())]
+
+    def test_filter_and_clear_keep_playlist_hits(self):
+        mp = MainPage(self.root, MockController(self.root))
+        mp.search_mode = 'playlists'
+        mp.current_playlist_info = {'title': 'P', 'id': 'pl1'}
+        mp.video_search_query = ''
+        mp.video_search_ids = {'v1'}
+        mp.current_videos = [
+            {'videoId': 'v1', 'title': 'Alpha one', 'channelTitle': 'C'},
+            {'videoId': 'v2', 'title': 'Alpha two', 'channelTitle': 'C'},
+            {'videoId': 'v3', 'title': 'Beta', 'channelTitle': 'C'},
+        ]
+        mp._render_playlist_videos(3)
+        expected = [('★ Alpha one', 'v1'), ('Alpha two', 'v2'), ('Beta', 'v3')]
+        self.assertEqual(self._rows(mp), expected)
+
+        mp.apply_live_filter('alpha')
+        self.assertEqual(self._rows(mp), expected[:2])
+        mp.apply_live_filter('')
+        self.assertEqual(self._rows(mp), expected)
+        self.assertTrue(mp.highlights.is_hit('v1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
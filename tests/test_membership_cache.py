@@ -0,0 +1,93 @@
+import sqlite3
+import unittest
+
+from src.services.membership_cache import MembershipCache
+
+
+class FakeStore:
+    """playlist_videos-shaped store backed by an in-memory SQLite table."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.execute('CREATE TABLE playlist_videos (playlist_id TEXT, video_id TEXT, position INTEGER, fetched_at REAL, PRIMARY KEY (playlist_id, video_id))')
+
+    def playlist_video_fetched_at(self, playlist_id, video_id):
+        row = self.conn.execute('SELECT fetched_at FROM playlist_videos WHERE playlist_id=? AND video_id=?', (playlist_id, video_id)).fetchone()
+        return None if row is None else float(row[0] or 0.0)
+
+    def add_playlist_memberships(self, pairs):
+        self.conn.executemany('INSERT OR REPLACE INTO playlist_videos (playlist_id, video_id, fetched_at) VALUES (?,?,?)',
+                              [(p, v, self.clock()) for p, v in pairs])
+
+
+class MembershipCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.now = [0.0]
+
+    def _cache(self, **kw):
+        return MembershipCache(clock=lambda: self.now[0], wall_clock=lambda: self.now[0], **kw)
+
+    def test_hits_misses_and_negative_caching(self):
+        cache = self._cache()
+        self.assertIsNone(cache.get('p', 'v'))
+        cache.put('p', 'v', False)
+        self.assertIs(cache.get('p', 'v'), False)
+        cache.put('p', 'w', True)
+        self.assertIs(cache.get('p', 'w'), True)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+
+    def test_negative_entries_expire_before_positive(self):
+        cache = self._cache(positive_ttl=100, negative_ttl=10)
+        cache.put('p', 'yes', True)
+        cache.put('p', 'no', False)
+        self.now[0] = 50
+        self.assertIsNone(cache.get('p', 'no'))
+        self.assertIs(cache.get('p', 'yes'), True)
+        self.now[0] = 150
+        self.assertIsNone(cache.get('p', 'yes'))
+
+    def test_lru_evicts_one_entry_at_a_time(self):
+        cache = self._cache(max_entries=3)
+        for v in ('a', 'b', 'c'):
+            cache.put('p', v, True)
+        cache.get('p', 'a')
+        cache.put('p', 'd', True)
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get('p', 'b'))
+        self.assertIs(cache.get('p', 'a'), True)
+
+    def test_store_backs_positive_answers_across_instances(self):
+        store = FakeStore(lambda: self.now[0])
+        first = self._cache(store=store)
+        first.put_members('p', ['a', 'b'])
+        first.put('p', 'z', False)
+        second = self._cache(store=store)
+        self.assertIs(second.get('p', 'b'), True)
+        self.assertIsNone(second.get('p', 'z'))
+        self.assertEqual(second.stats()['store_hits'], 1)
+
+    def test_stored_positive_expires_with_its_fetch_time(self):
+        store = FakeStore(lambda: self.now[0])
+        first = self._cache(store=store, positive_ttl=100)
+        first.put_members('p', ['a', 'b'])
+        self.now[0] = 150
+        self.assertIsNone(first.get('p', 'a'))
+        # A fresh instance does not revive it from the store either.
+        second = self._cache(store=store, positive_ttl=100)
+        self.assertIsNone(second.get('p', 'b'))
+        self.assertEqual(second.stats()['store_hits'], 0)
+
+    def test_store_hit_keeps_the_remaining_ttl(self):
+        store = FakeStore(lambda: self.now[0])
+        self._cache(store=store, positive_ttl=100).put_members('p', ['a'])
+        self.now[0] = 60
+        cache = self._cache(store=store, positive_ttl=100)
+        self.assertIs(cache.get('p', 'a'), True)
+        self.now[0] = 110
+        self.assertIsNone(cache.get('p', 'a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import unittest
+
+from src.services.playlist_page_cache import FIRST_PAGE, PlaylistPageCache, estimate_bytes
+
+
+def _page(prefix, n, next_token=None):
+    return {'videos': [{'videoId': f'{prefix}{i}', 'title': 'x' * 40} for i in range(n)], 'prevPageToken': None, 'nextPageToken': next_token}
+
+
+class PlaylistPageCacheTests(unittest.TestCase):
+    def test_page_roundtrip_records_ids_and_stats(self):
+        cache = PlaylistPageCache()
+        cache.put_page('PL1', None, _page('a', 3, 'T2'))
+        self.assertIsNone(cache.get_page('PL1', 'T2'))
+        page = cache.get_page('PL1', None)
+        self.assertEqual(page['nextPageToken'], 'T2')
+        self.assertEqual(len(page['videos']), 3)
+        self.assertEqual(cache.video_ids('PL1'), {'a0', 'a1', 'a2'})
+        self.assertIsNone(cache.video_ids('PL2'))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertAlmostEqual(stats['hit_rate'], 0.5)
+
+    def test_lru_eviction_keeps_total_under_ceiling(self):
+        one = estimate_bytes(_page('a', 5)['videos'])
+        cache = PlaylistPageCache(max_bytes=one * 2 + 400)
+        cache.put_page('PL1', None, _page('a', 5))
+        cache.put_page('PL2', None, _page('b', 5))
+        cache.get_page('PL1', None)
+        cache.put_page('PL3', None, _page('c', 5))
+        self.assertLessEqual(cache.total_bytes(), cache.max_bytes)
+        self.assertIsNotNone(cache.get_page('PL1', None))
+        self.assertIsNone(cache.get_page('PL2', None))
+        self.assertIsNotNone(cache.get_page('PL3', None))
+        self.assertGreaterEqual(cache.stats()['evictions'], 1)
+
+    def test_oversized_page_is_not_stored(self):
+        cache = PlaylistPageCache(max_bytes=100)
+        cache.put_page('PL1', None, _page('a', 10))
+        self.assertIsNone(cache.get_page('PL1', None))
+        self.assertLessEqual(cache.total_bytes(), 100)
+
+    def test_set_video_ids_replaces_accounting(self):
+        cache = PlaylistPageCache()
+        cache.set_video_ids('PL1', ['a', 'b', 'c'])
+        before = cache.total_bytes()
+        cache.set_video_ids('PL1', ['a'])
+        self.assertEqual(cache.video_ids('PL1'), {'a'})
+        self.assertLess(cache.total_bytes(), before)
+        cache.invalidate('PL1')
+        self.assertEqual(cache.total_bytes(), 0)
+
+    def test_restore_reads_last_videos_search_shape(self):
+        data = json.loads(json.dumps({
+            'playlistPages': {'PL1': {
+                'pages': {FIRST_PAGE: _page('a', 2, 'T2')['videos'], 'T2': _page('b', 2)['videos']},
+                'tokens': {FIRST_PAGE: [None, 'T2'], 'T2': [None, None]},
+            }},
+            'playlistIds': {'PL2': ['z']},
+        }))
+        cache = PlaylistPageCache()
+        cache.restore(data['playlistPages'], data['playlistIds'])
+        self.assertEqual(cache.get_page('PL1', None)['nextPageToken'], 'T2')
+        self.assertEqual(len(cache.get_page('PL1', 'T2')['videos']), 2)
+        self.assertEqual(cache.video_ids('PL1'), {'a0', 'a1', 'b0', 'b1'})
+        self.assertEqual(cache.video_ids('PL2'), {'z'})
+
+    def test_late_journal_replay_keeps_pages_fetched_live(self):
+        journal = PlaylistPageCache()
+        journal.put_page('PL1', None, _page('old', 2, 'T2'))
+        journal.put_page('PL2', None, _page('b', 1))
+        journal.put_page('PL2', None, _page('c', 1))
+        records = journal.records()
+        records.insert(0, dict(records[-1], videos=_page('stale', 1)['videos']))
+        cache = PlaylistPageCache()
+        cache.put_page('PL1', None, _page('live', 3))
+        cache.load_records(records, replace=False)
+        self.assertEqual([v['videoId'] for v in cache.get_page('PL1', None)['videos']], ['live0', 'live1', 'live2'])
+        # Within the journal, the last record for a page still wins.
+        self.assertEqual([v['videoId'] for v in cache.get_page('PL2', None)['videos']], ['c0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import threading
+import unittest
+
+from src.playlist import Playlist
+
+
+def _item(vid):
+    return {'snippet': {'title': f't-{vid}', 'channelTitle': 'ch'}, 'contentDetails': {'videoId': vid}}
+
+
+class FakePlaylist(Playlist):
+    """Playlist whose API layer serves canned pages instead of the network."""
+
+    def __init__(self, pages, fail_on=None):
+        self.pages = pages
+        self.fail_on = fail_on
+        self.requested = []
+        self.lock = threading.Lock()
+        self.library = None
+
+    def _list(self, resource, **params):
+        index = int(params.get('pageToken') or 0)
+        with self.lock:
+            self.requested.append(index)
+        if index == self.fail_on:
+            raise RuntimeError('boom')
+        token = str(index + 1) if index + 1 < len(self.pages) else None
+        return {'items': [_item(v) for v in self.pages[index]], 'nextPageToken': token}
+
+    def _get_video_details(self, video_ids):
+        return {v: {'duration': '1:00', 'published': '2024', 'views': '7'} for v in video_ids}
+
+
+class PlaylistStreamTests(unittest.TestCase):
+    def test_streams_every_page_in_order(self):
+        pages = [[f'v{p}-{i}' for i in range(3)] for p in range(5)]
+        pl = FakePlaylist(pages)
+        vids = [v['videoId'] for v in pl.iter_playlist_videos('PL')]
+        self.assertEqual(vids, [v for page in pages for v in page])
+        self.assertEqual(pl.requested, [0, 1, 2, 3, 4])
+
+    def test_pages_are_enriched(self):
+        pl = FakePlaylist([['a']])
+        video = next(pl.iter_playlist_videos('PL'))
+        self.assertEqual((video['title'], video['duration'], video['views']), ('t-a', '1:00', '7'))
+
+    def test_error_surfaces_after_delivered_pages(self):
+        pl = FakePlaylist([['a'], ['b'], ['c']], fail_on=1)
+        stream = pl.iter_playlist_pages('PL')
+        self.assertEqual([v['videoId'] for v in next(stream)], ['a'])
+        with self.assertRaises(RuntimeError):
+            next(stream)
+
+    def test_closing_stops_the_producer(self):
+        pl = FakePlaylist([[str(i)] for i in range(100)])
+        stream = pl.iter_playlist_pages('PL', prefetch=2)
+        next(stream)
+        stream.close()
+        # Bounded look-ahead: only a few pages past the consumed one were fetched.
+        self.assertLess(len(pl.requested), 10)
+
+
+class BatchDetailsPlaylist(Playlist):
+    def __init__(self):
+        self.calls = []
+        self.library = None
+
+    def _list(self, resource, **params):
+        ids = params['id'].split(',')
+        self.calls.append((resource, len(ids)))
+        return {'items': [{'id': i, 'contentDetails': {'itemCount': int(i[1:])}} for i in ids if i != 'p7']}
+
+
+class PlaylistDetailsBatchTests(unittest.TestCase):
+    def test_counts_fetched_in_chunks_of_fifty(self):
+        pl = BatchDetailsPlaylist()
+        ids = [f'p{i}' for i in range(120)] + ['p3']
+        counts = pl.get_details_batch(ids)
+        self.assertEqual(pl.calls, [('playlists', 50), ('playlists', 50), ('playlists', 20)])
+        self.assertEqual(counts['p119'], 119)
+        self.assertNotIn('p7', counts)
+        self.assertEqual(pl.get_details('p5'), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
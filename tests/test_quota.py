@@ -0,0 +1,82 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from src.config_manager import ConfigManager
+from src.services.quota import QuotaMeter, cost_of
+
+
+class QuotaMeterTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'quota.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cost_table(self):
+        self.assertEqual(cost_of('search.list'), 100)
+        self.assertEqual(cost_of('videos.list'), 1)
+        self.assertEqual(cost_of('unknown.list'), 1)
+
+    def test_totals_per_key_and_persisted(self):
+        meter = QuotaMeter(self.path, daily_limit=1000)
+        meter.record('k1', 'search.list')
+        meter.record('k1', 'videos.list')
+        meter.record('k2', 'playlists.list')
+        meter.flush()
+        self.assertEqual(meter.used('k1'), 101)
+        self.assertEqual(meter.used('k2'), 1)
+        reloaded = QuotaMeter(self.path, daily_limit=1000)
+        self.assertEqual(reloaded.used('k1'), 101)
+        self.assertEqual(reloaded.remaining('k1'), 899)
+        with open(self.path, encoding='utf-8') as f:
+            self.assertNotIn('k1', f.read())
+
+    def test_low_budget(self):
+        meter = QuotaMeter(self.path, daily_limit=1000)
+        self.assertFalse(meter.is_low('k'))
+        for _ in range(9):
+            meter.record('k', 'search.list')
+        self.assertTrue(meter.is_low('k'))
+
+
+    def test_stale_flush_never_replaces_a_newer_snapshot(self):
+        meter = QuotaMeter(self.path, daily_limit=1000)
+        # Keep record() from flushing on its own while the writer lock is held.
+        meter._last_save = time.monotonic()
+        threads = []
+        with meter._io_lock:
+            # Both flushes take their snapshot, then wait for the writer lock
+            # and may acquire it in either order.
+            for n in (1, 2):
+                meter.record('k', 'videos.list')
+                t = threading.Thread(target=meter.flush)
+                t.start()
+                threads.append(t)
+                while meter._seq < n:
+                    time.sleep(0.001)
+        for t in threads:
+            t.join()
+        self.assertEqual(QuotaMeter(self.path, daily_limit=1000).used('k'), 2)
+
+    def test_save_json_is_safe_with_concurrent_writers(self):
+        results = []
+
+        def work(i):
+            for j in range(30):
+                results.append(ConfigManager.save_json(self.path, {'writer': i, 'n': j}))
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue(all(results))
+        self.assertIn('writer', ConfigManager.load_json(self.path))
+        self.assertEqual(os.listdir(self.tmp.name), ['quota.json'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import json
+import unittest
+
+from src.services.resilience import CircuitBreaker, CircuitOpenError, ResilientExecutor, RetryPolicy, is_transient
+
+
+class FakeResp:
+    def __init__(self, status):
+        self.status = status
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status, reason=''):
+        self.resp = FakeResp(status)
+        self.content = json.dumps({'error': {'errors': [{'reason': reason}]}}).encode()
+
+
+class ResilienceTests(unittest.TestCase):
+    def _executor(self, breaker=None, attempts=4):
+        self.sleeps = []
+        return ResilientExecutor(RetryPolicy(max_attempts=attempts, rng=lambda: 0.5), breaker or CircuitBreaker(), sleep=self.sleeps.append)
+
+    def test_transient_classification(self):
+        self.assertTrue(is_transient(FakeHttpError(503)))
+        self.assertTrue(is_transient(FakeHttpError(403, 'rateLimitExceeded')))
+        self.assertTrue(is_transient(TimeoutError('read timed out')))
+        self.assertFalse(is_transient(FakeHttpError(403, 'quotaExceeded')))
+        self.assertFalse(is_transient(FakeHttpError(404)))
+
+    def test_retries_transient_then_succeeds(self):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise FakeHttpError(500)
+            return 'ok'
+        self.assertEqual(self._executor().call(flaky), 'ok')
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_non_transient_is_not_retried(self):
+        calls = []
+
+        def missing():
+            calls.append(1)
+            raise FakeHttpError(404)
+        with self.assertRaises(FakeHttpError):
+            self._executor().call(missing)
+        self.assertEqual(len(calls), 1)
+
+    def test_breaker_opens_and_half_opens(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+        ex = self._executor(breaker, attempts=1)
+
+        def down():
+            raise FakeHttpError(503)
+        for _ in range(2):
+            with self.assertRaises(FakeHttpError):
+                ex.call(down)
+        self.assertEqual(breaker.state, 'open')
+        with self.assertRaises(CircuitOpenError):
+            ex.call(lambda: 'never')
+        now[0] = 11.0
+        self.assertEqual(breaker.state, 'half-open')
+        self.assertEqual(ex.call(lambda: 'up'), 'up')
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(base_delay=0.5, max_delay=8.0)
+        delay = policy.base_delay
+        for _ in range(50):
+            delay = policy.next_delay(delay)
+            self.assertGreaterEqual(delay, 0.5)
+            self.assertLessEqual(delay, 8.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from src.services.playlist_page_cache import PlaylistPageCache
+from src.services.session_store import SessionWriter, read_journal, write_atomic
+
+
+class SessionWriterTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.doc = os.path.join(self.tmp.name, 'last_videos_search.json')
+        self.journal = os.path.join(self.tmp.name, 'playlist_pages.jsonl')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_keeps_only_latest_document(self):
+        w = SessionWriter(delay=60, max_delay=60)
+        w.save(self.doc, {'query': 'a'})
+        w.save(self.doc, {'query': 'b'})
+        self.assertFalse(os.path.exists(self.doc))
+        w.flush()
+        with open(self.doc, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'query': 'b'})
+        self.assertEqual(w.writes, 1)
+        self.assertEqual(os.listdir(self.tmp.name), ['last_videos_search.json'])
+
+    def test_background_flush_after_debounce(self):
+        w = SessionWriter(delay=0.01, max_delay=0.05)
+        w.save(self.doc, {'query': 'x'})
+        deadline = time.time() + 2
+        while not os.path.exists(self.doc) and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(os.path.exists(self.doc))
+
+    def test_journal_appends_and_rewrite_drops_earlier_appends(self):
+        w = SessionWriter(delay=60, max_delay=60)
+        w.append(self.journal, {'n': 1})
+        w.flush()
+        w.append(self.journal, {'n': 2})
+        w.flush()
+        self.assertEqual(read_journal(self.journal), [{'n': 1}, {'n': 2}])
+        w.append(self.journal, {'n': 3})
+        w.rewrite(self.journal, [{'n': 9}])
+        w.append(self.journal, {'n': 10})
+        w.flush()
+        self.assertEqual(read_journal(self.journal), [{'n': 9}, {'n': 10}])
+
+    def test_torn_last_line_is_skipped(self):
+        write_atomic(self.journal, '{"n": 1}\n{"n": 2')
+        self.assertEqual(read_journal(self.journal), [{'n': 1}])
+
+    def test_page_cache_replays_journal_records(self):
+        cache = PlaylistPageCache()
+        cache.put_page('PL1', None, {'videos': [{'videoId': 'a'}], 'nextPageToken': 'T2'})
+        cache.put_page('PL1', 'T2', {'videos': [{'videoId': 'b'}]})
+        w = SessionWriter(delay=60, max_delay=60)
+        w.rewrite(self.journal, cache.records())
+        w.flush()
+        other = PlaylistPageCache()
+        other.load_records(read_journal(self.journal))
+        self.assertEqual(other.get_page('PL1', None)['nextPageToken'], 'T2')
+        self.assertEqual(other.video_ids('PL1'), {'a', 'b'})
+
+
+if __name__ == '__main__':
+    unittest.main()
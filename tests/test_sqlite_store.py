@@ -0,0 +1,165 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+
+from src.data.sqlite_store import SqliteStore
+
+
+class SqliteStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SqliteStore(os.path.join(self.tmp.name, 'app.sqlite3'))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_connection_uses_wal(self):
+        mode = self.store.conn.execute('PRAGMA journal_mode').fetchone()[0]
+        self.assertEqual(mode.lower(), 'wal')
+
+    def test_save_last_videos_result_roundtrip(self):
+        videos = [{'videoId': f'v{i}', 'title': f'T{i}', 'views': str(i)} for i in range(200)]
+        playlists = [{'playlistId': 'p1', 'title': 'P', 'video_count': '3'}]
+        self.store.save_last_videos_result('q', videos, playlists, 'n', None, [])
+        data = self.store.load_last_videos_result()
+        self.assertEqual(len(data['videos']), 200)
+        self.assertEqual(data['videos'][5]['views'], 5)
+        self.assertEqual(data['playlists'][0]['video_count'], 3)
+        self.assertEqual(data['nextPageToken'], 'n')
+
+    def test_failed_transaction_rolls_back(self):
+        with self.assertRaises(RuntimeError):
+            with self.store._transaction() as cur:
+                cur.execute("INSERT INTO videos (video_id) VALUES ('x')")
+                raise RuntimeError('boom')
+        self.assertIsNone(self.store.conn.execute("SELECT 1 FROM videos WHERE video_id='x'").fetchone())
+
+    def test_concurrent_writers_from_threads(self):
+        errors = []
+
+        def _write(n):
+            try:
+                for j in range(20):
+                    self.store.add_playlist_memberships([(f'p{n}', f'v{j}')])
+                    self.store.upsert_videos([{'videoId': f'v{n}-{j}'}])
+            except Exception as e:
+                errors.append(e)
+            finally:
+                self.store.close()
+
+        threads = [threading.Thread(target=_write, args=(n,)) for n in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        count = self.store.conn.execute('SELECT COUNT(*) FROM playlist_videos').fetchone()[0]
+        self.assertEqual(count, 120)
+        self.assertTrue(self.store.has_playlist_video('p3', 'v7'))
+
+    def test_memberships_record_when_they_were_fetched(self):
+        self.store.link_video_to_playlist('pl', 'v1', 0)
+        self.store.conn.execute("UPDATE playlist_videos SET fetched_at=NULL WHERE video_id='v1'")
+        self.assertEqual(self.store.playlist_video_fetched_at('pl', 'v1'), 0.0)
+        before = time.time()
+        self.store.add_playlist_memberships([('pl', 'v1'), ('pl', 'v2')])
+        self.assertGreaterEqual(self.store.playlist_video_fetched_at('pl', 'v1'), before)
+        self.assertGreaterEqual(self.store.playlist_video_fetched_at('pl', 'v2'), before)
+        self.assertIsNone(self.store.playlist_video_fetched_at('pl', 'v3'))
+        # The refresh keeps the known position.
+        row = self.store.conn.execute("SELECT position FROM playlist_videos WHERE video_id='v1'").fetchone()
+        self.assertEqual(row[0], 0)
+
+    def test_old_playlist_videos_table_gains_fetched_at(self):
+        path = os.path.join(self.tmp.name, 'old.sqlite3')
+        conn = sqlite3.connect(path)
+        conn.execute('CREATE TABLE playlist_videos (playlist_id TEXT, video_id TEXT, position INTEGER, PRIMARY KEY (playlist_id, video_id))')
+        conn.execute("INSERT INTO playlist_videos VALUES ('pl', 'v1', 3)")
+        conn.commit()
+        conn.close()
+        store = SqliteStore(path)
+        try:
+            self.assertEqual(store.playlist_video_fetched_at('pl', 'v1'), 0.0)
+        finally:
+            store.close()
+
+    def _seed_playlist(self):
+        videos = [{'videoId': f'v{i:03d}', 'title': f'T{i}'} for i in range(25)]
+        self.store.upsert_videos(videos)
+        for i in range(22):
+            self.store.link_video_to_playlist('pl', f'v{i:03d}', i // 2)
+        self.store.add_playlist_memberships([('pl', 'v024'), ('pl', 'v023'), ('pl', 'v022')])
+        # NULL positions sort first, then (position, videoId).
+        return ['v022', 'v023', 'v024'] + [f'v{i:03d}' for i in range(22)]
+
+    def test_keyset_pages_walk_forward_and_back(self):
+        expected = self._seed_playlist()
+        pages, token = [], None
+        while True:
+            page = self.store.get_playlist_videos_page('pl', 4, token)
+            pages.append([v['videoId'] for v in page['videos']])
+            token = page['nextPageToken']
+            if not token:
+                break
+        self.assertEqual([v for p in pages for v in p], expected)
+        self.assertTrue(all(len(p) == 4 for p in pages[:-1]))
+        back = []
+        token = page['prevPageToken']
+        while token:
+            page = self.store.get_playlist_videos_page('pl', 4, token)
+            back.insert(0, [v['videoId'] for v in page['videos']])
+            token = page['prevPageToken']
+        self.assertEqual([v for p in back for v in p], expected[:-len(pages[-1])])
+
+    def test_after_position_and_bad_token(self):
+        self._seed_playlist()
+        rows = self.store.get_playlist_videos('pl', 3, after_position=8)
+        self.assertEqual([v['videoId'] for v in rows], ['v018', 'v019', 'v020'])
+        first = self.store.get_playlist_videos_page('pl', 2, 'not-a-cursor')
+        self.assertEqual([v['videoId'] for v in first['videos']], ['v022', 'v023'])
+
+    def test_page_query_uses_index_order(self):
+        sql = self.store._PLAYLIST_VIDEOS_SELECT + ' AND (pv.position, pv.video_id) > (?, ?)' + self.store._ORDER_ASC + ' LIMIT ?'
+        plan = ' '.join(str(r) for r in self.store.conn.execute('EXPLAIN QUERY PLAN ' + sql, ('pl', 1, 'x', 5)).fetchall())
+        self.assertIn('idx_playlist_videos_order', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+        names = {r[0] for r in self.store.conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        self.assertNotIn('idx_playlist_videos_playlist', names)
+
+    def test_search_query_builder(self):
+        self.assertEqual(SqliteStore.build_search_query('lin alg'), '"lin"* "alg"*')
+        self.assertEqual(SqliteStore.build_search_query('"linear algebra" mit'), '"linear algebra" "mit"*')
+        self.assertEqual(SqliteStore.build_search_query('  '), '')
+
+    def test_search_local_ranks_titles_and_follows_upserts(self):
+        self.store.upsert_videos([
+            {'videoId': 'a', 'title': 'Lecture 1: Linear Algebra', 'channelTitle': 'MIT'},
+            {'videoId': 'b', 'title': 'Cooking pasta', 'channelTitle': 'Algebra Fans'},
+        ])
+        self.store.merge_playlists([{'playlistId': 'p', 'title': 'Linear algebra course', 'channelTitle': 'MIT'}])
+        hits = self.store.search_local('algebra')
+        self.assertEqual({(h['kind'], h.get('videoId') or h.get('playlistId')) for h in hits}, {('video', 'a'), ('video', 'b'), ('playlist', 'p')})
+        self.assertEqual(hits[-1]['videoId'], 'b')
+        self.assertEqual([h['playlistId'] for h in self.store.search_local('"linear algebra" cour')], ['p'])
+        self.store.upsert_video({'videoId': 'a', 'title': 'Lecture 1: Calculus', 'channelTitle': 'MIT'})
+        self.assertEqual([h.get('videoId') for h in self.store.search_local('lin', kinds=('video',))], [])
+        self.assertEqual([h['videoId'] for h in self.store.search_local('calc')], ['a'])
+
+    def test_search_index_covers_rows_stored_before_it(self):
+        path = os.path.join(self.tmp.name, 'old.sqlite3')
+        with sqlite3.connect(path) as conn:
+            conn.execute('CREATE TABLE videos (video_id TEXT PRIMARY KEY, title TEXT, channel_title TEXT, duration TEXT, published TEXT, views INTEGER)')
+            conn.execute("INSERT INTO videos (video_id, title) VALUES ('old', 'Quantum mechanics')")
+        store = SqliteStore(path)
+        try:
+            self.assertEqual([h['videoId'] for h in store.search_local('quant')], ['old'])
+        finally:
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
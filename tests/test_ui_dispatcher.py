@@ -0,0 +1,70 @@
+import threading
+import unittest
+
+from src.ui.ui_dispatcher import UiDispatcher
+
+
+class UiDispatcherTests(unittest.TestCase):
+    def test_post_runs_in_order(self):
+        ui = UiDispatcher()
+        seen = []
+        for i in range(5):
+            ui.post(lambda i=i: seen.append(i))
+        self.assertEqual(ui.drain(budget=10), 5)
+        self.assertEqual(seen, [0, 1, 2, 3, 4])
+
+    def test_latest_coalesces_in_place(self):
+        ui = UiDispatcher()
+        seen = []
+        ui.post(lambda: seen.append('start'))
+        for i in range(100):
+            ui.post_latest('progress', lambda i=i: seen.append(i))
+        ui.post(lambda: seen.append('finish'))
+        ui.drain(budget=10)
+        self.assertEqual(seen, ['start', 99, 'finish'])
+        ui.post_latest('progress', lambda: seen.append('next'))
+        ui.drain(budget=10)
+        self.assertEqual(seen[-1], 'next')
+
+    def test_batch_applies_items_once(self):
+        ui = UiDispatcher()
+        batches = []
+        for i in range(10):
+            ui.post_batch('rows', i, batches.append)
+        self.assertEqual(ui.pending(), 1)
+        ui.drain(budget=10)
+        self.assertEqual(batches, [list(range(10))])
+
+    def test_budget_leaves_remaining_work_queued(self):
+        now = [0.0]
+        ui = UiDispatcher(budget_ms=10, clock=lambda: now[0])
+
+        def slow():
+            now[0] += 0.006
+        for _ in range(5):
+            ui.post(slow)
+        self.assertEqual(ui.drain(), 2)
+        self.assertEqual(ui.pending(), 3)
+
+    def test_errors_do_not_stop_the_drain(self):
+        ui = UiDispatcher()
+        seen = []
+        ui.post(lambda: 1 / 0)
+        ui.post(lambda: seen.append('ok'))
+        ui.drain(budget=10)
+        self.assertEqual(seen, ['ok'])
+
+    def test_posts_from_threads(self):
+        ui = UiDispatcher()
+        batches = []
+        threads = [threading.Thread(target=lambda n=n: [ui.post_batch('rows', (n, i), batches.append) for i in range(200)]) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        ui.drain(budget=10)
+        self.assertEqual(sum(len(b) for b in batches), 800)
+
+
+if __name__ == '__main__':
+    unittest.main()
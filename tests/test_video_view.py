@@ -0,0 +1,54 @@
+import unittest
+
+from src.ui.video_view import VideoView
+
+
+def _videos(*ids):
+    return [{'videoId': i, 'title': i.upper()} for i in ids]
+
+
+class VideoViewTests(unittest.TestCase):
+    def test_lookup_by_id_and_row(self):
+        view = VideoView()
+        videos = _videos('a', 'b', 'c')
+        view.set_source(videos)
+        view.show(videos)
+        self.assertIs(view.video('b'), videos[1])
+        self.assertEqual(view.row_of('c'), 2)
+        self.assertIs(view.video_at(0), videos[0])
+        self.assertIsNone(view.video_at(3))
+        self.assertIsNone(view.video_at(-1))
+        self.assertFalse(view.is_filtered())
+
+    def test_rows_follow_sort_and_filter(self):
+        view = VideoView()
+        videos = _videos('a', 'b', 'c', 'd')
+        view.set_source(videos)
+        view.show(list(reversed(videos)))
+        self.assertEqual(view.row_of('a'), 3)
+        view.show([videos[1], videos[3]])
+        self.assertTrue(view.is_filtered())
+        self.assertEqual(view.rows_of('d'), [1])
+        self.assertEqual(view.rows_of('a'), [])
+        # Hidden videos are still reachable for bookkeeping.
+        self.assertIs(view.video('a'), videos[0])
+
+    def test_source_mutations_share_dicts(self):
+        view = VideoView()
+        videos = _videos('a', 'b')
+        view.set_source(videos)
+        view.show(videos)
+        view.video('b')['playlistIndex'] = 4
+        self.assertEqual(view.video_at(1)['playlistIndex'], 4)
+
+    def test_duplicate_ids_map_to_every_row(self):
+        view = VideoView()
+        videos = _videos('a', 'b', 'a')
+        view.set_source(videos)
+        view.show(videos)
+        self.assertEqual(view.rows_of('a'), [0, 2])
+        self.assertIs(view.video('a'), videos[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from src.ui.virtual_rows import VirtualRows
+
+
+def _rows(n):
+    return [((f'title {i}', i), ()) for i in range(n)]
+
+
+class VirtualRowsTests(unittest.TestCase):
+    def test_window_is_clamped_to_capacity_and_data(self):
+        model = VirtualRows(capacity=10)
+        model.set_rows(_rows(5000))
+        self.assertEqual(model.window(), (0, 10))
+        model.moveto(1.0)
+        self.assertEqual(model.window(), (4990, 5000))
+        model.set_rows(_rows(3))
+        self.assertEqual(model.window(), (0, 3))
+
+    def test_scrolling_and_fractions(self):
+        model = VirtualRows(capacity=10)
+        model.set_rows(_rows(100))
+        self.assertTrue(model.scroll(25))
+        self.assertEqual(model.fractions(), (0.25, 0.35))
+        self.assertTrue(model.scroll_pages(1))
+        self.assertEqual(model.offset, 34)
+        self.assertTrue(model.scroll(-1000))
+        self.assertEqual(model.offset, 0)
+        self.assertFalse(model.scroll(-1))
+
+    def test_update_reports_visibility(self):
+        model = VirtualRows(capacity=10)
+        model.set_rows(_rows(50))
+        self.assertTrue(model.update(3, values=('x', 3), tags=('search_hit',)))
+        self.assertEqual(model.rows[3], (('x', 3), ('search_hit',)))
+        self.assertFalse(model.update(40, tags=('pl_match',)))
+        self.assertEqual(model.rows[40], (('title 40', 40), ('pl_match',)))
+        self.assertFalse(model.update(99, values=('nope',)))
+
+    def test_ensure_visible_and_position(self):
+        model = VirtualRows(capacity=10)
+        model.set_rows(_rows(100))
+        self.assertTrue(model.ensure_visible(42))
+        self.assertEqual(model.window(), (33, 43))
+        self.assertEqual(model.position_of(42), 9)
+        self.assertIsNone(model.position_of(5))
+        model.set_capacity(20)
+        self.assertEqual(model.window(), (33, 53))
+
+
+if __name__ == '__main__':
+    unittest.main()